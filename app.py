@@ -0,0 +1,81 @@
+"""
+本番用の起動スクリプト（起動時のウォームアップと準備完了の通知）
+
+dashboard.py を st.App（ASGI）として配信する。サーバーの起動時に、全ページを
+バックグラウンドで1回ずつ実行して（seseragism/warmup.py）、データの読み込み・集計・
+チャート・HTML フラグメントのキャッシュを温めておく。
+
+ロードバランサーの準備完了チェックには GET /ready を使う。温まるまでは 503、
+温まったら 200 を返す（本文は状態の JSON）。ファイルで通知したいときは環境変数
+SESERAGISM_READY_FILE にパスを指定する。/_stcore/health（生存確認）は起動直後から 200。
+
+使い方:
+    streamlit run app.py
+    uvicorn app:app --host 0.0.0.0 --port 8501
+    python app.py
+"""
+
+from __future__ import annotations
+
+import ast
+import logging
+import types
+from collections.abc import Callable
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+import streamlit as st
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from seseragism import warmup
+
+SCRIPT = Path(__file__).resolve().parent / "dashboard.py"
+
+
+class _WarmupThreadFilter(logging.Filter):
+    """ウォームアップのスレッドからの「ScriptRunContext が無い」警告を出さない（想定どおりなので）。"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return not record.threadName.startswith(warmup.THREAD_NAME)
+
+
+logging.getLogger("streamlit.runtime.scriptrunner_utils.script_run_context").addFilter(_WarmupThreadFilter())
+
+
+def page_tasks() -> dict[str, Callable[[], object]]:
+    """dashboard.py を Streamlit と同じく __main__ として読み込み、ページ関数を返す。
+
+    st.cache_resource のキーには関数のモジュール名が含まれるので、import dashboard
+    （モジュール名 dashboard）で呼んでも、閲覧時（__main__）のキャッシュは温まらない。
+    末尾の `if __name__ == "__main__": main()` は除いて、定義だけを実行する。
+    """
+    tree = ast.parse(SCRIPT.read_text(encoding="utf-8"), str(SCRIPT))
+    tree.body = [
+        node for node in tree.body
+        if not (isinstance(node, ast.If) and ast.unparse(node.test) == "__name__ == '__main__'")
+    ]
+    module = types.ModuleType("__main__")
+    module.__file__ = str(SCRIPT)
+    exec(compile(tree, str(SCRIPT), "exec"), module.__dict__)
+    # スクリプトの外（ScriptRunContext なし）で呼ぶので、画面への出力は捨てられ、
+    # ウィジェットは既定の値を返す
+    return {f"page:{page.__name__}": page for page, _, _ in module.PAGES}
+
+
+@asynccontextmanager
+async def lifespan(_app: st.App):
+    warmup.WARMUP.start(page_tasks)
+    yield
+
+
+async def ready(_request: Request) -> JSONResponse:
+    status = warmup.WARMUP.status()
+    return JSONResponse(status, status_code=200 if status["ready"] else 503, headers={"Cache-Control": "no-cache"})
+
+
+app = st.App(SCRIPT, lifespan=lifespan, routes=[Route("/ready", ready, methods=["GET", "HEAD"])])
+
+if __name__ == "__main__":
+    app.run()
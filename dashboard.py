@@ -4,493 +4,146 @@
 
 このダッシュボードは、三島商工会議所の80周年ビジョン提案書を
 インタラクティブに可視化するStreamlitアプリケーションです。
-"""
-
-import streamlit as st
-import plotly.express as px
-import plotly.graph_objects as go
-import pandas as pd
-import numpy as np
-
-# ============================================================
-# ページ設定
-# ============================================================
-st.set_page_config(
-    page_title="三島商工会議所 80周年ビジョン | セセラギズム",
-    page_icon="💧",
-    layout="wide",
-    initial_sidebar_state="expanded",
-)
 
+本番では app.py から起動する（起動時に全ページのキャッシュを温め、GET /ready で
+準備完了を知らせる）。`streamlit run dashboard.py` はウォームアップなしで起動するので、
+開発時や、冷えた状態を測るベンチマーク（tools/benchmark_suite.py）向け。
 
-# ============================================================
-# カスタムCSS
-# ============================================================
-def inject_custom_css() -> None:
-    """水をモチーフにしたブルー・ティール系のカスタムCSSを注入する。"""
-    st.markdown(
-        """
-        <style>
-        /* ---------- 全体フォント・背景 ---------- */
-        @import url('https://fonts.googleapis.com/css2?family=Noto+Sans+JP:wght@300;400;500;700;900&display=swap');
-
-        html, body, [class*="css"] {
-            font-family: 'Noto Sans JP', sans-serif;
-        }
-
-        .main .block-container {
-            padding-top: 1.5rem;
-            padding-bottom: 2rem;
-            max-width: 1200px;
-        }
-
-        /* ---------- サイドバー ---------- */
-        section[data-testid="stSidebar"] {
-            background: linear-gradient(180deg, #0a2540 0%, #0d3b66 40%, #1a6b8a 100%);
-            color: #ffffff;
-        }
-        section[data-testid="stSidebar"] * {
-            color: #ffffff !important;
-        }
-        section[data-testid="stSidebar"] .stRadio label,
-        section[data-testid="stSidebar"] .stRadio label span,
-        section[data-testid="stSidebar"] .stRadio label p,
-        section[data-testid="stSidebar"] .stRadio div[role="radiogroup"] label {
-            color: #ffffff !important;
-            font-size: 1.05rem;
-        }
-        section[data-testid="stSidebar"] hr {
-            border-color: rgba(255,255,255,0.25);
-        }
+    streamlit run app.py
+"""
 
-        /* ---------- ヒーローセクション ---------- */
-        .hero-section {
-            background: linear-gradient(135deg, #0a2540 0%, #1a6b8a 50%, #48b4a0 100%);
-            border-radius: 16px;
-            padding: 2.5rem 3rem;
-            margin-bottom: 2rem;
-            color: #ffffff;
-            position: relative;
-            overflow: hidden;
-        }
-        .hero-section::before {
-            content: '';
-            position: absolute;
-            top: -50%;
-            right: -20%;
-            width: 400px;
-            height: 400px;
-            background: radial-gradient(circle, rgba(255,255,255,0.08) 0%, transparent 70%);
-            border-radius: 50%;
-        }
-        .hero-section h1 {
-            font-size: 2.2rem;
-            font-weight: 900;
-            margin-bottom: 0.4rem;
-            color: #ffffff !important;
-            letter-spacing: 0.04em;
-        }
-        .hero-section p {
-            font-size: 1.1rem;
-            opacity: 0.92;
-            line-height: 1.7;
-            color: #e0f7fa !important;
-        }
-        .hero-subtitle {
-            font-size: 0.95rem;
-            opacity: 0.78;
-            margin-top: 0.2rem;
-            color: #b2ebf2 !important;
-        }
+from __future__ import annotations
 
-        /* ---------- メトリックカード ---------- */
-        .metric-card {
-            background: #ffffff;
-            border-radius: 14px;
-            padding: 1.6rem 1.4rem;
-            box-shadow: 0 2px 12px rgba(10,37,64,0.08);
-            border-left: 5px solid #1a6b8a;
-            margin-bottom: 1rem;
-            transition: transform 0.18s, box-shadow 0.18s;
-        }
-        .metric-card:hover {
-            transform: translateY(-3px);
-            box-shadow: 0 6px 20px rgba(10,37,64,0.13);
-        }
-        .metric-card .metric-label {
-            font-size: 0.85rem;
-            color: #607d8b;
-            margin-bottom: 0.25rem;
-            font-weight: 500;
-        }
-        .metric-card .metric-value {
-            font-size: 1.7rem;
-            font-weight: 900;
-            color: #0a2540;
-        }
-        .metric-card .metric-desc {
-            font-size: 0.82rem;
-            color: #78909c;
-            margin-top: 0.35rem;
-            line-height: 1.55;
-        }
+import functools
+import hashlib
+import logging
+import textwrap
+from collections.abc import Callable
+from pathlib import Path
+from typing import TYPE_CHECKING
 
-        /* ---------- タイムラインカード ---------- */
-        .timeline-card {
-            background: #ffffff;
-            border-radius: 14px;
-            padding: 1.8rem 1.5rem 1.4rem 1.5rem;
-            box-shadow: 0 2px 12px rgba(10,37,64,0.07);
-            text-align: center;
-            position: relative;
-            min-height: 280px;
-            transition: transform 0.18s, box-shadow 0.18s;
-        }
-        .timeline-card:hover {
-            transform: translateY(-4px);
-            box-shadow: 0 8px 24px rgba(10,37,64,0.12);
-        }
-        .timeline-card.active {
-            border: 3px solid #1a6b8a;
-            background: linear-gradient(180deg, #e0f7fa 0%, #ffffff 40%);
-        }
-        .timeline-year {
-            display: inline-block;
-            background: linear-gradient(135deg, #0d3b66, #1a6b8a);
-            color: #fff;
-            font-size: 0.85rem;
-            font-weight: 700;
-            padding: 0.3rem 1rem;
-            border-radius: 20px;
-            margin-bottom: 0.8rem;
-        }
-        .timeline-year.current {
-            background: linear-gradient(135deg, #00897b, #26c6da);
-            font-size: 0.95rem;
-            padding: 0.35rem 1.2rem;
-        }
-        .timeline-theme {
-            font-size: 1.5rem;
-            font-weight: 900;
-            color: #0a2540;
-            margin: 0.6rem 0 0.25rem 0;
-        }
-        .timeline-stage {
-            font-size: 0.85rem;
-            color: #1a6b8a;
-            font-weight: 600;
-            margin-bottom: 0.7rem;
-        }
-        .timeline-desc {
-            font-size: 0.82rem;
-            color: #546e7a;
-            line-height: 1.65;
-        }
+import streamlit as st
 
-        /* ---------- コンセプトカード ---------- */
-        .concept-card {
-            background: #ffffff;
-            border-radius: 14px;
-            padding: 1.4rem;
-            box-shadow: 0 2px 10px rgba(10,37,64,0.06);
-            margin-bottom: 0.8rem;
-            border-left: 4px solid #26c6da;
-            transition: transform 0.15s;
-        }
-        .concept-card:hover {
-            transform: translateX(4px);
-        }
-        .concept-card .concept-icon {
-            font-size: 1.5rem;
-            margin-bottom: 0.3rem;
-        }
-        .concept-card .concept-title {
-            font-weight: 700;
-            color: #0a2540;
-            font-size: 1rem;
-            margin-bottom: 0.25rem;
-        }
-        .concept-card .concept-text {
-            font-size: 0.85rem;
-            color: #607d8b;
-            line-height: 1.6;
-        }
+from seseragism import charts, cohort, cooccurrence, data, keywords, metrics, projection, survey, timeseries, timing
 
-        /* ---------- フィロソフィーカード ---------- */
-        .philosophy-card {
-            background: linear-gradient(135deg, #e0f7fa 0%, #b2ebf2 100%);
-            border-radius: 14px;
-            padding: 1.6rem 1.4rem;
-            text-align: center;
-            margin-bottom: 0.8rem;
-            border: 1px solid #80deea;
-            transition: transform 0.18s, box-shadow 0.18s;
-        }
-        .philosophy-card:hover {
-            transform: scale(1.02);
-            box-shadow: 0 4px 16px rgba(26,107,138,0.15);
-        }
-        .philosophy-card .philosophy-title {
-            font-size: 1.2rem;
-            font-weight: 900;
-            color: #0a2540;
-        }
-        .philosophy-card .philosophy-desc {
-            font-size: 0.82rem;
-            color: #37474f;
-            margin-top: 0.4rem;
-            line-height: 1.55;
-        }
+# pandas と Plotly の図オブジェクトは重いので、使うページ（関数）の中で読み込む。
+# チャートのないページや起動直後には読み込まれない。
+if TYPE_CHECKING:
+    import pandas as pd
+    import plotly.graph_objects as go
 
-        /* ---------- サブコピーカード ---------- */
-        .subcopy-card {
-            background: #0a2540;
-            border-radius: 12px;
-            padding: 1.4rem;
-            text-align: center;
-            margin-bottom: 0.6rem;
-            transition: transform 0.15s;
-        }
-        .subcopy-card:hover {
-            transform: scale(1.03);
-        }
-        .subcopy-card p {
-            color: #e0f7fa !important;
-            font-size: 1.1rem;
-            font-weight: 700;
-            margin: 0;
-            letter-spacing: 0.06em;
-        }
+_LOGGER = logging.getLogger(__name__)
 
-        /* ---------- ナラティブ引用 ---------- */
-        .narrative-box {
-            background: linear-gradient(135deg, #0d3b66 0%, #1a6b8a 100%);
-            border-radius: 14px;
-            padding: 2rem 2.5rem;
-            color: #ffffff;
-            margin: 1.5rem 0;
-            position: relative;
-        }
-        .narrative-box::before {
-            content: '\u201C';
-            font-size: 4rem;
-            position: absolute;
-            top: 0.2rem;
-            left: 1rem;
-            opacity: 0.2;
-            font-family: serif;
-            color: #80deea;
-        }
-        .narrative-box p {
-            font-size: 1.05rem;
-            line-height: 1.85;
-            color: #e0f7fa !important;
-        }
-        .narrative-box .narrative-emphasis {
-            font-size: 1.25rem;
-            font-weight: 900;
-            color: #80deea !important;
-            display: block;
-            margin-top: 0.8rem;
-        }
+# ============================================================
+# カスタムCSS
+# ============================================================
+STATIC_DIR = Path(__file__).parent / "static"
 
-        /* ---------- 統計ハイライトカード ---------- */
-        .stat-highlight {
-            background: linear-gradient(135deg, #e0f7fa 0%, #ffffff 100%);
-            border-radius: 14px;
-            padding: 1.5rem;
-            text-align: center;
-            border: 1px solid #b2ebf2;
-        }
-        .stat-highlight .stat-number {
-            font-size: 2.5rem;
-            font-weight: 900;
-            color: #0d3b66;
-        }
-        .stat-highlight .stat-label {
-            font-size: 0.9rem;
-            color: #607d8b;
-            margin-top: 0.3rem;
-        }
+# 読み込む順に並べる。フォントの @font-face は tools/build_font_subset.py が
+# 生成したときだけ存在し、無ければ CSS 側のフォールバック（端末の和文フォント）になる。
+STYLESHEETS = ["fonts/noto-sans-jp.css", "seseragism.css"]
 
-        /* ---------- 文化資産バッジ ---------- */
-        .asset-badge {
-            display: inline-block;
-            background: linear-gradient(135deg, #e0f7fa, #b2ebf2);
-            border: 1px solid #80deea;
-            border-radius: 24px;
-            padding: 0.5rem 1.2rem;
-            margin: 0.3rem;
-            font-size: 0.9rem;
-            font-weight: 600;
-            color: #0a2540;
-        }
 
-        /* ---------- セクション区切り ---------- */
-        .section-divider {
-            border: none;
-            height: 2px;
-            background: linear-gradient(90deg, transparent 0%, #80deea 50%, transparent 100%);
-            margin: 2rem 0;
-        }
-        .section-divider-wave {
-            position: relative;
-            width: 100%;
-            height: 32px;
-            margin: 1.5rem 0;
-            overflow: hidden;
-            opacity: 0.5;
-        }
-        .section-divider-wave svg {
-            width: 200%;
-            height: 100%;
-            animation: wave-drift-slow 18s linear infinite;
-        }
+@st.cache_resource(show_spinner=False)
+def _stylesheet_version(name: str, mtime_ns: int) -> str:
+    """スタイルシートの内容ハッシュ（キャッシュ破棄用のバージョン）を返す。"""
+    return hashlib.sha256((STATIC_DIR / name).read_bytes()).hexdigest()[:12]
 
-        /* ---------- チーム分析カード ---------- */
-        .team-card {
-            background: #ffffff;
-            border-radius: 10px;
-            padding: 1rem 1.2rem;
-            box-shadow: 0 1px 6px rgba(10,37,64,0.06);
-            margin-bottom: 0.5rem;
-            border-top: 3px solid #26c6da;
-        }
-        .team-card .team-name {
-            font-weight: 700;
-            color: #0d3b66;
-            font-size: 0.9rem;
-        }
-        .team-card .team-keywords {
-            font-size: 0.82rem;
-            color: #607d8b;
-            margin-top: 0.2rem;
-        }
 
-        /* ---------- Plotlyチャート余白調整 ---------- */
-        .stPlotlyChart {
-            margin-bottom: 1rem;
-        }
+def inject_custom_css() -> None:
+    """水をモチーフにしたブルー・ティール系のカスタムCSSを読み込む。
+
+    CSS本体は static/ 以下のファイルとして Streamlit の静的ファイル配信
+    （.streamlit/config.toml の enableStaticServing）から配信し、ここでは
+    内容ハッシュ付きの <link> だけを送る。ブラウザはCSSを一度だけ取得して
+    キャッシュし、CSSを変更するとハッシュが変わって再取得される。
+    フォントも自前で配信し、外部（Google Fonts）へは取りに行かない。
+    """
+    links = []
+    for name in STYLESHEETS:
+        path = STATIC_DIR / name
+        if not path.is_file():
+            continue
+        version = _stylesheet_version(name, path.stat().st_mtime_ns)
+        links.append(f'<link rel="stylesheet" href="app/static/{name}?v={version}">')
+    st.markdown("".join(links), unsafe_allow_html=True)
 
-        /* ---------- 引用ブロック ---------- */
-        .quote-block {
-            background: #f5fbfe;
-            border-left: 4px solid #26c6da;
-            border-radius: 0 10px 10px 0;
-            padding: 1.2rem 1.5rem;
-            margin: 1rem 0;
-            font-style: italic;
-            color: #37474f;
-        }
 
-        /* ---------- Expander カスタマイズ ---------- */
-        .streamlit-expanderHeader {
-            font-weight: 600;
-            color: #0d3b66;
-        }
+# ============================================================
+# ページ組み立てバッファ
+# ============================================================
+class PageBuffer:
+    """連続する静的な Markdown / HTML をためて、1つの st.markdown にまとめて送る。
 
-        /* ---------- 波アニメーション ---------- */
-        @keyframes wave-drift {
-            0%   { transform: translateX(0); }
-            100% { transform: translateX(-50%); }
-        }
-        @keyframes wave-drift-slow {
-            0%   { transform: translateX(0); }
-            100% { transform: translateX(-50%); }
-        }
+    st.markdown を呼ぶたびに WebSocket のメッセージが1通増えるため、
+    チャートや expander の直前（と、ページの最後）でだけ flush する。
+    """
 
-        /* ヒーロー波 */
-        .hero-section {
-            padding-bottom: 4rem !important;
-        }
-        .hero-waves {
-            position: absolute;
-            bottom: 0;
-            left: 0;
-            width: 100%;
-            height: 60px;
-            overflow: hidden;
-        }
-        .hero-waves svg {
-            position: absolute;
-            bottom: 0;
-            left: 0;
-            width: 200%;
-            height: 100%;
-        }
-        .hero-waves .wave-1 {
-            animation: wave-drift 7s linear infinite;
-            opacity: 0.25;
-        }
-        .hero-waves .wave-2 {
-            animation: wave-drift-slow 11s linear infinite;
-            opacity: 0.15;
-        }
-        .hero-waves .wave-3 {
-            animation: wave-drift 15s linear infinite reverse;
-            opacity: 0.10;
-        }
+    def __init__(self, container=None) -> None:
+        self._container = container or st
+        self._blocks: list[str] = []
 
-        /* セクション波区切り */
-        .wave-divider {
-            position: relative;
-            width: 100%;
-            height: 40px;
-            margin: 1.5rem 0;
-            overflow: hidden;
-        }
-        .wave-divider svg {
-            width: 200%;
-            height: 100%;
-            animation: wave-drift-slow 14s linear infinite;
-        }
+    def markdown(self, body: str) -> None:
+        """Markdown / HTML のブロックを追加する（st.markdown と同様にデデントする）。"""
+        block = textwrap.dedent(body).strip()
+        if block:
+            self._blocks.append(block)
 
-        /* サイドバー波 */
-        .sidebar-wave {
-            position: relative;
-            width: 100%;
-            height: 50px;
-            overflow: hidden;
-            margin-top: 1rem;
-        }
-        .sidebar-wave svg {
-            width: 200%;
-            height: 100%;
-            animation: wave-drift 10s linear infinite;
-        }
-        </style>
-        """,
-        unsafe_allow_html=True,
-    )
+    def flush(self) -> None:
+        """たまったブロックを1要素として送る。"""
+        if self._blocks:
+            with timing.span("markdown", "flush"):
+                self._container.markdown("\n\n".join(self._blocks), unsafe_allow_html=True)
+            self._blocks.clear()
 
 
 # ============================================================
 # ヒーローセクション共通コンポーネント
 # ============================================================
-def render_hero(title: str, subtitle: str, description: str = "") -> None:
+def render_hero(page: PageBuffer, title: str, subtitle: str, description: str = "") -> None:
     """各ページ上部のヒーローセクションを描画する。"""
     desc_html = f"<p>{description}</p>" if description else ""
-    st.markdown(
+    page.markdown(
         f"""
         <div class="hero-section">
             <h1>{title}</h1>
             <p class="hero-subtitle">{subtitle}</p>
             {desc_html}
             <div class="hero-waves">
-                <svg class="wave-1" viewBox="0 0 1200 60" preserveAspectRatio="none">
-                    <path d="M0,30 C150,50 350,0 500,30 C650,60 850,10 1000,30 C1100,45 1150,20 1200,30 L1200,60 L0,60Z" fill="rgba(255,255,255,0.4)"/>
-                </svg>
-                <svg class="wave-2" viewBox="0 0 1200 60" preserveAspectRatio="none">
-                    <path d="M0,35 C200,10 400,55 600,35 C800,15 1000,50 1200,35 L1200,60 L0,60Z" fill="rgba(255,255,255,0.3)"/>
-                </svg>
-                <svg class="wave-3" viewBox="0 0 1200 60" preserveAspectRatio="none">
-                    <path d="M0,40 C100,20 300,55 500,35 C700,15 900,50 1100,30 C1150,25 1180,40 1200,38 L1200,60 L0,60Z" fill="rgba(255,255,255,0.2)"/>
-                </svg>
+                <span class="wave-1"></span><span class="wave-2"></span><span class="wave-3"></span>
             </div>
         </div>
-        """,
-        unsafe_allow_html=True,
+        """
+    )
+
+
+def render_section_divider(page: PageBuffer) -> None:
+    """セクション間の波形区切り線を描画する（波の SVG は CSS 側に定義）。"""
+    page.markdown('<div class="section-divider-wave"></div>')
+
+
+def render_long_series(page: PageBuffer, name: str, title: str, y_title: str, color: str) -> None:
+    """日別・月別の長い系列を、期間スライダーで拡大できる折れ線グラフとして描画する。
+
+    データストアに表が無ければ何も描かない。全点は送らず、選んだ期間を
+    グラフの横幅に見合う点数まで間引いて送る（期間を狭めるほど細かくなる）。
+    """
+    whole = timeseries.series_view(name)
+    if whole is None:
+        return
+    page.markdown(f"#### {title}")
+    page.flush()
+    start, end = st.slider(
+        "表示期間", min_value=whole.first, max_value=whole.last, value=(whole.first, whole.last),
+        format="YYYY-MM-DD", key=f"{name}_period",
     )
+    view = timeseries.series_view(name, start, end)
+    plotly_chart(name, build_series_figure(view.frame, y_title, color))
+    if view.points > len(view.frame):
+        page.markdown(
+            f'<div class="metric-desc">期間内の{view.points:,}点を{len(view.frame):,}点に間引いて表示。'
+            "期間を狭めると細かく表示されます。</div>"
+        )
 
 
 # ============================================================
@@ -498,44 +151,795 @@ def render_hero(title: str, subtitle: str, description: str = "") -> None:
 # ============================================================
 def render_sidebar_decoration() -> None:
     """サイドバーにヘッダーとフッターを追加する。"""
-    with st.sidebar:
-        st.markdown(
-            """
-            <div style="text-align:center; padding: 1.2rem 0 0.5rem 0;">
-                <div style="font-size:1.5rem; font-weight:900; letter-spacing:0.08em;
-                            color:#ffffff;">セセラギズム</div>
-                <div style="font-size:0.72rem; color:rgba(255,255,255,0.6);
-                            margin-top:0.4rem;">
-                    三島商工会議所 80周年ビジョン
-                </div>
+    sidebar = PageBuffer(st.sidebar)
+    sidebar.markdown(
+        """
+        <div style="text-align:center; padding: 1.2rem 0 0.5rem 0;">
+            <div style="font-size:1.5rem; font-weight:900; letter-spacing:0.08em;
+                        color:#ffffff;">セセラギズム</div>
+            <div style="font-size:0.72rem; color:rgba(255,255,255,0.6);
+                        margin-top:0.4rem;">
+                三島商工会議所 80周年ビジョン
             </div>
-            """,
-            unsafe_allow_html=True,
+        </div>
+        """
+    )
+    sidebar.markdown('<div class="sidebar-wave"></div>')
+    sidebar.markdown("---")
+    sidebar.markdown(
+        """
+        <div style="text-align:center; font-size:0.72rem;
+                    color:rgba(255,255,255,0.65); padding-bottom:1rem;">
+            湧き上がれ、鳴り響け<br/>
+            三島商工会議所 創立80周年
+        </div>
+        """
+    )
+    sidebar.flush()
+
+
+DIAGNOSTICS_PARAM = "diagnostics"
+
+
+def render_diagnostics_panel() -> None:
+    """処理時間の集計をサイドバーに表示する（?diagnostics=1 のときだけ）。
+
+    値はこのプロセスの全セッション分。p50 / p95 / p99 は名前ごとの直近の記録から求める。
+    """
+    import pandas as pd
+
+    stats = timing.RECORDER.summary()
+    with st.sidebar.expander("⏱ 処理時間（ms）", expanded=True):
+        st.dataframe(
+            pd.DataFrame(
+                {
+                    "種類": [s.kind for s in stats],
+                    "名前": [s.name for s in stats],
+                    "件数": [s.count for s in stats],
+                    "p50": [s.p50 for s in stats],
+                    "p95": [s.p95 for s in stats],
+                    "p99": [s.p99 for s in stats],
+                }
+            ).round(1),
+            hide_index=True,
         )
-        st.markdown(
-            """
-            <div class="sidebar-wave">
-                <svg viewBox="0 0 1200 50" preserveAspectRatio="none">
-                    <path d="M0,25 C150,40 350,10 500,25 C650,40 850,10 1000,25 C1100,35 1150,15 1200,25 L1200,50 L0,50Z"
-                          fill="rgba(255,255,255,0.08)"/>
-                    <path d="M0,30 C200,15 400,42 600,28 C800,14 1000,40 1200,28 L1200,50 L0,50Z"
-                          fill="rgba(255,255,255,0.05)"/>
-                </svg>
-            </div>
-            """,
-            unsafe_allow_html=True,
+        st.download_button(
+            "JSON Lines で保存", timing.RECORDER.to_jsonl(), file_name="seseragism-timing.jsonl",
+            mime="application/jsonl",
+        )
+
+
+PROFILE_PARAM = "profile"
+# ?profile= の値 → tracemalloc も使うか（これ以外の値はプロファイルしない）
+PROFILE_MODES = {"1": False, "memory": True}
+
+
+def run_profiled_page(pg, mode: str) -> None:
+    """選択中のページを1回だけプロファイルしながら描画し、上位の項目をサイドバーに出す。
+
+    ?profile=1 で cProfile、?profile=memory で tracemalloc も使う。結果は profiles/ に保存する。
+    描画前にパラメータを外すので、以降の操作（再実行）は通常どおり実行される。
+    サーバーで有効にしていない（SESERAGISM_PROFILING=1 でない）ときは通常どおり描画する。
+    """
+    from seseragism import profiling
+
+    if not profiling.enabled():
+        pg.run()
+        return
+    del st.query_params[PROFILE_PARAM]
+    try:
+        report = profiling.run_profiled(pg.run, pg.url_path or "default", memory=PROFILE_MODES[mode])
+    except profiling.ProfilerBusy as exc:
+        st.sidebar.warning(str(exc))
+        pg.run()
+        return
+    render_profile_report(report)
+
+
+def render_profile_report(report) -> None:
+    """プロファイル結果の上位をサイドバーに表示する。"""
+    import pandas as pd
+
+    with st.sidebar.expander(f"🔬 プロファイル（{report.seconds * 1000:,.0f} ms）", expanded=True):
+        st.caption(f"保存先: {report.stats_path}")
+        st.dataframe(
+            pd.DataFrame(report.functions, columns=["関数", "呼び出し", "自身 ms", "累積 ms"]).round(1),
+            hide_index=True,
         )
-        st.markdown("---")
-        st.markdown(
-            """
-            <div style="text-align:center; font-size:0.72rem;
-                        color:rgba(255,255,255,0.65); padding-bottom:1rem;">
-                湧き上がれ、鳴り響け<br/>
-                三島商工会議所 創立80周年
+        if report.allocations is not None:
+            st.caption(f"割り当ての多い行（{report.snapshot_path.name}）")
+            st.dataframe(
+                pd.DataFrame(
+                    [(where, size / 1024, count) for where, size, count in report.allocations],
+                    columns=["行", "KiB", "件数"],
+                ).round(1),
+                hide_index=True,
+            )
+
+
+# ============================================================
+# Plotlyチャート構築（全セッション共有キャッシュ）
+# ============================================================
+# 入力が同じなら図も同じなので、st.cache_resource で全セッションから共有する。
+# キーは引数（データ）と関数本体（レイアウト指定）のハッシュ。上限を超えると古い順に破棄。
+# 図は作ったあとに変更しないので、共有インスタンスでも安全。
+#
+# 図は trace・layout を辞書で組み立て、charts.figure() で検証なしの go.Figure にする。
+# 背景色・フォント・目盛線の色などの共通の指定はテンプレート「seseragism」に
+# あるので、ここには図ごとの指定だけを書く（charts.TEMPLATE_LAYOUT）。
+FIGURE_CACHE_MAX_ENTRIES = 64
+# 図の layout に高さが無いときの高さ（plotly.js の既定。st.plotly_chart と同じ）
+PLOTLY_DEFAULT_HEIGHT = 450
+
+
+def plotly_chart(name: str, fig: go.Figure) -> None:
+    """図をコンテナの幅いっぱいに送る（シリアライズ済みの JSON を使い回す。送信の時間を記録する）。
+
+    st.plotly_chart は呼ぶたびに図を to_dict でコピーして JSON にし直すので、キャッシュした
+    図でも再実行ごとにシリアライズの時間がかかる。ここでは charts.spec() で図ごとに1回だけ
+    作った JSON を、st.plotly_chart（選択なし・theme=None）と同じ要素として送る。
+    Streamlit の内部の部品を使うので、requirements.txt で版を固定している。内部が合わない
+    （ImportError・TypeError・AttributeError）ときは、以降このプロセスでは st.plotly_chart で送る。
+    Streamlit のテーマ（theme="streamlit"）は図のテンプレートの指定を上書きするので使わない。
+    """
+    global _spec_path_failed
+    with timing.span("chart", name):
+        if not _spec_path_failed:
+            try:
+                _enqueue_spec(fig)
+                return
+            except (ImportError, TypeError, AttributeError):
+                _spec_path_failed = True
+                _LOGGER.warning("could not send a serialized chart; using st.plotly_chart", exc_info=True)
+        # 失敗した時点で要素の ID を登録済みのことがあるので、key を付けて別の ID にする
+        st.plotly_chart(fig, theme=None, width="stretch", key=f"plotly-{name}")
+
+
+# 内部の部品での送信に失敗したか（失敗したら以降は st.plotly_chart を使う）
+_spec_path_failed = False
+
+
+def _enqueue_spec(fig: go.Figure) -> None:
+    """charts.spec() の JSON を plotly_chart の要素として送る（Streamlit 1.65 の内部の部品を使う）。"""
+    from streamlit.elements.lib.form_utils import current_form_id
+    from streamlit.elements.lib.layout_utils import LayoutConfig
+    from streamlit.elements.lib.utils import compute_and_register_element_id
+    from streamlit.proto.PlotlyChart_pb2 import PlotlyChart as PlotlyChartProto
+
+    dg = st._main
+    proto = PlotlyChartProto()
+    proto.spec = charts.spec(fig)
+    proto.config = "{}"
+    proto.theme = ""
+    proto.form_id = current_form_id(dg)
+    proto.id = compute_and_register_element_id(
+        "plotly_chart",
+        user_key=None,
+        key_as_main_identity=False,
+        dg=dg,
+        plotly_spec=proto.spec,
+        plotly_config=proto.config,
+        selection_mode=("points", "box", "lasso"),
+        is_selection_activated=False,
+        theme=None,
+        width="stretch",
+        height="content",
+        alt=None,
+    )
+    height = fig.layout.height or PLOTLY_DEFAULT_HEIGHT
+    dg._enqueue("plotly_chart", proto, layout_config=LayoutConfig(width="stretch", height=int(height)))
+
+
+@timing.timed("figure")
+@st.cache_resource(max_entries=FIGURE_CACHE_MAX_ENTRIES, show_spinner=False)
+def build_keyword_figure(keyword_data: pd.DataFrame) -> go.Figure:
+    """ワークショップのキーワード頻度の横棒グラフを構築する。"""
+    # 色のグラデーション
+    colors = [
+        "#0d3b66", "#115e82", "#1a6b8a", "#238d96", "#2baa9e",
+        "#48b4a0", "#66c2a5", "#80deea", "#a0e4d0", "#b2ebf2",
+    ]
+    counts = keyword_data["出現回数"].to_numpy()
+
+    bar = {
+        "type": "bar",
+        "x": counts,
+        "y": keyword_data["キーワード"].tolist(),
+        "orientation": "h",
+        "marker": {"color": colors, "line": {"width": 0}, "cornerradius": 6},
+        "text": counts,
+        "textposition": "outside",
+        "textfont": {"size": 13, "color": "#0a2540"},
+        "hovertemplate": "<b>%{y}</b><br>出現回数: %{x}回<extra></extra>",
+    }
+    return charts.figure(
+        [bar],
+        {
+            "title": {"text": "ワークショップ キーワード頻度", "font": {"size": 16}},
+            "xaxis": {"title": {"text": "出現回数"}, "showgrid": True, "range": [0, int(counts.max() * 1.2) + 1]},
+            "yaxis": {"autorange": "reversed", "tickfont": {"size": 13}},
+            "height": 450,
+            "margin": {"l": 120, "r": 40, "t": 60, "b": 40},
+        },
+    )
+
+
+@timing.timed("figure")
+@st.cache_resource(max_entries=FIGURE_CACHE_MAX_ENTRIES, show_spinner=False)
+def build_radar_figure(categories: list[str], values: list[int]) -> go.Figure:
+    """「変えたくない三島の良さ」のレーダーチャートを構築する。"""
+    # レーダーは閉じるために先頭を末尾に追加
+    categories_closed = list(categories) + [categories[0]]
+    values_closed = list(values) + [values[0]]
+
+    radar = {
+        "type": "scatterpolar",
+        "r": values_closed,
+        "theta": categories_closed,
+        "fill": "toself",
+        "fillcolor": "rgba(26,107,138,0.18)",
+        "line": {"color": "#1a6b8a", "width": 2.5},
+        "marker": {"size": 8, "color": "#0d3b66"},
+        "name": "重要度スコア",
+        "hovertemplate": "<b>%{theta}</b><br>重要度: %{r}<extra></extra>",
+    }
+    return charts.figure(
+        [radar],
+        {
+            "polar": {
+                "radialaxis": {"visible": True, "range": [0, 100], "showticklabels": True, "tickfont": {"size": 10}},
+                "angularaxis": {"tickfont": {"size": 14, "color": "#0a2540"}},
+            },
+            "height": 420,
+            "margin": {"l": 60, "r": 60, "t": 40, "b": 40},
+            "showlegend": False,
+        },
+    )
+
+
+@timing.timed("figure")
+@st.cache_resource(max_entries=FIGURE_CACHE_MAX_ENTRIES, show_spinner=False)
+def build_cooccurrence_figure(matrix: pd.DataFrame) -> go.Figure:
+    """キーワード共起数（両方が挙がった班の数）のヒートマップを構築する。"""
+    counts = matrix.to_numpy()
+
+    heatmap = {
+        "type": "heatmap",
+        "z": counts,
+        "x": list(matrix.columns),
+        "y": list(matrix.index),
+        "colorscale": [[0, "#fafffe"], [0.5, "#48b4a0"], [1, "#0d3b66"]],
+        "text": counts,
+        "texttemplate": "%{text}",
+        "textfont": {"size": 11},
+        "xgap": 2,
+        "ygap": 2,
+        "colorbar": {"title": {"text": "班の数"}, "thickness": 12},
+        "hovertemplate": "<b>%{y} × %{x}</b><br>両方が挙がった班: %{z}<extra></extra>",
+    }
+    return charts.figure(
+        [heatmap],
+        {
+            "xaxis": {"side": "top", "tickangle": -45, "tickfont": {"size": 12}},
+            "yaxis": {"autorange": "reversed", "tickfont": {"size": 12}},
+            "height": 520,
+            "margin": {"l": 100, "r": 30, "t": 110, "b": 20},
+            "plot_bgcolor": "#ffffff",
+        },
+    )
+
+
+@timing.timed("figure")
+@st.cache_resource(max_entries=FIGURE_CACHE_MAX_ENTRIES, show_spinner=False)
+def build_score_figure(score_labels: list[str], score_counts: list[int]) -> go.Figure:
+    """アンケート設問1のスコア分布の棒グラフを構築する。"""
+    score_colors = [
+        "#e57373", "#ef9a9a", "#ffcc80", "#fff59d",
+        "#c5e1a5", "#81c784", "#4caf50", "#2e7d32",
+    ]
+
+    bar = {
+        "type": "bar",
+        "x": list(score_labels),
+        "y": list(score_counts),
+        "marker": {"color": score_colors, "cornerradius": 6},
+        "text": list(score_counts),
+        "textposition": "outside",
+        "textfont": {"size": 13, "color": "#0a2540"},
+        "hovertemplate": "<b>%{x}</b><br>回答数: %{y}名<extra></extra>",
+    }
+    return charts.figure(
+        [bar],
+        {
+            "xaxis": {"title": {"text": "評価（点）"}},
+            "yaxis": {"title": {"text": "回答数（名）"}},
+            "height": 350,
+            "margin": {"l": 50, "r": 30, "t": 20, "b": 50},
+        },
+    )
+
+
+@timing.timed("figure")
+@st.cache_resource(max_entries=FIGURE_CACHE_MAX_ENTRIES, show_spinner=False)
+def build_youth_figure(youth: pd.DataFrame, labels: tuple[str, ...]) -> go.Figure:
+    """若者・子育て世代の人口推計を、流出の仮定ごとに並べた折れ線グラフを構築する。"""
+    colors = ["#e57373", "#26c6da", "#1a6b8a"]
+    dashes = ["dash", "solid", "solid"]
+    years = youth["年"].to_numpy()
+    lines = [
+        {
+            "type": "scatter",
+            "x": years,
+            "y": youth[column].to_numpy(),
+            "name": label,
+            "mode": "lines",
+            "line": {"color": color, "width": 2.5, "dash": dash},
+            "hovertemplate": f"<b>%{{x}}年</b><br>{label}: %{{y:,.0f}}人<extra></extra>",
+        }
+        for column, label, color, dash in zip(youth.columns[1:], labels, colors, dashes)
+    ]
+    return charts.figure(
+        lines,
+        {
+            "xaxis": {"title": {"text": "年"}, "showgrid": False, "dtick": 5},
+            "yaxis": {"title": {"text": "人口（人）"}, "tickformat": ",", "rangemode": "tozero"},
+            "height": 360,
+            "margin": {"l": 60, "r": 30, "t": 30, "b": 50},
+            "legend": {"orientation": "h", "yanchor": "bottom", "y": 1.02, "xanchor": "right", "x": 1},
+        },
+    )
+
+
+@timing.timed("figure")
+@st.cache_resource(max_entries=FIGURE_CACHE_MAX_ENTRIES, show_spinner=False)
+def build_population_figure(
+    actual_years: list[int],
+    actual_pop: list[int],
+    projected_years: list[int],
+    projected_pop: list[int],
+    bands: pd.DataFrame | None = None,
+    by_age: pd.DataFrame | None = None,
+) -> go.Figure:
+    """人口の実績と将来推計の折れ線グラフを構築する。
+
+    bands（年, p5, p25, p50, p75, p95）を渡すと、推計の幅を帯（ファンチャート）で重ねる。
+    by_age（年, 人口, 年齢区分ごとの列。基準年から）を渡すと、年齢別の推計
+    （コーホート要因法）の総人口を重ね、ホバーに年齢区分ごとの人口を出す。
+    """
+    traces = []
+
+    # 推計の幅（外側 5〜95%、内側 25〜75%）。折れ線より先に描いて背面に置く
+    if bands is not None:
+        band_years = [actual_years[-1]] + bands["年"].tolist()
+        for low, high, alpha, label in (("p5", "p95", 0.12, "90%区間"), ("p25", "p75", 0.22, "50%区間")):
+            traces.append({
+                "type": "scatter",
+                "x": band_years + band_years[::-1],
+                "y": [actual_pop[-1]] + bands[high].tolist() + bands[low].tolist()[::-1] + [actual_pop[-1]],
+                "fill": "toself",
+                "fillcolor": f"rgba(229,115,115,{alpha})",
+                "line": {"width": 0},
+                "name": label,
+                "hoverinfo": "skip",
+            })
+
+    # 実績（実線）
+    traces.append({
+        "type": "scatter",
+        "x": list(actual_years),
+        "y": list(actual_pop),
+        "name": "実績",
+        "mode": "lines+markers",
+        "line": {"color": "#1a6b8a", "width": 2.5},
+        "marker": {"size": 4, "color": "#0d3b66"},
+        "hovertemplate": "<b>%{x}年</b><br>人口: %{y:,.0f}人（実績）<extra></extra>",
+    })
+    # 推計（破線）— 実績の最終年を起点にして接続
+    traces.append({
+        "type": "scatter",
+        "x": [actual_years[-1]] + list(projected_years),
+        "y": [actual_pop[-1]] + list(projected_pop),
+        "name": "推計",
+        "mode": "lines+markers",
+        "line": {"color": "#e57373", "width": 2.5, "dash": "dash"},
+        "marker": {"size": 4, "color": "#e57373", "symbol": "diamond"},
+        "hovertemplate": "<b>%{x}年</b><br>人口: %{y:,.0f}人（推計）<extra></extra>",
+    })
+    # 年齢別の推計（点線）
+    if by_age is not None:
+        groups = list(by_age.columns[2:])
+        breakdown = "".join(f"<br>{name}: %{{customdata[{i}]:,}}人" for i, name in enumerate(groups))
+        traces.append({
+            "type": "scatter",
+            "x": by_age["年"].to_numpy(),
+            "y": by_age["人口"].to_numpy(),
+            "customdata": by_age[groups].to_numpy(),
+            "name": "年齢別の推計",
+            "mode": "lines",
+            "line": {"color": "#7e57c2", "width": 2, "dash": "dot"},
+            "hovertemplate": f"<b>%{{x}}年</b><br>人口: %{{y:,.0f}}人（年齢別の推計）{breakdown}<extra></extra>",
+        })
+
+    # 縦軸は 90,000〜115,000 人。推計の幅・年齢別の推計がはみ出すときだけ 5,000 人単位で下を広げる
+    lowest = min(projected_pop) if bands is None else min(min(projected_pop), int(bands["p5"].min()))
+    if by_age is not None:
+        lowest = min(lowest, int(by_age["人口"].min()))
+    return charts.figure(
+        traces,
+        {
+            # 80周年（2025）ライン
+            "shapes": [{
+                "type": "line", "xref": "x", "x0": 2025, "x1": 2025, "yref": "y domain", "y0": 0, "y1": 1,
+                "line": {"color": "#26c6da", "width": 1.5, "dash": "dot"},
+            }],
+            "annotations": [{
+                "text": "80周年", "showarrow": False, "xref": "x", "x": 2025, "yref": "y domain", "y": 1,
+                "xanchor": "center", "yanchor": "bottom", "font": {"size": 11, "color": "#0d3b66"},
+            }],
+            "xaxis": {"title": {"text": "年"}, "showgrid": False, "dtick": 5},
+            "yaxis": {"title": {"text": "人口（人）"}, "tickformat": ",",
+                      "range": [min(90_000, lowest // 5_000 * 5_000), 115_000]},
+            "height": 420,
+            "margin": {"l": 60, "r": 30, "t": 30, "b": 50},
+            "legend": {"orientation": "h", "yanchor": "bottom", "y": 1.02, "xanchor": "right", "x": 1},
+        },
+    )
+
+
+@timing.timed("figure")
+@st.cache_resource(max_entries=FIGURE_CACHE_MAX_ENTRIES, show_spinner=False)
+def build_tourism_figure(df_tourism: pd.DataFrame) -> go.Figure:
+    """観光客数推移の棒グラフを構築する。"""
+    tourists = df_tourism["観光客数（千人）"]
+
+    bar = {
+        "type": "bar",
+        "x": df_tourism["年"].to_numpy(),
+        "y": tourists.to_numpy(),
+        "marker": {
+            "color": ["#1a6b8a" if t > 3000 else "#e57373" for t in tourists],
+            "cornerradius": 4,
+        },
+        "text": [f"{t/1000:.1f}M" for t in tourists],
+        "textposition": "outside",
+        "textfont": {"size": 11},
+        "hovertemplate": "<b>%{x}年</b><br>観光客数: %{y:,.0f}千人<extra></extra>",
+    }
+    return charts.figure(
+        [bar],
+        {
+            # COVID注釈
+            "annotations": [{
+                "x": 2020, "y": 2800, "text": "COVID-19<br>影響",
+                "showarrow": True, "arrowhead": 2, "arrowcolor": "#e57373", "ax": 0, "ay": -50,
+                "font": {"size": 11, "color": "#e57373"},
+            }],
+            "xaxis": {"title": {"text": "年"}, "dtick": 1, "showgrid": False},
+            "yaxis": {"title": {"text": "観光客数（千人）"}},
+            "height": 380,
+            "margin": {"l": 60, "r": 30, "t": 30, "b": 50},
+        },
+    )
+
+
+@timing.timed("figure")
+@st.cache_resource(max_entries=FIGURE_CACHE_MAX_ENTRIES, show_spinner=False)
+def build_business_figure(df_biz: pd.DataFrame) -> go.Figure:
+    """事業所数推移の折れ線グラフを構築する。"""
+    line = {
+        "type": "scatter",
+        "x": df_biz["年"].to_numpy(),
+        "y": df_biz["事業所数"].to_numpy(),
+        "mode": "lines+markers",
+        "line": {"color": "#e57373", "width": 2.5, "dash": "dot"},
+        "marker": {"size": 8, "color": "#c62828", "symbol": "diamond"},
+        "fill": "tozeroy",
+        "fillcolor": "rgba(229,115,115,0.08)",
+        "hovertemplate": "<b>%{x}年</b><br>事業所数: %{y:,.0f}<extra></extra>",
+    }
+    return charts.figure(
+        [line],
+        {
+            "title": {"text": "事業所数の推移", "font": {"size": 14}},
+            "xaxis": {"title": {"text": "年"}, "showgrid": False},
+            "yaxis": {"title": {"text": "事業所数"}, "range": [4500, 5700]},
+            "height": 350,
+            "margin": {"l": 60, "r": 30, "t": 50, "b": 50},
+        },
+    )
+
+
+@timing.timed("figure")
+@st.cache_resource(max_entries=FIGURE_CACHE_MAX_ENTRIES, show_spinner=False)
+def build_series_figure(series: pd.DataFrame, y_title: str, color: str) -> go.Figure:
+    """長い時系列（間引き済み）の折れ線グラフを構築する。点が多いときは WebGL で描く。"""
+    x_column, y_column = series.columns
+    line = {
+        "type": "scattergl" if len(series) > timeseries.WEBGL_THRESHOLD else "scatter",
+        "x": series[x_column].to_numpy(),
+        "y": series[y_column].to_numpy(),
+        "mode": "lines",
+        "line": {"color": color, "width": 1.5},
+        "hovertemplate": f"<b>%{{x|%Y-%m-%d}}</b><br>{y_column}: %{{y:,.0f}}<extra></extra>",
+    }
+    return charts.figure(
+        [line],
+        {
+            "xaxis": {"title": {"text": x_column}, "showgrid": False},
+            "yaxis": {"title": {"text": y_title}, "tickformat": ","},
+            "height": 350,
+            "margin": {"l": 60, "r": 30, "t": 30, "b": 50},
+        },
+    )
+
+
+# ============================================================
+# HTMLフラグメント（全セッション共有キャッシュ）
+# ============================================================
+# カードグリッド等のHTMLは入力データの内容ごとに一度だけ組み立て、プロセス内で共有する。
+# データが変わればハッシュが変わるので自動的に作り直される。文字列は不変なので
+# st.cache_data ではなく st.cache_resource でコピーせずに返す。
+FRAGMENT_CACHE_MAX_ENTRIES = 128
+
+
+@st.cache_resource(max_entries=FRAGMENT_CACHE_MAX_ENTRIES, show_spinner=False)
+def render_timeline_html(milestones: list[dict]) -> str:
+    """ビジョン変遷のタイムラインカードを描画する。"""
+    parts = ['<div style="display:grid; grid-template-columns:repeat(4, 1fr); gap:1rem; margin-bottom:1rem;">']
+    for m in milestones:
+        active_cls = " active" if m["active"] else ""
+        year_cls = " current" if m["active"] else ""
+        parts.append(f"""
+            <div class="timeline-card{active_cls}">
+                <span class="timeline-year{year_cls}">{m['year']}</span>
+                <div class="timeline-theme">{m['theme']}</div>
+                <div class="timeline-stage">{m['stage']}</div>
+                <div class="timeline-desc">{m['desc']}</div>
+            </div>""")
+    parts.append("</div>")
+    return "".join(parts)
+
+
+@st.cache_resource(max_entries=FRAGMENT_CACHE_MAX_ENTRIES, show_spinner=False)
+def render_story_html(story_steps: list[dict]) -> str:
+    """進化のストーリーの縦並びステップを描画する。"""
+    parts = []
+    for i, step in enumerate(story_steps):
+        is_current = step["period"] == "80周年"
+        border_color = "#00897b" if is_current else "#1a6b8a"
+        bg = "linear-gradient(135deg, #e0f7fa 0%, #ffffff 50%)" if is_current else "#ffffff"
+        parts.append(f"""
+        <div style="display:flex; gap:1rem; align-items:flex-start;">
+            <div style="flex-shrink:0; text-align:center; padding-top:0.6rem;">
+                <div style="display:inline-block; background:linear-gradient(135deg, {border_color}, #48b4a0);
+                            color:#fff; font-size:0.8rem; font-weight:700;
+                            padding:0.3rem 0.8rem; border-radius:16px;">{step['period']}</div>
             </div>
-            """,
-            unsafe_allow_html=True,
+            <div style="flex:1; background:{bg}; border-left:4px solid {border_color};
+                        border-radius:0 12px 12px 0; padding:1.2rem 1.5rem; margin-bottom:0.3rem;
+                        box-shadow:0 1px 6px rgba(10,37,64,0.06);">
+                <div style="font-size:1.2rem; font-weight:900; color:#0a2540;">
+                    {step['name']} <span style="font-size:0.85rem; font-weight:600; color:{border_color};">― {step['stage']}</span>
+                </div>
+                <div style="font-size:0.85rem; color:#546e7a; margin-top:0.4rem; line-height:1.7;">
+                    {step['detail']}
+                </div>
+            </div>
+        </div>""")
+        if i < len(story_steps) - 1:
+            parts.append(f"""
+            <div style="text-align:center; color:#1a6b8a; font-size:0.8rem; margin:0.1rem 0 0.1rem 0;">
+                ▼ {story_steps[i+1]['arrow']}
+            </div>""")
+    return "".join(parts)
+
+
+@st.cache_resource(max_entries=FRAGMENT_CACHE_MAX_ENTRIES, show_spinner=False)
+def render_philosophy_html(philosophies: list[tuple[str, str]]) -> str:
+    """セントラルフィロソフィー候補のカードを描画する。"""
+    parts = ['<div style="display:grid; grid-template-columns:repeat(5, 1fr); gap:0.8rem; margin-bottom:1rem;">']
+    for num, text in philosophies:
+        parts.append(f"""
+            <div class="philosophy-card">
+                <div style="font-size:0.75rem; color:#78909c; margin-bottom:0.3rem;">{num}</div>
+                <div class="philosophy-title" style="font-size:1rem;">{text}</div>
+            </div>""")
+    parts.append("</div>")
+    return "".join(parts)
+
+
+@st.cache_resource(max_entries=FRAGMENT_CACHE_MAX_ENTRIES, show_spinner=False)
+def render_subcopy_html(sub_copies: list[str]) -> str:
+    """サブコピー候補のカードを描画する。"""
+    return "".join(f'<div class="subcopy-card"><p>{sc}</p></div>' for sc in sub_copies)
+
+
+@st.cache_resource(max_entries=FRAGMENT_CACHE_MAX_ENTRIES, show_spinner=False)
+def render_alternatives_html(alternatives: list[tuple[str, str, str]]) -> str:
+    """派生・代替案のカードを描画する。"""
+    parts = ['<div style="display:grid; grid-template-columns:repeat(4, 1fr); gap:1rem;">']
+    for name, sub, desc in alternatives:
+        parts.append(f"""
+            <div class="concept-card" style="text-align:center; border-left:4px solid #80deea;">
+                <div class="concept-title" style="font-size:1.1rem;">{name}</div>
+                <div style="font-size:0.75rem; color:#90a4ae; margin-bottom:0.4rem;">{sub}</div>
+                <div class="concept-text">{desc}</div>
+            </div>""")
+    parts.append("</div>")
+    return "".join(parts)
+
+
+@st.cache_resource(max_entries=FRAGMENT_CACHE_MAX_ENTRIES, show_spinner=False)
+def render_category_details_html(cat_details: list[tuple[str, str]]) -> str:
+    """レーダーチャートのカテゴリ詳細を描画する。"""
+    parts = ['<div style="display:grid; grid-template-columns:repeat(3, 1fr); gap:0.8rem;">']
+    for label, detail in cat_details:
+        parts.append(f"""
+            <div style="margin-bottom:0.4rem;">
+                <strong style="color:#0d3b66;">{label}</strong><br/>
+                <span style="font-size:0.82rem; color:#607d8b;">{detail}</span>
+            </div>""")
+    parts.append("</div>")
+    return "".join(parts)
+
+
+@st.cache_resource(max_entries=FRAGMENT_CACHE_MAX_ENTRIES, show_spinner=False)
+def render_teams_html(teams: list[tuple[str, str]]) -> str:
+    """チームごとのキーワードカードを描画する。"""
+    parts = ['<div style="display:grid; grid-template-columns:repeat(4, 1fr); gap:0.8rem; margin-bottom:1rem;">']
+    for name, kw in teams:
+        parts.append(f"""
+            <div class="team-card">
+                <div class="team-name">{name}</div>
+                <div class="team-keywords">{kw}</div>
+            </div>""")
+    parts.append("</div>")
+    return "".join(parts)
+
+
+@st.cache_resource(max_entries=FRAGMENT_CACHE_MAX_ENTRIES, show_spinner=False)
+def render_q4_html(q4_items: list[tuple[str, str, str]]) -> str:
+    """設問4（変えたくない三島の良さ）のカードを描画する。"""
+    parts = ['<div style="display:grid; grid-template-columns:repeat(5, 1fr); gap:0.8rem; margin-bottom:1rem;">']
+    for icon, title, desc in q4_items:
+        parts.append(
+            f'<div class="concept-card" style="text-align:center; border-left:none;'
+            f' border-top:3px solid #26c6da; min-height:150px;">'
+            f'<div style="font-size:1.4rem; margin-bottom:0.3rem;">{icon}</div>'
+            f'<div class="concept-title" style="font-size:0.88rem;">{title}</div>'
+            f'<div class="concept-text" style="font-size:0.75rem;">{desc}</div></div>'
         )
+    parts.append("</div>")
+    return "".join(parts)
+
+
+@st.cache_resource(max_entries=FRAGMENT_CACHE_MAX_ENTRIES, show_spinner=False)
+def render_q3_html(q3_items: list[tuple[str, str, str]]) -> str:
+    """設問3（20年後の理想の三島）のカードを描画する。"""
+    parts = ['<div style="display:grid; grid-template-columns:repeat(5, 1fr); gap:0.8rem; margin-bottom:1rem;">']
+    for icon, title, desc in q3_items:
+        parts.append(
+            f'<div class="philosophy-card" style="min-height:auto; padding:1rem;">'
+            f'<div style="font-size:1.3rem;">{icon}</div>'
+            f'<div class="philosophy-title" style="font-size:0.85rem; margin-top:0.3rem;">{title}</div>'
+            f'<div class="philosophy-desc" style="font-size:0.73rem;">{desc}</div></div>'
+        )
+    parts.append("</div>")
+    return "".join(parts)
+
+
+@st.cache_resource(max_entries=FRAGMENT_CACHE_MAX_ENTRIES, show_spinner=False)
+def render_q5_html(q5_items: list[tuple[str, str, str]]) -> str:
+    """設問5（三島がもっと良くなるには）のカードを描画する。"""
+    parts = ['<div style="display:grid; grid-template-columns:repeat(5, 1fr); gap:0.8rem; margin-bottom:1rem;">']
+    for icon, title, desc in q5_items:
+        parts.append(
+            f'<div class="concept-card" style="text-align:center; border-left:none;'
+            f' border-top:3px solid #e57373; min-height:140px;">'
+            f'<div style="font-size:1.3rem; margin-bottom:0.2rem;">{icon}</div>'
+            f'<div class="concept-title" style="font-size:0.88rem;">{title}</div>'
+            f'<div class="concept-text" style="font-size:0.75rem;">{desc}</div></div>'
+        )
+    parts.append("</div>")
+    return "".join(parts)
+
+
+@st.cache_resource(max_entries=FRAGMENT_CACHE_MAX_ENTRIES, show_spinner=False)
+def render_q6_html(q6_items: list[tuple[str, str, str]]) -> str:
+    """設問6（商工会議所に期待すること）のカードを描画する。"""
+    parts = ['<div style="display:grid; grid-template-columns:repeat(5, 1fr); gap:0.8rem; margin-bottom:1rem;">']
+    for icon, title, desc in q6_items:
+        parts.append(
+            f'<div class="concept-card" style="text-align:center; border-left:none;'
+            f' border-top:3px solid #48b4a0; min-height:140px;">'
+            f'<div style="font-size:1.3rem; margin-bottom:0.2rem;">{icon}</div>'
+            f'<div class="concept-title" style="font-size:0.88rem;">{title}</div>'
+            f'<div class="concept-text" style="font-size:0.75rem;">{desc}</div></div>'
+        )
+    parts.append("</div>")
+    return "".join(parts)
+
+
+@st.cache_resource(max_entries=FRAGMENT_CACHE_MAX_ENTRIES, show_spinner=False)
+def render_q7_html(q7_items: list[tuple[str, str]]) -> str:
+    """設問7（自由意見）のカードを描画する。"""
+    parts = ['<div style="display:grid; grid-template-columns:repeat(2, 1fr); gap:0.6rem;">']
+    for title, desc in q7_items:
+        parts.append(
+            f'<div style="background:#f5fbfe; border-radius:8px; padding:0.8rem 1rem;'
+            f' border-left:3px solid #80deea;">'
+            f'<strong style="color:#0d3b66; font-size:0.88rem;">{title}</strong><br/>'
+            f'<span style="font-size:0.78rem; color:#607d8b;">{desc}</span></div>'
+        )
+    parts.append("</div>")
+    return "".join(parts)
+
+
+@st.cache_resource(max_entries=FRAGMENT_CACHE_MAX_ENTRIES, show_spinner=False)
+def render_assets_html(assets: list[tuple[str, str, str]]) -> str:
+    """主要文化資産のカードを描画する。"""
+    parts = ['<div style="display:grid; grid-template-columns:repeat(5, 1fr); gap:0.8rem; margin-bottom:1rem;">']
+    for icon, name, desc in assets:
+        parts.append(f"""
+            <div class="concept-card" style="text-align:center; min-height:200px; border-left:4px solid #48b4a0;">
+                <div style="font-size:2rem; margin-bottom:0.5rem;">{icon}</div>
+                <div class="concept-title">{name}</div>
+                <div class="concept-text">{desc}</div>
+            </div>""")
+    parts.append("</div>")
+    return "".join(parts)
+
+
+@st.cache_resource(max_entries=FRAGMENT_CACHE_MAX_ENTRIES, show_spinner=False)
+def render_features_html(features: list[tuple[str, str, str]]) -> str:
+    """せせらぎの本質的特性のカードを描画する。"""
+    parts = ['<div style="display:grid; grid-template-columns:repeat(3, 1fr); gap:1rem; margin-bottom:1rem;">']
+    for icon, title, text in features:
+        parts.append(f"""
+            <div class="concept-card">
+                <div class="concept-icon">{icon}</div>
+                <div class="concept-title">{title}</div>
+                <div class="concept-text">{text}</div>
+            </div>""")
+    parts.append("</div>")
+    return "".join(parts)
+
+
+@st.cache_resource(max_entries=FRAGMENT_CACHE_MAX_ENTRIES, show_spinner=False)
+def render_principles_html(principles: list[tuple[str, str, str, str, str, str]]) -> str:
+    """7つの行動原則のカードを描画する。"""
+    parts = []
+    for i, (icon, title, keyword, water, meaning, criteria) in enumerate(principles):
+        num = i + 1
+        bg = "linear-gradient(135deg, #e0f7fa 0%, #ffffff 60%)" if num % 2 == 1 else "#ffffff"
+        parts.append(f"""
+            <div style="display:grid; grid-template-columns:80px 1fr; gap:1rem;
+                        background:{bg}; border-radius:14px; padding:1.4rem 1.5rem;
+                        margin-bottom:0.8rem; box-shadow:0 2px 10px rgba(10,37,64,0.06);
+                        border-left:5px solid #1a6b8a;">
+                <div style="text-align:center;">
+                    <div style="font-size:2rem; margin-bottom:0.3rem;">{icon}</div>
+                    <div style="display:inline-block; background:linear-gradient(135deg, #0d3b66, #1a6b8a);
+                                color:#fff; font-size:0.75rem; font-weight:700;
+                                padding:0.2rem 0.7rem; border-radius:12px;">{keyword}</div>
+                </div>
+                <div>
+                    <div style="font-size:1.15rem; font-weight:900; color:#0a2540; margin-bottom:0.2rem;">
+                        {num}. {title}
+                    </div>
+                    <div style="font-size:0.78rem; color:#1a6b8a; font-weight:600; margin-bottom:0.4rem;">
+                        せせらぎの特性：{water}
+                    </div>
+                    <div style="font-size:0.88rem; color:#37474f; line-height:1.65; margin-bottom:0.5rem;">
+                        {meaning}
+                    </div>
+                    <div style="background:rgba(26,107,138,0.06); border-radius:8px; padding:0.5rem 0.8rem;
+                                font-size:0.82rem; color:#0d3b66; font-style:italic;">
+                        {criteria}
+                    </div>
+                </div>
+            </div>""")
+    return "".join(parts)
 
 
 # ============================================================
@@ -544,7 +948,10 @@ def render_sidebar_decoration() -> None:
 def page_vision_evolution() -> None:
     """50周年から80周年までのビジョン変遷を表示する。"""
 
+    page = PageBuffer()
+
     render_hero(
+        page,
         "ビジョンの変遷",
         "Vision Evolution: 50th - 80th Anniversary",
         "三島商工会議所が30年かけて紡いできた物語。再生から放出へ、内から外へ。",
@@ -583,37 +990,13 @@ def page_vision_evolution() -> None:
     ]
 
     # --- タイムラインカード ---
-    timeline_html = '<div style="display:grid; grid-template-columns:repeat(4, 1fr); gap:1rem; margin-bottom:1rem;">'
-    for m in milestones:
-        active_cls = " active" if m["active"] else ""
-        year_cls = " current" if m["active"] else ""
-        timeline_html += f"""
-            <div class="timeline-card{active_cls}">
-                <span class="timeline-year{year_cls}">{m['year']}</span>
-                <div class="timeline-theme">{m['theme']}</div>
-                <div class="timeline-stage">{m['stage']}</div>
-                <div class="timeline-desc">{m['desc']}</div>
-            </div>"""
-    timeline_html += "</div>"
-    st.markdown(timeline_html, unsafe_allow_html=True)
+    page.markdown(render_timeline_html(milestones))
 
     # --- 進化のストーリー ---
-    st.markdown(
-        """
-        <div class="section-divider-wave">
-            <svg viewBox="0 0 1200 32" preserveAspectRatio="none">
-                <path d="M0,16 C150,28 350,4 500,16 C650,28 850,4 1000,16 C1100,24 1150,8 1200,16"
-                      fill="none" stroke="#80deea" stroke-width="2"/>
-                <path d="M0,20 C200,8 400,30 600,18 C800,6 1000,28 1200,16"
-                      fill="none" stroke="#b2ebf2" stroke-width="1.5"/>
-            </svg>
-        </div>
-        """,
-        unsafe_allow_html=True,
-    )
+    render_section_divider(page)
 
-    st.markdown("### 進化のストーリー")
-    st.markdown("各周年ビジョンは、前のステージを土台に積み上げてきた。")
+    page.markdown("### 進化のストーリー")
+    page.markdown("各周年ビジョンは、前のステージを土台に積み上げてきた。")
 
     story_steps = [
         {
@@ -638,60 +1021,20 @@ def page_vision_evolution() -> None:
             "detail": "これまでの活動を未来へつなぎ、次の世代に受け渡すメッセージを発信。継承と連帯のステージ。",
         },
         {
-            "period": "80周年",
-            "name": "セセラギズム",
-            "stage": "放出・発信",
-            "arrow": "エネルギーを外へ",
-            "detail": "50周年の「せせらぎ」を継承しつつ、「イズム＝思想・運動」として外に発信するステージへ。つないで溜め込んできたエネルギー、人、想いを、外に向けて解き放つ。",
-        },
-    ]
-
-    story_html = ""
-    for i, step in enumerate(story_steps):
-        is_current = step["period"] == "80周年"
-        border_color = "#00897b" if is_current else "#1a6b8a"
-        bg = "linear-gradient(135deg, #e0f7fa 0%, #ffffff 50%)" if is_current else "#ffffff"
-        story_html += f"""
-        <div style="display:flex; gap:1rem; align-items:flex-start;">
-            <div style="flex-shrink:0; text-align:center; padding-top:0.6rem;">
-                <div style="display:inline-block; background:linear-gradient(135deg, {border_color}, #48b4a0);
-                            color:#fff; font-size:0.8rem; font-weight:700;
-                            padding:0.3rem 0.8rem; border-radius:16px;">{step['period']}</div>
-            </div>
-            <div style="flex:1; background:{bg}; border-left:4px solid {border_color};
-                        border-radius:0 12px 12px 0; padding:1.2rem 1.5rem; margin-bottom:0.3rem;
-                        box-shadow:0 1px 6px rgba(10,37,64,0.06);">
-                <div style="font-size:1.2rem; font-weight:900; color:#0a2540;">
-                    {step['name']} <span style="font-size:0.85rem; font-weight:600; color:{border_color};">― {step['stage']}</span>
-                </div>
-                <div style="font-size:0.85rem; color:#546e7a; margin-top:0.4rem; line-height:1.7;">
-                    {step['detail']}
-                </div>
-            </div>
-        </div>"""
-        if i < len(story_steps) - 1:
-            story_html += f"""
-            <div style="text-align:center; color:#1a6b8a; font-size:0.8rem; margin:0.1rem 0 0.1rem 0;">
-                ▼ {story_steps[i+1]['arrow']}
-            </div>"""
-    st.markdown(story_html, unsafe_allow_html=True)
+            "period": "80周年",
+            "name": "セセラギズム",
+            "stage": "放出・発信",
+            "arrow": "エネルギーを外へ",
+            "detail": "50周年の「せせらぎ」を継承しつつ、「イズム＝思想・運動」として外に発信するステージへ。つないで溜め込んできたエネルギー、人、想いを、外に向けて解き放つ。",
+        },
+    ]
+
+    page.markdown(render_story_html(story_steps))
 
     # --- 80周年のポジショニング ---
-    st.markdown(
-        """
-        <div class="section-divider-wave">
-            <svg viewBox="0 0 1200 32" preserveAspectRatio="none">
-                <path d="M0,16 C150,28 350,4 500,16 C650,28 850,4 1000,16 C1100,24 1150,8 1200,16"
-                      fill="none" stroke="#80deea" stroke-width="2"/>
-                <path d="M0,20 C200,8 400,30 600,18 C800,6 1000,28 1200,16"
-                      fill="none" stroke="#b2ebf2" stroke-width="1.5"/>
-            </svg>
-        </div>
-        """,
-        unsafe_allow_html=True,
-    )
+    render_section_divider(page)
 
-    st.markdown(
+    page.markdown(
         """
         <div class="narrative-box">
             <p>
@@ -703,9 +1046,9 @@ def page_vision_evolution() -> None:
                 つないだ次に来るもの ＝ 蓄積 → 放出、内 → 外、響かせる
             </span>
         </div>
-        """,
-        unsafe_allow_html=True,
+        """
     )
+    page.flush()
 
 
 # ============================================================
@@ -714,15 +1057,18 @@ def page_vision_evolution() -> None:
 def page_seseragism() -> None:
     """セセラギズムのコンセプト詳細を表示する。"""
 
+    page = PageBuffer()
+
     render_hero(
+        page,
         "セセラギズム",
         "SESERAGISM: せせらぎ + ism（主義・思想・運動）",
         "三島の行動原理を、水の流れに見立てて言語化した新概念。",
     )
 
     # --- コンセプト構造 ---
-    st.markdown("### コンセプトの構造")
-    st.markdown(
+    page.markdown("### コンセプトの構造")
+    page.markdown(
         """
         <div style="display:flex; align-items:center; justify-content:center; gap:0.5rem; flex-wrap:wrap; margin-bottom:1rem;">
             <div class="philosophy-card" style="flex:1; min-width:160px; max-width:260px;">
@@ -740,26 +1086,13 @@ def page_seseragism() -> None:
                 <div class="philosophy-desc">三島の行動原理<br/>水のように流れ、響かせる</div>
             </div>
         </div>
-        """,
-        unsafe_allow_html=True,
-    )
-
-    st.markdown(
         """
-        <div class="section-divider-wave">
-            <svg viewBox="0 0 1200 32" preserveAspectRatio="none">
-                <path d="M0,16 C150,28 350,4 500,16 C650,28 850,4 1000,16 C1100,24 1150,8 1200,16"
-                      fill="none" stroke="#80deea" stroke-width="2"/>
-                <path d="M0,20 C200,8 400,30 600,18 C800,6 1000,28 1200,16"
-                      fill="none" stroke="#b2ebf2" stroke-width="1.5"/>
-            </svg>
-        </div>
-        """,
-        unsafe_allow_html=True,
     )
 
+    render_section_divider(page)
+
     # --- セントラルフィロソフィー候補 ---
-    st.markdown("### セントラルフィロソフィー候補")
+    page.markdown("### セントラルフィロソフィー候補")
 
     philosophies = [
         ("候補 1", "水のように、自分から動く。"),
@@ -769,32 +1102,12 @@ def page_seseragism() -> None:
         ("候補 5", "一滴が、うねりになる。"),
     ]
 
-    phil_html = '<div style="display:grid; grid-template-columns:repeat(5, 1fr); gap:0.8rem; margin-bottom:1rem;">'
-    for num, text in philosophies:
-        phil_html += f"""
-            <div class="philosophy-card">
-                <div style="font-size:0.75rem; color:#78909c; margin-bottom:0.3rem;">{num}</div>
-                <div class="philosophy-title" style="font-size:1rem;">{text}</div>
-            </div>"""
-    phil_html += "</div>"
-    st.markdown(phil_html, unsafe_allow_html=True)
+    page.markdown(render_philosophy_html(philosophies))
 
-    st.markdown(
-        """
-        <div class="section-divider-wave">
-            <svg viewBox="0 0 1200 32" preserveAspectRatio="none">
-                <path d="M0,16 C150,28 350,4 500,16 C650,28 850,4 1000,16 C1100,24 1150,8 1200,16"
-                      fill="none" stroke="#80deea" stroke-width="2"/>
-                <path d="M0,20 C200,8 400,30 600,18 C800,6 1000,28 1200,16"
-                      fill="none" stroke="#b2ebf2" stroke-width="1.5"/>
-            </svg>
-        </div>
-        """,
-        unsafe_allow_html=True,
-    )
+    render_section_divider(page)
 
     # --- サブコピー候補 ---
-    st.markdown("### サブコピー候補")
+    page.markdown("### サブコピー候補")
 
     sub_copies = [
         "セセラギズム 〜 湧き上がれ、鳴り響け 〜",
@@ -802,26 +1115,12 @@ def page_seseragism() -> None:
         "セセラギズム -PULSE-",
     ]
 
-    subcopy_html = ""
-    for sc in sub_copies:
-        subcopy_html += f'<div class="subcopy-card"><p>{sc}</p></div>'
-    st.markdown(subcopy_html, unsafe_allow_html=True)
+    page.markdown(render_subcopy_html(sub_copies))
 
-    st.markdown(
-        """
-        <div class="section-divider-wave">
-            <svg viewBox="0 0 1200 32" preserveAspectRatio="none">
-                <path d="M0,16 C150,28 350,4 500,16 C650,28 850,4 1000,16 C1100,24 1150,8 1200,16"
-                      fill="none" stroke="#80deea" stroke-width="2"/>
-                <path d="M0,20 C200,8 400,30 600,18 C800,6 1000,28 1200,16"
-                      fill="none" stroke="#b2ebf2" stroke-width="1.5"/>
-            </svg>
-        </div>
-        """,
-        unsafe_allow_html=True,
-    )
+    render_section_divider(page)
 
     # --- 派生・代替案 ---
+    page.flush()
     with st.expander("派生・代替案を見る", expanded=False):
         alternatives = [
             ("ミシマリズム", "MISHIMAISM", "三島 + ism。地名を直接冠したバリエーション。"),
@@ -829,16 +1128,8 @@ def page_seseragism() -> None:
             ("MISHIMA SPRINGS", "ミシマスプリングス", "湧水（springs）と春（spring）の二重意味。"),
             ("ひらく三島", "ヒラクミシマ", "開く・拓く・啓く。シンプルで力強い日本語案。"),
         ]
-        alt_html = '<div style="display:grid; grid-template-columns:repeat(4, 1fr); gap:1rem;">'
-        for name, sub, desc in alternatives:
-            alt_html += f"""
-                <div class="concept-card" style="text-align:center; border-left:4px solid #80deea;">
-                    <div class="concept-title" style="font-size:1.1rem;">{name}</div>
-                    <div style="font-size:0.75rem; color:#90a4ae; margin-bottom:0.4rem;">{sub}</div>
-                    <div class="concept-text">{desc}</div>
-                </div>"""
-        alt_html += "</div>"
-        st.markdown(alt_html, unsafe_allow_html=True)
+        st.markdown(render_alternatives_html(alternatives), unsafe_allow_html=True)
+    page.flush()
 
 
 # ============================================================
@@ -847,45 +1138,40 @@ def page_seseragism() -> None:
 def page_workshop_analysis() -> None:
     """ワークショップ分析結果を表示する。"""
 
+    keyword_summary = keywords.workshop_keyword_summary()
+    team_keywords = data.workshop_teams()
+    # 議事録がないときは公表済みの値を表示する
+    extracted = "160+" if keyword_summary.extracted is None else f"{keyword_summary.extracted:,}"
+
+    page = PageBuffer()
+
     render_hero(
+        page,
         "ワークショップ分析",
         "Workshop Analysis",
-        "8チームのワークショップから浮かび上がった三島の本質。",
+        f"{len(team_keywords)}チームのワークショップから浮かび上がった三島の本質。",
     )
 
     # --- 概要メトリクス ---
-    st.markdown(
-        """
+    page.markdown(
+        f"""
         <div style="display:grid; grid-template-columns:repeat(2, 1fr); gap:1rem; margin-bottom:1.5rem;">
             <div class="stat-highlight">
-                <div class="stat-number">8</div>
+                <div class="stat-number">{len(team_keywords)}</div>
                 <div class="stat-label">参加チーム数</div>
             </div>
             <div class="stat-highlight">
-                <div class="stat-number">160+</div>
+                <div class="stat-number">{extracted}</div>
                 <div class="stat-label">抽出キーワード数</div>
             </div>
         </div>
-        """,
-        unsafe_allow_html=True,
-    )
-
-    st.markdown(
         """
-        <div class="section-divider-wave">
-            <svg viewBox="0 0 1200 32" preserveAspectRatio="none">
-                <path d="M0,16 C150,28 350,4 500,16 C650,28 850,4 1000,16 C1100,24 1150,8 1200,16"
-                      fill="none" stroke="#80deea" stroke-width="2"/>
-                <path d="M0,20 C200,8 400,30 600,18 C800,6 1000,28 1200,16"
-                      fill="none" stroke="#b2ebf2" stroke-width="1.5"/>
-            </svg>
-        </div>
-        """,
-        unsafe_allow_html=True,
     )
 
+    render_section_divider(page)
+
     # --- 象徴フレーズ ---
-    st.markdown(
+    page.markdown(
         """
         <div class="quote-block" style="font-size:1.15rem; text-align:center;">
             第7班が生み出した象徴フレーズ：<br/>
@@ -893,125 +1179,32 @@ def page_workshop_analysis() -> None:
             「ウェルカム・オープンな街、私たちの三島」
             </strong>
         </div>
-        """,
-        unsafe_allow_html=True,
-    )
-
-    st.markdown(
         """
-        <div class="section-divider-wave">
-            <svg viewBox="0 0 1200 32" preserveAspectRatio="none">
-                <path d="M0,16 C150,28 350,4 500,16 C650,28 850,4 1000,16 C1100,24 1150,8 1200,16"
-                      fill="none" stroke="#80deea" stroke-width="2"/>
-                <path d="M0,20 C200,8 400,30 600,18 C800,6 1000,28 1200,16"
-                      fill="none" stroke="#b2ebf2" stroke-width="1.5"/>
-            </svg>
-        </div>
-        """,
-        unsafe_allow_html=True,
     )
 
-    # --- キーワード頻度（棒グラフ） ---
-    st.markdown("### キーワード頻度分析")
-    st.markdown("全チームの議論から抽出されたキーワードの出現頻度。")
-
-    keyword_data = pd.DataFrame(
-        {
-            "キーワード": [
-                "オープン", "ウェルカム", "受け入れる", "つながり", "水",
-                "歴史", "人の温かさ", "食", "自然", "チャレンジ",
-            ],
-            "出現回数": [28, 24, 22, 18, 16, 14, 12, 10, 9, 7],
-        }
-    )
+    render_section_divider(page)
 
-    # 色のグラデーション
-    colors = [
-        "#0d3b66", "#115e82", "#1a6b8a", "#238d96", "#2baa9e",
-        "#48b4a0", "#66c2a5", "#80deea", "#a0e4d0", "#b2ebf2",
-    ]
+    # --- キーワード頻度（棒グラフ） ---
+    page.markdown("### キーワード頻度分析")
+    page.markdown("全チームの議論から抽出されたキーワードの出現頻度。")
 
-    fig_keywords = go.Figure(
-        go.Bar(
-            x=keyword_data["出現回数"],
-            y=keyword_data["キーワード"],
-            orientation="h",
-            marker=dict(
-                color=colors,
-                line=dict(width=0),
-                cornerradius=6,
-            ),
-            text=keyword_data["出現回数"],
-            textposition="outside",
-            textfont=dict(size=13, color="#0a2540", family="Noto Sans JP"),
-            hovertemplate="<b>%{y}</b><br>出現回数: %{x}回<extra></extra>",
-        )
-    )
-    fig_keywords.update_layout(
-        title=dict(text="ワークショップ キーワード頻度", font=dict(size=16, color="#0a2540")),
-        xaxis=dict(title="出現回数", showgrid=True, gridcolor="#e0f2f1", range=[0, 34]),
-        yaxis=dict(autorange="reversed", tickfont=dict(size=13)),
-        height=450,
-        margin=dict(l=120, r=40, t=60, b=40),
-        plot_bgcolor="#fafffe",
-        paper_bgcolor="#ffffff",
-        font=dict(family="Noto Sans JP"),
-    )
-    st.plotly_chart(fig_keywords, width="stretch")
+    fig_keywords = build_keyword_figure(keyword_summary.frequencies)
+    page.flush()
+    plotly_chart("keywords", fig_keywords)
 
-    st.markdown(
-        """
-        <div class="section-divider-wave">
-            <svg viewBox="0 0 1200 32" preserveAspectRatio="none">
-                <path d="M0,16 C150,28 350,4 500,16 C650,28 850,4 1000,16 C1100,24 1150,8 1200,16"
-                      fill="none" stroke="#80deea" stroke-width="2"/>
-                <path d="M0,20 C200,8 400,30 600,18 C800,6 1000,28 1200,16"
-                      fill="none" stroke="#b2ebf2" stroke-width="1.5"/>
-            </svg>
-        </div>
-        """,
-        unsafe_allow_html=True,
-    )
+    render_section_divider(page)
 
     # --- 変えたくない三島の良さ（レーダーチャート） ---
-    st.markdown("### 変えたくない三島の良さ")
-    st.markdown("ワークショップで「守りたい」と挙がった6つの価値カテゴリ。")
+    page.markdown("### 変えたくない三島の良さ")
+    page.markdown("ワークショップで「守りたい」と挙がった6つの価値カテゴリ。")
 
-    categories = ["水", "人", "歴史", "規模感", "食", "立地"]
-    values = [95, 88, 82, 75, 70, 78]
-    # レーダーは閉じるために先頭を末尾に追加
-    categories_closed = categories + [categories[0]]
-    values_closed = values + [values[0]]
-
-    fig_radar = go.Figure()
-    fig_radar.add_trace(
-        go.Scatterpolar(
-            r=values_closed,
-            theta=categories_closed,
-            fill="toself",
-            fillcolor="rgba(26,107,138,0.18)",
-            line=dict(color="#1a6b8a", width=2.5),
-            marker=dict(size=8, color="#0d3b66"),
-            name="重要度スコア",
-            hovertemplate="<b>%{theta}</b><br>重要度: %{r}<extra></extra>",
-        )
-    )
-    fig_radar.update_layout(
-        polar=dict(
-            radialaxis=dict(visible=True, range=[0, 100], showticklabels=True, tickfont=dict(size=10)),
-            angularaxis=dict(tickfont=dict(size=14, color="#0a2540")),
-            bgcolor="#fafffe",
-        ),
-        height=420,
-        margin=dict(l=60, r=60, t=40, b=40),
-        paper_bgcolor="#ffffff",
-        font=dict(family="Noto Sans JP"),
-        showlegend=False,
-    )
-    st.plotly_chart(fig_radar, use_container_width=True)
+    df_values = data.workshop_values()
+    fig_radar = build_radar_figure(df_values["カテゴリ"].tolist(), df_values["重要度"].tolist())
+    page.flush()
+    plotly_chart("radar", fig_radar)
 
     # カテゴリ詳細
-    st.markdown("#### カテゴリ詳細")
+    page.markdown("#### カテゴリ詳細")
     cat_details = [
         ("💧 水", "湧水・源兵衛川・柿田川。三島の原点。"),
         ("👥 人", "温かさ・オープンさ。よそ者を受け入れるDNA。"),
@@ -1020,70 +1213,47 @@ def page_workshop_analysis() -> None:
         ("🍽 食", "うなぎ・みしまコロッケ。食文化の豊かさ。"),
         ("📍 立地", "東京から1時間。富士山・伊豆・箱根への玄関口。"),
     ]
-    cat_html = '<div style="display:grid; grid-template-columns:repeat(3, 1fr); gap:0.8rem;">'
-    for label, detail in cat_details:
-        cat_html += f"""
-            <div style="margin-bottom:0.4rem;">
-                <strong style="color:#0d3b66;">{label}</strong><br/>
-                <span style="font-size:0.82rem; color:#607d8b;">{detail}</span>
-            </div>"""
-    cat_html += "</div>"
-    st.markdown(cat_html, unsafe_allow_html=True)
+    page.markdown(render_category_details_html(cat_details))
 
-    st.markdown(
-        """
-        <div class="section-divider-wave">
-            <svg viewBox="0 0 1200 32" preserveAspectRatio="none">
-                <path d="M0,16 C150,28 350,4 500,16 C650,28 850,4 1000,16 C1100,24 1150,8 1200,16"
-                      fill="none" stroke="#80deea" stroke-width="2"/>
-                <path d="M0,20 C200,8 400,30 600,18 C800,6 1000,28 1200,16"
-                      fill="none" stroke="#b2ebf2" stroke-width="1.5"/>
-            </svg>
-        </div>
-        """,
-        unsafe_allow_html=True,
-    )
+    render_section_divider(page)
 
-    # --- 8チーム共通キーワード分析 ---
-    st.markdown("### 8チーム共通キーワード分析")
-    st.markdown("各チームから抽出されたキーワードを分類。共通項が浮かび上がる。")
-
-    teams = [
-        ("第1班", "水・オープン・歴史・つながり"),
-        ("第2班", "ウェルカム・チャレンジ・食・自然"),
-        ("第3班", "受け入れる・水・人の温かさ・規模感"),
-        ("第4班", "オープン・つながり・歴史・立地"),
-        ("第5班", "ウェルカム・水・自然・人の温かさ"),
-        ("第6班", "オープン・受け入れる・食・チャレンジ"),
-        ("第7班", "ウェルカム・オープン・つながり・水"),
-        ("第8班", "受け入れる・歴史・人の温かさ・つながり"),
-    ]
+    # --- チーム共通キーワード分析 ---
+    page.markdown(f"### {len(team_keywords)}チーム共通キーワード分析")
+    page.markdown("各チームから抽出されたキーワードを分類。共通項が浮かび上がる。")
 
-    teams_html = '<div style="display:grid; grid-template-columns:repeat(4, 1fr); gap:0.8rem; margin-bottom:1rem;">'
-    for name, kw in teams:
-        teams_html += f"""
-            <div class="team-card">
-                <div class="team-name">{name}</div>
-                <div class="team-keywords">{kw}</div>
-            </div>"""
-    teams_html += "</div>"
-    st.markdown(teams_html, unsafe_allow_html=True)
+    teams = [(team, "・".join(words)) for team, words in team_keywords]
+    page.markdown(render_teams_html(teams))
+
+    # --- キーワード共起 ---
+    page.markdown("#### キーワードの共起")
+    page.markdown("2つのキーワードが同じ班で挙がった数。対角はそのキーワードを挙げた班の数。")
+    fig_cooc = build_cooccurrence_figure(cooccurrence.team_cooccurrence())
+    page.flush()
+    plotly_chart("cooc", fig_cooc)
+
+    # 「開かれた」系のキーワードが何班に現れたかを数えて、まとめの文に使う
+    openness = ("オープン", "ウェルカム", "受け入れる")
+    covered = len(cooccurrence.coverage(cooccurrence.team_incidence(), openness))
+    if covered == len(team_keywords):
+        common, note = f"{covered}チームすべてに共通する", "（どの班にもいずれかが登場）"
+    else:
+        common, note = f"{len(team_keywords)}チーム中{covered}チームに共通する", ""
+    openness_html = "".join(f"「{word}」" for word in openness)
 
     # --- 共通キーワードまとめ ---
-    st.markdown("")
-    st.markdown(
-        """
+    page.markdown(
+        f"""
         <div class="narrative-box">
             <p>
-                8チームすべてに共通するのは <strong>「オープン」「ウェルカム」「受け入れる」</strong> というキーワード。<br/>
+                {common}のは <strong>{openness_html}</strong> というキーワード{note}。<br/>
                 三島の本質は「開かれた水の街」であり、それは宿場町としてよそ者を迎え入れてきた
                 歴史的DNAに根差している。<br/>
                 この行動原理を <strong>セセラギズム</strong> として言語化し、次の10年の指針とする。
             </p>
         </div>
-        """,
-        unsafe_allow_html=True,
+        """
     )
+    page.flush()
 
 
 # ============================================================
@@ -1092,38 +1262,43 @@ def page_workshop_analysis() -> None:
 def page_survey_analysis() -> None:
     """地域振興ビジョン策定アンケートの分析結果を表示する。"""
 
+    scores = survey.survey_scores()
+    summary = survey.survey_summary()
+
+    page = PageBuffer()
+
     render_hero(
+        page,
         "アンケート分析",
         "Survey Analysis",
-        "まちづくり関係者・市民77名を対象としたオンラインアンケートの分析レポート。",
+        f"まちづくり関係者・市民{summary.respondents}名を対象としたオンラインアンケートの分析レポート。",
     )
 
     # --- 調査概要 ---
-    st.markdown("### 調査概要")
-    st.markdown(
-        """
+    page.markdown("### 調査概要")
+    page.markdown(
+        f"""
         <div style="display:grid; grid-template-columns:repeat(4, 1fr); gap:1rem; margin-bottom:1.5rem;">
             <div class="stat-highlight">
-                <div class="stat-number">77名</div>
+                <div class="stat-number">{summary.respondents}名</div>
                 <div class="stat-label">回答者数</div>
             </div>
             <div class="stat-highlight">
-                <div class="stat-number">6.4</div>
+                <div class="stat-number">{summary.mean:.1f}</div>
                 <div class="stat-label">平均スコア（10点満点）</div>
             </div>
             <div class="stat-highlight">
-                <div class="stat-number">46名</div>
+                <div class="stat-number">{summary.residents}名</div>
                 <div class="stat-label">三島市在住者</div>
             </div>
             <div class="stat-highlight">
-                <div class="stat-number">38年</div>
+                <div class="stat-number">{summary.mean_residency_years:.0f}年</div>
                 <div class="stat-label">平均三島市在住年数</div>
             </div>
         </div>
-        """,
-        unsafe_allow_html=True,
+        """
     )
-    st.markdown(
+    page.markdown(
         """
         <div style="background:#f5fbfe; border-radius:10px; padding:1rem 1.5rem; margin-bottom:1.5rem;
                     font-size:0.85rem; color:#546e7a; border-left:4px solid #80deea;">
@@ -1131,87 +1306,39 @@ def page_survey_analysis() -> None:
             <strong>対象：</strong>【当所】まちづくり委員、部会幹事、女性会、青年部<br/>
             　　　　【関係団体】三島商店街連盟、三島市観光協会会員、JC など
         </div>
-        """,
-        unsafe_allow_html=True,
-    )
-
-    st.markdown(
         """
-        <div class="section-divider-wave">
-            <svg viewBox="0 0 1200 32" preserveAspectRatio="none">
-                <path d="M0,16 C150,28 350,4 500,16 C650,28 850,4 1000,16 C1100,24 1150,8 1200,16"
-                      fill="none" stroke="#80deea" stroke-width="2"/>
-                <path d="M0,20 C200,8 400,30 600,18 C800,6 1000,28 1200,16"
-                      fill="none" stroke="#b2ebf2" stroke-width="1.5"/>
-            </svg>
-        </div>
-        """,
-        unsafe_allow_html=True,
     )
 
-    # --- 設問1: スコア分布 ---
-    st.markdown("### 設問1：地域活性化の現状評価")
-    st.markdown("「地域活性化について、現在の三島は何点だと思いますか？」（10点満点）")
+    render_section_divider(page)
 
-    score_labels = ["2点", "3点", "4点", "5点", "6点", "7点", "8点", "9点"]
-    score_counts = [1, 5, 2, 13, 11, 23, 20, 2]
-    score_colors = [
-        "#e57373", "#ef9a9a", "#ffcc80", "#fff59d",
-        "#c5e1a5", "#81c784", "#4caf50", "#2e7d32",
-    ]
+    # --- 設問1: スコア分布 ---
+    page.markdown("### 設問1：地域活性化の現状評価")
+    page.markdown("「地域活性化について、現在の三島は何点だと思いますか？」（10点満点）")
 
-    fig_scores = go.Figure(
-        go.Bar(
-            x=score_labels, y=score_counts,
-            marker=dict(color=score_colors, cornerradius=6),
-            text=score_counts, textposition="outside",
-            textfont=dict(size=13, color="#0a2540", family="Noto Sans JP"),
-            hovertemplate="<b>%{x}</b><br>回答数: %{y}名<extra></extra>",
-        )
-    )
-    fig_scores.update_layout(
-        xaxis=dict(title="評価（点）"),
-        yaxis=dict(title="回答数（名）", gridcolor="#e0f2f1"),
-        height=350,
-        margin=dict(l=50, r=30, t=20, b=50),
-        plot_bgcolor="#fafffe",
-        paper_bgcolor="#ffffff",
-        font=dict(family="Noto Sans JP"),
-    )
-    st.plotly_chart(fig_scores, use_container_width=True)
+    score_labels = [f"{score}点" for score in scores["点数"]]
+    fig_scores = build_score_figure(score_labels, scores["回答数"].tolist())
+    page.flush()
+    plotly_chart("scores", fig_scores)
 
-    st.markdown(
-        """
+    page.markdown(
+        f"""
         <div class="metric-card">
             <div class="metric-label">スコア分析</div>
-            <div class="metric-value" style="font-size:1.3rem;">最頻値 7点 ・ 平均 6.4点</div>
+            <div class="metric-value" style="font-size:1.3rem;">最頻値 {summary.mode}点 ・ 平均 {summary.mean:.1f}点</div>
             <div class="metric-desc">
-                回答者の約58%が7点以上と評価。「イベントや活動が活発」「プレイヤーが増えている」と
+                回答者の約{summary.high_share_pct:.0f}%が{summary.high_threshold}点以上と評価。「イベントや活動が活発」「プレイヤーが増えている」と
                 現状を肯定的に捉える声が多い一方、「一部エリアに限られている」「空き店舗が目立つ」
                 など改善余地を指摘する声も。
             </div>
         </div>
-        """,
-        unsafe_allow_html=True,
-    )
-
-    st.markdown(
         """
-        <div class="section-divider-wave">
-            <svg viewBox="0 0 1200 32" preserveAspectRatio="none">
-                <path d="M0,16 C150,28 350,4 500,16 C650,28 850,4 1000,16 C1100,24 1150,8 1200,16"
-                      fill="none" stroke="#80deea" stroke-width="2"/>
-                <path d="M0,20 C200,8 400,30 600,18 C800,6 1000,28 1200,16"
-                      fill="none" stroke="#b2ebf2" stroke-width="1.5"/>
-            </svg>
-        </div>
-        """,
-        unsafe_allow_html=True,
     )
 
+    render_section_divider(page)
+
     # --- 設問1・2: 評価の内訳 ---
-    st.markdown("### 設問1・2：評価の内訳")
-    st.markdown(
+    page.markdown("### 設問1・2：評価の内訳")
+    page.markdown(
         """
         <div style="display:grid; grid-template-columns:repeat(2, 1fr); gap:1.5rem; margin-bottom:1rem;">
             <div>
@@ -1245,26 +1372,40 @@ def page_survey_analysis() -> None:
                     <div class="concept-text">ビジョンを示し行動するリーダー役への期待が大きい</div></div>
             </div>
         </div>
-        """,
-        unsafe_allow_html=True,
+        """
     )
 
-    st.markdown(
-        """
-        <div class="section-divider-wave">
-            <svg viewBox="0 0 1200 32" preserveAspectRatio="none">
-                <path d="M0,16 C150,28 350,4 500,16 C650,28 850,4 1000,16 C1100,24 1150,8 1200,16"
-                      fill="none" stroke="#80deea" stroke-width="2"/>
-                <path d="M0,20 C200,8 400,30 600,18 C800,6 1000,28 1200,16"
-                      fill="none" stroke="#b2ebf2" stroke-width="1.5"/>
-            </svg>
+    # --- 若者・子育て世代の流出（年齢別の人口推計） ---
+    low, high = cohort.YOUTH_AGES
+    youth = cohort.youth_outflow_paths()
+    first, target = youth.iloc[0], youth.iloc[10]  # 基準年と10年後
+    page.markdown("#### 年齢別の推計で見る「若者・子育て世代の流出」")
+    page.markdown(
+        f"男女・各歳別の人口に生残率・出生率・転出入の率を当てはめた推計（コーホート要因法）。"
+        f"{low}〜{high - 1}歳の転出超過だけを変えた場合の比較。"
+    )
+    fig_youth = build_youth_figure(youth, ("現状の流出が続く場合", "流出が半減した場合", "流出がなくなった場合"))
+    page.flush()
+    plotly_chart("youth", fig_youth)
+
+    page.markdown(
+        f"""
+        <div class="metric-card">
+            <div class="metric-label">{low}〜{high - 1}歳の人口（{int(first["年"])}年 → {int(target["年"])}年）</div>
+            <div class="metric-value" style="font-size:1.3rem;">{first["現状"]:,}人 → {target["現状"]:,}人（{(target["現状"] / first["現状"] - 1) * 100:+.0f}%）</div>
+            <div class="metric-desc">
+                現状の転出超過が続いた場合の推計。流出が半減すれば{int(target["年"])}年に{target["半減"]:,}人
+                （{target["半減"] - target["現状"]:+,}人）、なくなれば{target["なし"]:,}人（{target["なし"] - target["現状"]:+,}人）。
+                子どもの数にも波及するため、定住促進の効果は世代をまたいで現れる。
+            </div>
         </div>
-        """,
-        unsafe_allow_html=True,
+        """
     )
 
+    render_section_divider(page)
+
     # --- 設問4: 変えたくない三島の良さ ---
-    st.markdown("### 設問4：変えたくない三島の良さ")
+    page.markdown("### 設問4：変えたくない三島の良さ")
 
     q4_items = [
         ("\U0001f4a7", "水と緑の恵み", "湧水やせせらぎ、緑豊かな環境を「何よりも守りたい」とする意見が圧倒的"),
@@ -1278,44 +1419,21 @@ def page_survey_analysis() -> None:
         ("\U0001f476", "子育てのしやすさ", "自然環境と教育環境のバランスをファミリー層が評価"),
         ("\u2764\ufe0f", "地元への愛着", "「三島が好き」「ずっと住みたい」\u2014 住民の地元愛が最大の財産"),
     ]
-    q4_html = '<div style="display:grid; grid-template-columns:repeat(5, 1fr); gap:0.8rem; margin-bottom:1rem;">'
-    for icon, title, desc in q4_items:
-        q4_html += (
-            f'<div class="concept-card" style="text-align:center; border-left:none;'
-            f' border-top:3px solid #26c6da; min-height:150px;">'
-            f'<div style="font-size:1.4rem; margin-bottom:0.3rem;">{icon}</div>'
-            f'<div class="concept-title" style="font-size:0.88rem;">{title}</div>'
-            f'<div class="concept-text" style="font-size:0.75rem;">{desc}</div></div>'
-        )
-    q4_html += "</div>"
-    st.markdown(q4_html, unsafe_allow_html=True)
+    page.markdown(render_q4_html(q4_items))
 
-    st.markdown(
+    page.markdown(
         """
         <div class="quote-block" style="text-align:center;">
             <strong>「水と緑」が圧倒的1位</strong>。続いて歴史・文化、人の温かさ、コンパクトさ。<br/>
             三島のアイデンティティは <strong>「水」×「人」×「歴史」</strong> の三層構造。
         </div>
-        """,
-        unsafe_allow_html=True,
-    )
-
-    st.markdown(
         """
-        <div class="section-divider-wave">
-            <svg viewBox="0 0 1200 32" preserveAspectRatio="none">
-                <path d="M0,16 C150,28 350,4 500,16 C650,28 850,4 1000,16 C1100,24 1150,8 1200,16"
-                      fill="none" stroke="#80deea" stroke-width="2"/>
-                <path d="M0,20 C200,8 400,30 600,18 C800,6 1000,28 1200,16"
-                      fill="none" stroke="#b2ebf2" stroke-width="1.5"/>
-            </svg>
-        </div>
-        """,
-        unsafe_allow_html=True,
     )
 
+    render_section_divider(page)
+
     # --- 設問3: 20年後の理想 ---
-    st.markdown("### 設問3：20年後の理想の三島")
+    page.markdown("### 設問3：20年後の理想の三島")
 
     q3_items = [
         ("\U0001f46a", "多世代共生のまち", "高齢者から子どもまでが支え合うコミュニティ"),
@@ -1329,33 +1447,12 @@ def page_survey_analysis() -> None:
         ("\U0001f4c9", "人口減少対応型社会", "住民一人ひとりが豊かに暮らせる社会モデル"),
         ("\U0001f60a", "顔の見える関係づくり", "「みんな顔馴染み」\u2014 温かな関係性の重視"),
     ]
-    q3_html = '<div style="display:grid; grid-template-columns:repeat(5, 1fr); gap:0.8rem; margin-bottom:1rem;">'
-    for icon, title, desc in q3_items:
-        q3_html += (
-            f'<div class="philosophy-card" style="min-height:auto; padding:1rem;">'
-            f'<div style="font-size:1.3rem;">{icon}</div>'
-            f'<div class="philosophy-title" style="font-size:0.85rem; margin-top:0.3rem;">{title}</div>'
-            f'<div class="philosophy-desc" style="font-size:0.73rem;">{desc}</div></div>'
-        )
-    q3_html += "</div>"
-    st.markdown(q3_html, unsafe_allow_html=True)
+    page.markdown(render_q3_html(q3_items))
 
-    st.markdown(
-        """
-        <div class="section-divider-wave">
-            <svg viewBox="0 0 1200 32" preserveAspectRatio="none">
-                <path d="M0,16 C150,28 350,4 500,16 C650,28 850,4 1000,16 C1100,24 1150,8 1200,16"
-                      fill="none" stroke="#80deea" stroke-width="2"/>
-                <path d="M0,20 C200,8 400,30 600,18 C800,6 1000,28 1200,16"
-                      fill="none" stroke="#b2ebf2" stroke-width="1.5"/>
-            </svg>
-        </div>
-        """,
-        unsafe_allow_html=True,
-    )
+    render_section_divider(page)
 
     # --- 設問5: もっと良くなるには ---
-    st.markdown("### 設問5：三島がもっと良くなるには")
+    page.markdown("### 設問5：三島がもっと良くなるには")
 
     q5_items = [
         ("\U0001f4bc", "若者の定着支援", "就職・起業・住宅など地元で暮らし続けられる環境整備"),
@@ -1369,34 +1466,12 @@ def page_survey_analysis() -> None:
         ("\U0001f3e2", "企業・働く場の魅力化", "地元企業の魅力発信や多様な働き方の推進"),
         ("\U0001f3f7\ufe0f", "三島ブランドの確立", "「三島らしさ」を観光・産業・文化の軸として明確に"),
     ]
-    q5_html = '<div style="display:grid; grid-template-columns:repeat(5, 1fr); gap:0.8rem; margin-bottom:1rem;">'
-    for icon, title, desc in q5_items:
-        q5_html += (
-            f'<div class="concept-card" style="text-align:center; border-left:none;'
-            f' border-top:3px solid #e57373; min-height:140px;">'
-            f'<div style="font-size:1.3rem; margin-bottom:0.2rem;">{icon}</div>'
-            f'<div class="concept-title" style="font-size:0.88rem;">{title}</div>'
-            f'<div class="concept-text" style="font-size:0.75rem;">{desc}</div></div>'
-        )
-    q5_html += "</div>"
-    st.markdown(q5_html, unsafe_allow_html=True)
+    page.markdown(render_q5_html(q5_items))
 
-    st.markdown(
-        """
-        <div class="section-divider-wave">
-            <svg viewBox="0 0 1200 32" preserveAspectRatio="none">
-                <path d="M0,16 C150,28 350,4 500,16 C650,28 850,4 1000,16 C1100,24 1150,8 1200,16"
-                      fill="none" stroke="#80deea" stroke-width="2"/>
-                <path d="M0,20 C200,8 400,30 600,18 C800,6 1000,28 1200,16"
-                      fill="none" stroke="#b2ebf2" stroke-width="1.5"/>
-            </svg>
-        </div>
-        """,
-        unsafe_allow_html=True,
-    )
+    render_section_divider(page)
 
     # --- 設問6: 商工会議所への期待 ---
-    st.markdown("### 設問6：三島商工会議所に期待すること")
+    page.markdown("### 設問6：三島商工会議所に期待すること")
 
     q6_items = [
         ("\U0001f451", "地域のリーダー役", "まちの未来を導くリーダーシップを発揮"),
@@ -1410,33 +1485,12 @@ def page_survey_analysis() -> None:
         ("\U0001f3aa", "地域イベントの後押し", "市民や商店街のイベントへのサポート強化"),
         ("\U0001f932", "共創のプラットフォーム", "市民・企業・行政が対等に議論できる場の提供"),
     ]
-    q6_html = '<div style="display:grid; grid-template-columns:repeat(5, 1fr); gap:0.8rem; margin-bottom:1rem;">'
-    for icon, title, desc in q6_items:
-        q6_html += (
-            f'<div class="concept-card" style="text-align:center; border-left:none;'
-            f' border-top:3px solid #48b4a0; min-height:140px;">'
-            f'<div style="font-size:1.3rem; margin-bottom:0.2rem;">{icon}</div>'
-            f'<div class="concept-title" style="font-size:0.88rem;">{title}</div>'
-            f'<div class="concept-text" style="font-size:0.75rem;">{desc}</div></div>'
-        )
-    q6_html += "</div>"
-    st.markdown(q6_html, unsafe_allow_html=True)
+    page.markdown(render_q6_html(q6_items))
 
-    st.markdown(
-        """
-        <div class="section-divider-wave">
-            <svg viewBox="0 0 1200 32" preserveAspectRatio="none">
-                <path d="M0,16 C150,28 350,4 500,16 C650,28 850,4 1000,16 C1100,24 1150,8 1200,16"
-                      fill="none" stroke="#80deea" stroke-width="2"/>
-                <path d="M0,20 C200,8 400,30 600,18 C800,6 1000,28 1200,16"
-                      fill="none" stroke="#b2ebf2" stroke-width="1.5"/>
-            </svg>
-        </div>
-        """,
-        unsafe_allow_html=True,
-    )
+    render_section_divider(page)
 
     # --- 設問7: 自由意見 ---
+    page.flush()
     with st.expander("設問7：自由意見", expanded=False):
         q7_items = [
             ("市民の声を反映して", "アンケートを一過性で終わらせず政策に反映を"),
@@ -1450,37 +1504,16 @@ def page_survey_analysis() -> None:
             ("安心・安全な暮らし", "防災・防犯・医療の基盤整備"),
             ("持続可能なまち経営", "変化を恐れずリーダーシップと協働体制を"),
         ]
-        q7_html = '<div style="display:grid; grid-template-columns:repeat(2, 1fr); gap:0.6rem;">'
-        for title, desc in q7_items:
-            q7_html += (
-                f'<div style="background:#f5fbfe; border-radius:8px; padding:0.8rem 1rem;'
-                f' border-left:3px solid #80deea;">'
-                f'<strong style="color:#0d3b66; font-size:0.88rem;">{title}</strong><br/>'
-                f'<span style="font-size:0.78rem; color:#607d8b;">{desc}</span></div>'
-            )
-        q7_html += "</div>"
-        st.markdown(q7_html, unsafe_allow_html=True)
+        st.markdown(render_q7_html(q7_items), unsafe_allow_html=True)
 
-    st.markdown(
-        """
-        <div class="section-divider-wave">
-            <svg viewBox="0 0 1200 32" preserveAspectRatio="none">
-                <path d="M0,16 C150,28 350,4 500,16 C650,28 850,4 1000,16 C1100,24 1150,8 1200,16"
-                      fill="none" stroke="#80deea" stroke-width="2"/>
-                <path d="M0,20 C200,8 400,30 600,18 C800,6 1000,28 1200,16"
-                      fill="none" stroke="#b2ebf2" stroke-width="1.5"/>
-            </svg>
-        </div>
-        """,
-        unsafe_allow_html=True,
-    )
+    render_section_divider(page)
 
     # --- ナラティブまとめ ---
-    st.markdown(
-        """
+    page.markdown(
+        f"""
         <div class="narrative-box">
             <p>
-                77名のまちづくり関係者・市民の声から、三島の本質が鮮明に浮かび上がった。<br/><br/>
+                {summary.respondents}名のまちづくり関係者・市民の声から、三島の本質が鮮明に浮かび上がった。<br/><br/>
                 <strong>「変えたくない良さ」の第1位は圧倒的に「水と緑」</strong>。
                 続いて歴史・文化、人の温かさ、コンパクトさと続く。
                 三島のアイデンティティは <strong>水 × 人 × 歴史</strong> の三層構造にある。<br/><br/>
@@ -1496,9 +1529,9 @@ def page_survey_analysis() -> None:
                 水のアイデンティティ × 外への発信 ＝ セセラギズムの裏付け
             </span>
         </div>
-        """,
-        unsafe_allow_html=True,
+        """
     )
+    page.flush()
 
 
 # ============================================================
@@ -1507,217 +1540,112 @@ def page_survey_analysis() -> None:
 def page_statistics() -> None:
     """三島市の統計データを表示する。"""
 
+    page = PageBuffer()
+
     render_hero(
+        page,
         "三島市統計データ",
         "Mishima City Statistics",
         "人口・観光・産業から見る三島の現在地。データが示す課題と可能性。",
     )
 
     # --- 人口推移 ---
-    st.markdown("### 人口推移と将来推計")
-    st.markdown("住民基本台帳ベース（日本人住民）。2026年以降は近年の減少率をもとにした推計。")
-
-    # 実績データ（2000-2025）出典: jp.gdfreak.com / 住民基本台帳
-    actual_years = list(range(2000, 2026))
-    actual_pop = [
-        110_300, 110_700, 110_500, 111_000, 111_300,  # 2000-2004
-        111_600, 112_100, 112_200, 111_900, 111_300,  # 2005-2009
-        110_800, 110_600, 110_400, 110_200, 109_900,  # 2010-2014
-        109_500, 109_000, 108_400, 108_000, 107_400,  # 2015-2019
-        106_800, 106_200, 105_500, 104_800, 104_100, 103_359,  # 2020-2025
-    ]
-
-    # 将来推計（2026-2035）近年の減少率 約-1.0〜-1.3% をベースに推計
-    projected_years = list(range(2026, 2036))
-    projected_pop = []
-    last = 103_359
-    for rate in [-1.2, -1.2, -1.1, -1.1, -1.0, -1.0, -0.9, -0.9, -0.8, -0.8]:
-        last = round(last * (1 + rate / 100))
-        projected_pop.append(last)
-
-    fig_pop = go.Figure()
-
-    # 実績（実線）
-    fig_pop.add_trace(
-        go.Scatter(
-            x=actual_years, y=actual_pop,
-            name="実績",
-            mode="lines+markers",
-            line=dict(color="#1a6b8a", width=2.5),
-            marker=dict(size=4, color="#0d3b66"),
-            hovertemplate="<b>%{x}年</b><br>人口: %{y:,.0f}人（実績）<extra></extra>",
+    page.markdown("### 人口推移と将来推計")
+    base = metrics.population_summary()
+    page.markdown(
+        f"住民基本台帳ベース（日本人住民）。{base.first_projected_year}年以降は"
+        f"年率{base.rate_low:+.1f}〜{base.rate_high:+.1f}%の増減率を仮定した推計（下の条件で変えられる）。"
+        "点線は男女・各歳別の人口に生残率・出生率・転出入の率を当てはめた年齢別の推計"
+        "（コーホート要因法。条件を変えても基準の率のまま）。"
+    )
+
+    # 政策シナリオの比較用に、増減率の上乗せとばらつきを変えられるようにする
+    page.flush()
+    with st.expander("推計の条件を変える", expanded=False):
+        shift = st.slider(
+            "年率の上乗せ（ポイント）", min_value=-1.0, max_value=1.0, value=0.0, step=0.1,
+            help="移住促進などで減少率がどれだけ改善（悪化）するかの仮定。各年の増減率に加える。",
         )
-    )
-    # 推計（破線）— 実績の最終年を起点にして接続
-    fig_pop.add_trace(
-        go.Scatter(
-            x=[actual_years[-1]] + projected_years,
-            y=[actual_pop[-1]] + projected_pop,
-            name="推計",
-            mode="lines+markers",
-            line=dict(color="#e57373", width=2.5, dash="dash"),
-            marker=dict(size=4, color="#e57373", symbol="diamond"),
-            hovertemplate="<b>%{x}年</b><br>人口: %{y:,.0f}人（推計）<extra></extra>",
+        sigma = st.slider(
+            "年率のばらつき（標準偏差、ポイント）", min_value=0.0, max_value=1.0, value=0.3, step=0.1,
+            help=f"{projection.MONTE_CARLO_PATHS:,}通りの経路をモンテカルロで計算し、推計の幅を帯で表示する。",
         )
-    )
-
-    # 80周年（2025）ライン
-    fig_pop.add_vline(
-        x=2025, line=dict(color="#26c6da", width=1.5, dash="dot"),
-        annotation_text="80周年", annotation_position="top",
-        annotation_font=dict(size=11, color="#0d3b66"),
-    )
 
-    fig_pop.update_layout(
-        xaxis=dict(title="年", showgrid=False, dtick=5),
-        yaxis=dict(title="人口（人）", tickformat=",", gridcolor="#e0f2f1",
-                   range=[90_000, 115_000]),
-        height=420,
-        margin=dict(l=60, r=30, t=30, b=50),
-        plot_bgcolor="#fafffe",
-        paper_bgcolor="#ffffff",
-        font=dict(family="Noto Sans JP"),
-        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
-    )
-
-    st.plotly_chart(fig_pop, use_container_width=True)
-    st.markdown(
+    actual = data.population_actual()
+    paths = projection.population_paths(shift)
+    bands = projection.population_fan(shift, sigma) if sigma > 0 else None
+    pop = metrics.population_summary(shift)
+    # 年齢別の推計（基準の率のまま）を同じ期間で重ねる
+    by_age = cohort.cohort_projection(years=pop.projected_year - cohort.base_year())
+    age_paths = by_age.totals().merge(by_age.age_groups(), on="年")
+
+    fig_pop = build_population_figure(
+        actual["年"].tolist(), actual["人口"].tolist(),
+        paths["年"].tolist(), paths["人口"].tolist(),
+        bands, age_paths,
+    )
+    plotly_chart("pop", fig_pop)
+    milestone = f"{metrics.POPULATION_MILESTONE // 10_000}万人"
+    if pop.latest < metrics.POPULATION_MILESTONE:
+        outlook = f"{milestone}を下回ったまま推移する"
+    elif pop.milestone_year is None:
+        outlook = f"{pop.projected_year}年まで{milestone}を維持する"
+    else:
+        outlook = f"{pop.milestone_year}年に{milestone}を割り込む"
+    elderly = age_paths[cohort.AGE_GROUPS[-1][0]] / age_paths["人口"] * 100
+    band_note = "" if bands is None else (
+        f'<div class="metric-desc">{pop.projected_year}年の90%区間 '
+        f"{int(bands['p5'].iloc[-1]):,}〜{int(bands['p95'].iloc[-1]):,}人</div>"
+    )
+    page.markdown(
         f"""
         <div class="metric-card">
             <div class="metric-label">人口動態サマリ</div>
             <div class="metric-value" style="font-size:1.3rem;">
-                2025年 103,359人 → 2035年 約{projected_pop[-1]:,}人（推計）
-            </div>
+                {pop.latest_year}年 {pop.latest:,}人 → {pop.projected_year}年 約{pop.projected:,}人（推計）
+            </div>{band_note}
             <div class="metric-desc">
-                ピーク（2007年 約112,200人）から2025年で約8,800人減（-7.9%）。
-                近年は年-1.0〜-1.3%で加速。推計では2035年に10万人を割り込む可能性がある。
+                ピーク（{pop.peak_year}年 約{pop.peak:,}人）から{pop.latest_year}年で約{round(pop.decline_from_peak, -2):,}人減（{pop.decline_pct:.1f}%）。
+                直近{metrics.RECENT_YEARS}年の実績は年{pop.recent_rate_low:+.1f}〜{pop.recent_rate_high:+.1f}%。
+                年率{pop.rate_low:+.1f}〜{pop.rate_high:+.1f}%を仮定した推計では{outlook}見込み。
+                年齢別の推計では{pop.projected_year}年に約{round(int(age_paths["人口"].iloc[-1]), -2):,}人、
+                {cohort.AGE_GROUPS[-1][0]}の割合は{elderly.iloc[0]:.0f}%から{elderly.iloc[-1]:.0f}%に。
                 移住促進・関係人口の拡大が今後のカギとなる。
             </div>
         </div>
-        """,
-        unsafe_allow_html=True,
-    )
-
-    st.markdown(
         """
-        <div class="section-divider-wave">
-            <svg viewBox="0 0 1200 32" preserveAspectRatio="none">
-                <path d="M0,16 C150,28 350,4 500,16 C650,28 850,4 1000,16 C1100,24 1150,8 1200,16"
-                      fill="none" stroke="#80deea" stroke-width="2"/>
-                <path d="M0,20 C200,8 400,30 600,18 C800,6 1000,28 1200,16"
-                      fill="none" stroke="#b2ebf2" stroke-width="1.5"/>
-            </svg>
-        </div>
-        """,
-        unsafe_allow_html=True,
     )
 
-    # --- 観光客数推移 ---
-    st.markdown("### 観光客数推移（2015年 - 2024年）")
-
-    years_tourism = list(range(2015, 2025))
-    tourists = [5200, 5350, 5500, 5600, 5400, 2800, 3500, 4800, 5300, 5700]
+    render_section_divider(page)
 
-    df_tourism = pd.DataFrame(
-        {"年": years_tourism, "観光客数（千人）": tourists}
-    )
+    # --- 観光客数推移 ---
+    page.markdown("### 観光客数推移（2015年 - 2024年）")
 
-    fig_tourism = go.Figure()
-    fig_tourism.add_trace(
-        go.Bar(
-            x=df_tourism["年"],
-            y=df_tourism["観光客数（千人）"],
-            marker=dict(
-                color=[
-                    "#1a6b8a" if t > 3000 else "#e57373" for t in tourists
-                ],
-                cornerradius=4,
-            ),
-            text=[f"{t/1000:.1f}M" for t in tourists],
-            textposition="outside",
-            textfont=dict(size=11),
-            hovertemplate="<b>%{x}年</b><br>観光客数: %{y:,.0f}千人<extra></extra>",
-        )
-    )
-    # COVID注釈
-    fig_tourism.add_annotation(
-        x=2020,
-        y=2800,
-        text="COVID-19<br>影響",
-        showarrow=True,
-        arrowhead=2,
-        arrowcolor="#e57373",
-        font=dict(size=11, color="#e57373"),
-        ax=0,
-        ay=-50,
-    )
-    fig_tourism.update_layout(
-        xaxis=dict(title="年", dtick=1, showgrid=False),
-        yaxis=dict(title="観光客数（千人）", gridcolor="#e0f2f1"),
-        height=380,
-        margin=dict(l=60, r=30, t=30, b=50),
-        plot_bgcolor="#fafffe",
-        paper_bgcolor="#ffffff",
-        font=dict(family="Noto Sans JP"),
-    )
-    st.plotly_chart(fig_tourism, width="stretch")
+    fig_tourism = build_tourism_figure(data.tourism())
+    page.flush()
+    plotly_chart("tourism", fig_tourism)
+    render_long_series(page, "tourism_daily", "日別の観光客数", "観光客数（人）", "#1a6b8a")
 
-    st.markdown(
-        """
-        <div class="section-divider-wave">
-            <svg viewBox="0 0 1200 32" preserveAspectRatio="none">
-                <path d="M0,16 C150,28 350,4 500,16 C650,28 850,4 1000,16 C1100,24 1150,8 1200,16"
-                      fill="none" stroke="#80deea" stroke-width="2"/>
-                <path d="M0,20 C200,8 400,30 600,18 C800,6 1000,28 1200,16"
-                      fill="none" stroke="#b2ebf2" stroke-width="1.5"/>
-            </svg>
-        </div>
-        """,
-        unsafe_allow_html=True,
-    )
+    render_section_divider(page)
 
     # --- 事業所数推移 ---
-    st.markdown("### 事業所数推移")
-
-    years_biz = [2006, 2009, 2012, 2014, 2016, 2019, 2021, 2024]
-    businesses = [5500, 5350, 5200, 5100, 5000, 4950, 4850, 4800]
-
-    df_biz = pd.DataFrame({"年": years_biz, "事業所数": businesses})
-
-    fig_biz = go.Figure()
-    fig_biz.add_trace(
-        go.Scatter(
-            x=df_biz["年"],
-            y=df_biz["事業所数"],
-            mode="lines+markers",
-            line=dict(color="#e57373", width=2.5, dash="dot"),
-            marker=dict(size=8, color="#c62828", symbol="diamond"),
-            fill="tozeroy",
-            fillcolor="rgba(229,115,115,0.08)",
-            hovertemplate="<b>%{x}年</b><br>事業所数: %{y:,.0f}<extra></extra>",
-        )
-    )
-    fig_biz.update_layout(
-        title=dict(text="事業所数の推移", font=dict(size=14, color="#0a2540")),
-        xaxis=dict(title="年", showgrid=False),
-        yaxis=dict(title="事業所数", range=[4500, 5700], gridcolor="#e0f2f1"),
-        height=350,
-        margin=dict(l=60, r=30, t=50, b=50),
-        plot_bgcolor="#fafffe",
-        paper_bgcolor="#ffffff",
-        font=dict(family="Noto Sans JP"),
-    )
-    st.plotly_chart(fig_biz, use_container_width=True)
+    page.markdown("### 事業所数推移")
 
-    st.markdown(
-        """
+    fig_biz = build_business_figure(data.businesses())
+    page.flush()
+    plotly_chart("biz", fig_biz)
+    render_long_series(page, "business_registrations", "月別の事業所登録数", "登録数", "#e57373")
+
+    biz = metrics.business_summary()
+    page.markdown(
+        f"""
         <div style="display:grid; grid-template-columns:repeat(2, 1fr); gap:1rem;">
             <div class="metric-card">
                 <div class="metric-label">事業所数の動向</div>
-                <div class="metric-value" style="color:#c62828; font-size:1.3rem;">約700減</div>
+                <div class="metric-value" style="color:#c62828; font-size:1.3rem;">約{-biz.change:,}減</div>
                 <div class="metric-desc">
-                    2006年の約5,500事業所から2024年には約4,800事業所に。
-                    約12.7%の減少。商店街の空洞化は全国的課題。
+                    {biz.first_year}年の約{biz.first:,}事業所から{biz.latest_year}年には約{biz.latest:,}事業所に。
+                    約{-biz.change_pct:.1f}%の減少。商店街の空洞化は全国的課題。
                     一方で、新規創業・スタートアップの誘致、
                     リノベーションまちづくりなど、新たな動きも芽生えている。
                 </div>
@@ -1732,26 +1660,13 @@ def page_statistics() -> None:
                 </div>
             </div>
         </div>
-        """,
-        unsafe_allow_html=True,
-    )
-
-    st.markdown(
         """
-        <div class="section-divider-wave">
-            <svg viewBox="0 0 1200 32" preserveAspectRatio="none">
-                <path d="M0,16 C150,28 350,4 500,16 C650,28 850,4 1000,16 C1100,24 1150,8 1200,16"
-                      fill="none" stroke="#80deea" stroke-width="2"/>
-                <path d="M0,20 C200,8 400,30 600,18 C800,6 1000,28 1200,16"
-                      fill="none" stroke="#b2ebf2" stroke-width="1.5"/>
-            </svg>
-        </div>
-        """,
-        unsafe_allow_html=True,
     )
 
+    render_section_divider(page)
+
     # --- 文化資産 ---
-    st.markdown("### 三島の主要文化資産 ── 湧水の街のアイデンティティ")
+    page.markdown("### 三島の主要文化資産 ── 湧水の街のアイデンティティ")
 
     assets = [
         ("⛩", "三嶋大社", "伊豆国一宮。源頼朝が源氏再興を祈願した歴史ある神社。年間約150万人が参拝。"),
@@ -1761,19 +1676,10 @@ def page_statistics() -> None:
         ("💧", "柿田川湧水群", "東洋一の湧水量を誇る清流。国指定天然記念物。日量約100万トン。"),
     ]
 
-    assets_html = '<div style="display:grid; grid-template-columns:repeat(5, 1fr); gap:0.8rem; margin-bottom:1rem;">'
-    for icon, name, desc in assets:
-        assets_html += f"""
-            <div class="concept-card" style="text-align:center; min-height:200px; border-left:4px solid #48b4a0;">
-                <div style="font-size:2rem; margin-bottom:0.5rem;">{icon}</div>
-                <div class="concept-title">{name}</div>
-                <div class="concept-text">{desc}</div>
-            </div>"""
-    assets_html += "</div>"
-    st.markdown(assets_html, unsafe_allow_html=True)
+    page.markdown(render_assets_html(assets))
 
     # --- アイデンティティまとめ ---
-    st.markdown(
+    page.markdown(
         """
         <div class="narrative-box">
             <p>
@@ -1786,9 +1692,9 @@ def page_statistics() -> None:
                 次の10年の推進力となる。
             </p>
         </div>
-        """,
-        unsafe_allow_html=True,
+        """
     )
+    page.flush()
 
 
 # ============================================================
@@ -1797,15 +1703,18 @@ def page_statistics() -> None:
 def page_action_principles() -> None:
     """セセラギズムの7つの行動原則を表示する。"""
 
+    page = PageBuffer()
+
     render_hero(
+        page,
         "7つの行動原則",
         "Action Principles of SESERAGISM",
         "せせらぎの水が持つ7つの特性を、三島の行動原理として言語化した指針。",
     )
 
     # --- ビジョン構造 ---
-    st.markdown("### ビジョンの全体構造")
-    st.markdown(
+    page.markdown("### ビジョンの全体構造")
+    page.markdown(
         """
         <div style="max-width:640px; margin:0 auto 1.5rem auto;">
             <!-- 最上位 -->
@@ -1859,27 +1768,14 @@ def page_action_principles() -> None:
                 KPI・モニタリング
             </div>
         </div>
-        """,
-        unsafe_allow_html=True,
-    )
-
-    st.markdown(
         """
-        <div class="section-divider-wave">
-            <svg viewBox="0 0 1200 32" preserveAspectRatio="none">
-                <path d="M0,16 C150,28 350,4 500,16 C650,28 850,4 1000,16 C1100,24 1150,8 1200,16"
-                      fill="none" stroke="#80deea" stroke-width="2"/>
-                <path d="M0,20 C200,8 400,30 600,18 C800,6 1000,28 1200,16"
-                      fill="none" stroke="#b2ebf2" stroke-width="1.5"/>
-            </svg>
-        </div>
-        """,
-        unsafe_allow_html=True,
     )
 
+    render_section_divider(page)
+
     # --- せせらぎの本質的特性 ---
-    st.markdown("### せせらぎの本質的特性")
-    st.markdown("水の流れが持つ6つの特性。そのすべてが三島の行動原理と重なる。")
+    page.markdown("### せせらぎの本質的特性")
+    page.markdown("水の流れが持つ6つの特性。そのすべてが三島の行動原理と重なる。")
 
     features = [
         ("🌊", "止まらない", "常に流れ続ける。停滞しない。変化しながらも途切れない。"),
@@ -1890,34 +1786,13 @@ def page_action_principles() -> None:
         ("🎵", "音を生む", "流れること自体がリズムになる。行動がビートを刻む。"),
     ]
 
-    features_html = '<div style="display:grid; grid-template-columns:repeat(3, 1fr); gap:1rem; margin-bottom:1rem;">'
-    for icon, title, text in features:
-        features_html += f"""
-            <div class="concept-card">
-                <div class="concept-icon">{icon}</div>
-                <div class="concept-title">{title}</div>
-                <div class="concept-text">{text}</div>
-            </div>"""
-    features_html += "</div>"
-    st.markdown(features_html, unsafe_allow_html=True)
+    page.markdown(render_features_html(features))
 
-    st.markdown(
-        """
-        <div class="section-divider-wave">
-            <svg viewBox="0 0 1200 32" preserveAspectRatio="none">
-                <path d="M0,16 C150,28 350,4 500,16 C650,28 850,4 1000,16 C1100,24 1150,8 1200,16"
-                      fill="none" stroke="#80deea" stroke-width="2"/>
-                <path d="M0,20 C200,8 400,30 600,18 C800,6 1000,28 1200,16"
-                      fill="none" stroke="#b2ebf2" stroke-width="1.5"/>
-            </svg>
-        </div>
-        """,
-        unsafe_allow_html=True,
-    )
+    render_section_divider(page)
 
     # --- 7つの行動原則 ---
-    st.markdown("### せせらぎの特性 × 行動原則")
-    st.markdown("水の流れが教えてくれる、7つの行動のかたち。")
+    page.markdown("### せせらぎの特性 × 行動原則")
+    page.markdown("水の流れが教えてくれる、7つの行動のかたち。")
 
     principles = [
         (
@@ -1964,55 +1839,12 @@ def page_action_principles() -> None:
         ),
     ]
 
-    principles_html = ""
-    for i, (icon, title, keyword, water, meaning, criteria) in enumerate(principles):
-        num = i + 1
-        bg = "linear-gradient(135deg, #e0f7fa 0%, #ffffff 60%)" if num % 2 == 1 else "#ffffff"
-        principles_html += f"""
-            <div style="display:grid; grid-template-columns:80px 1fr; gap:1rem;
-                        background:{bg}; border-radius:14px; padding:1.4rem 1.5rem;
-                        margin-bottom:0.8rem; box-shadow:0 2px 10px rgba(10,37,64,0.06);
-                        border-left:5px solid #1a6b8a;">
-                <div style="text-align:center;">
-                    <div style="font-size:2rem; margin-bottom:0.3rem;">{icon}</div>
-                    <div style="display:inline-block; background:linear-gradient(135deg, #0d3b66, #1a6b8a);
-                                color:#fff; font-size:0.75rem; font-weight:700;
-                                padding:0.2rem 0.7rem; border-radius:12px;">{keyword}</div>
-                </div>
-                <div>
-                    <div style="font-size:1.15rem; font-weight:900; color:#0a2540; margin-bottom:0.2rem;">
-                        {num}. {title}
-                    </div>
-                    <div style="font-size:0.78rem; color:#1a6b8a; font-weight:600; margin-bottom:0.4rem;">
-                        せせらぎの特性：{water}
-                    </div>
-                    <div style="font-size:0.88rem; color:#37474f; line-height:1.65; margin-bottom:0.5rem;">
-                        {meaning}
-                    </div>
-                    <div style="background:rgba(26,107,138,0.06); border-radius:8px; padding:0.5rem 0.8rem;
-                                font-size:0.82rem; color:#0d3b66; font-style:italic;">
-                        {criteria}
-                    </div>
-                </div>
-            </div>"""
-    st.markdown(principles_html, unsafe_allow_html=True)
+    page.markdown(render_principles_html(principles))
 
-    st.markdown(
-        """
-        <div class="section-divider-wave">
-            <svg viewBox="0 0 1200 32" preserveAspectRatio="none">
-                <path d="M0,16 C150,28 350,4 500,16 C650,28 850,4 1000,16 C1100,24 1150,8 1200,16"
-                      fill="none" stroke="#80deea" stroke-width="2"/>
-                <path d="M0,20 C200,8 400,30 600,18 C800,6 1000,28 1200,16"
-                      fill="none" stroke="#b2ebf2" stroke-width="1.5"/>
-            </svg>
-        </div>
-        """,
-        unsafe_allow_html=True,
-    )
+    render_section_divider(page)
 
     # --- まとめ ---
-    st.markdown(
+    page.markdown(
         """
         <div class="narrative-box">
             <p>
@@ -2028,30 +1860,62 @@ def page_action_principles() -> None:
                 水のように、自然体で、しなやかに。
             </span>
         </div>
-        """,
-        unsafe_allow_html=True,
+        """
     )
+    page.flush()
 
 
 # ============================================================
 # メイン
 # ============================================================
+APP_TITLE = "三島商工会議所 80周年ビジョン | セセラギズム"
+
+# (ページ関数, タイトル, アイコン)。ナビゲーション・計測スクリプト・静的サイトの書き出しで共有する。
+PAGES = [
+    (page_vision_evolution, "ビジョンの変遷", "📊"),
+    (page_seseragism, "セセラギズム", "🌊"),
+    (page_action_principles, "行動原則", "💧"),
+    (page_workshop_analysis, "ワークショップ分析", "🔍"),
+    (page_survey_analysis, "アンケート分析", "📋"),
+    (page_statistics, "三島市統計データ", "📈"),
+]
+
+
+def _timed_page(page: Callable[[], None]) -> Callable[[], None]:
+    """ページ関数の描画時間を記録する（ページ内の記録にもページ名を付ける）。"""
+
+    @functools.wraps(page)
+    def run() -> None:
+        with timing.page_context(page.__name__), timing.span("page", page.__name__):
+            page()
+
+    return run
+
+
 def main() -> None:
     """アプリケーションのエントリポイント。"""
-    inject_custom_css()
-    render_sidebar_decoration()
+    st.set_page_config(
+        page_title=APP_TITLE,
+        page_icon="💧",
+        layout="wide",
+        initial_sidebar_state="expanded",
+    )
+    with timing.span("css", "inject_custom_css"):
+        inject_custom_css()
+    with timing.span("sidebar", "render_sidebar_decoration"):
+        render_sidebar_decoration()
 
     pg = st.navigation(
-        [
-            st.Page(page_vision_evolution, title="ビジョンの変遷", icon="📊"),
-            st.Page(page_seseragism, title="セセラギズム", icon="🌊"),
-            st.Page(page_action_principles, title="行動原則", icon="💧"),
-            st.Page(page_workshop_analysis, title="ワークショップ分析", icon="🔍"),
-            st.Page(page_survey_analysis, title="アンケート分析", icon="📋"),
-            st.Page(page_statistics, title="三島市統計データ", icon="📈"),
-        ]
+        [st.Page(_timed_page(page), title=title, icon=icon) for page, title, icon in PAGES]
     )
-    pg.run()
+    profile = st.query_params.get(PROFILE_PARAM)
+    if profile in PROFILE_MODES:
+        run_profiled_page(pg, profile)
+    else:
+        pg.run()
+
+    if st.query_params.get(DIAGNOSTICS_PARAM) == "1":
+        render_diagnostics_panel()
 
 
 if __name__ == "__main__":
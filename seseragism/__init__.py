@@ -0,0 +1,22 @@
+"""
+セセラギズム ダッシュボードのデータ・計算層
+
+Streamlit に依存せず、import しても副作用がない。画面（dashboard.py）や
+計測・書き出しスクリプト（tools/）から共通で使う。
+
+    store        … data/ 以下の Arrow IPC ファイルの読み込みとキャッシュ
+    diskcache    … ディスクのキャッシュ（再起動をまたいで残る、データとコードの版がキー）
+    shared       … ワーカープロセス間で共有する読み取り専用の置き場（/dev/shm のメモリマップ）
+    data         … 統計・ワークショップのデータセット
+    metrics      … データセットから導く指標（人口推計・事業所数の増減など）
+    projection   … 総人口の将来推計（シナリオ・モンテカルロ）
+    cohort       … 年齢 × 男女別の将来推計（コーホート要因法）
+    survey       … 回答者単位のアンケートデータの読み込みと集計
+    keywords     … ワークショップ議事録からのキーワード抽出
+    cooccurrence … 班 × キーワードの接続行列と共起数
+    timeseries   … 長い時系列の間引き（LTTB・min-max）
+    charts       … Plotly の図の組み立て（共通テンプレート・検証なしの高速経路）
+    timing       … 処理時間の計測（常時有効の軽量スパン）
+    profiling    … 1回分の実行の詳細プロファイル（cProfile / tracemalloc）
+    warmup       … 起動時のキャッシュのウォームアップと準備完了の通知
+"""
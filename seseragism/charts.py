@@ -0,0 +1,102 @@
+"""
+Plotly の図の組み立て（共通テンプレートと検証なしの高速経路）
+
+背景色・フォント・目盛線の色など、全チャートで同じ指定は Plotly のテンプレート
+「seseragism」にまとめて登録し、各図には図ごとに違う指定だけを書く。
+
+図は trace・layout を辞書のまま組み立て、figure() で go.Figure に包む。
+このとき graph_objects の検証（プロパティごとの型チェックと変換）は行わないので、
+go.Bar(...) や update_layout(...) で組み立てるより速い。その代わり、プロパティ名の
+誤りはエラーにならず、ブラウザ側で無視される。新しい指定を足したときは
+validate() で一度確かめる。
+
+JSON へのシリアライズは orjson があれば orjson で行う（to_json()。無ければ標準の json）。
+spec() は図ごとに1回だけシリアライズして結果を使い回す。キャッシュした図
+（st.cache_resource）は再実行のたびに同じインスタンスなので、送信のたびに
+JSON にし直さずに済む。
+
+テンプレートの中身（JSON で約 0.5 KB）は、どの図の JSON にも入る（plotly.js は
+テンプレートを名前では引けないので、送る図ごとに持たせるしかない）。
+"""
+
+from __future__ import annotations
+
+import weakref
+from functools import lru_cache
+from importlib.util import find_spec
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
+TEMPLATE_NAME = "seseragism"
+
+# 画面の CSS（static/seseragism.css）と同じフォントスタック
+FONT_FAMILY = "Noto Sans JP, Hiragino Sans, Hiragino Kaku Gothic ProN, Yu Gothic, Meiryo, sans-serif"
+TEXT_COLOR = "#0a2540"
+GRID_COLOR = "#e0f2f1"
+
+# 全チャート共通の layout。図の layout に同じ項目があれば図の指定が優先される。
+TEMPLATE_LAYOUT = {
+    "font": {"family": FONT_FAMILY},
+    "title": {"font": {"color": TEXT_COLOR}},
+    "paper_bgcolor": "#ffffff",
+    "plot_bgcolor": "#fafffe",
+    "xaxis": {"gridcolor": GRID_COLOR, "zeroline": False, "automargin": True},
+    "yaxis": {"gridcolor": GRID_COLOR, "zeroline": False, "automargin": True},
+    "polar": {"bgcolor": "#fafffe"},
+    "hoverlabel": {"font": {"family": FONT_FAMILY}},
+}
+
+JSON_ENGINE = "orjson" if find_spec("orjson") else "json"
+
+# id(図) → シリアライズ済みの JSON（図が破棄されたら消す）
+_specs: dict[int, str] = {}
+
+
+@lru_cache(maxsize=1)
+def template() -> dict:
+    """テンプレート「seseragism」（初回に plotly.io.templates へ登録する）を辞書で返す。"""
+    import plotly.graph_objects as go
+    import plotly.io as pio
+
+    if TEMPLATE_NAME not in pio.templates:
+        pio.templates[TEMPLATE_NAME] = go.layout.Template(layout=TEMPLATE_LAYOUT)
+    return pio.templates[TEMPLATE_NAME].to_plotly_json()
+
+
+def figure(data: list[dict], layout: dict) -> go.Figure:
+    """trace の辞書のリストと layout の辞書から、検証なしで go.Figure を作る。
+
+    配列は numpy の配列で渡すと、送信時に base64（型付き配列）で詰めて送られる。
+    """
+    import plotly.graph_objects as go
+
+    return go.Figure({"data": data, "layout": {"template": template(), **layout}}, _validate=False)
+
+
+def validate(fig: go.Figure) -> go.Figure:
+    """検証つきで作り直す（プロパティ名・値の誤りがあれば ValueError）。"""
+    import plotly.graph_objects as go
+
+    return go.Figure(fig.to_dict())
+
+
+def to_json(fig: go.Figure | dict) -> str:
+    """図を JSON にする（検証なし、orjson があれば orjson で）。"""
+    import plotly.io as pio
+
+    return pio.to_json(fig, validate=False, engine=JSON_ENGINE)
+
+
+def spec(fig: go.Figure) -> str:
+    """図の JSON を返す（図ごとに1回だけシリアライズし、以降は同じ文字列を返す）。
+
+    作ったあとに変更しない図（build_*_figure の結果）にだけ使う。
+    """
+    key = id(fig)
+    cached = _specs.get(key)
+    if cached is None:
+        cached = _specs[key] = to_json(fig)
+        weakref.finalize(fig, _specs.pop, key, None)
+    return cached
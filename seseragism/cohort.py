@@ -0,0 +1,213 @@
+"""
+年齢 × 男女別の人口推計（コーホート要因法）
+
+基準年の各歳・男女別人口（population_by_age 表。0〜99歳で、99 は「99歳以上」）に、
+年齢別の生残率・出生率・純移動率（cohort_rates 表）を1年ずつ適用して将来人口を求める。
+1年分の推計は Leslie 行列を掛けることに相当する。
+  ・副対角     … 生残率（a 歳 → a+1 歳。99歳以上は生き残った分がそのままとどまる）
+  ・0歳の行    … 女性人口 × 出生率 × 出生性比 × 0歳の生残率
+行列はほとんどがゼロなので、積は配列のずらしと内積で計算する。
+シナリオ（仮定の組）の方向はまとめてベクトル化している。
+移動は生残の後に、新しい年齢の純移動率で掛ける。
+
+仮定（Assumptions）は、基準の率に掛ける倍率で表す。
+    fertility     … 出生率
+    migration     … 全年齢の純移動率
+    youth_outflow … 若者・子育て世代（YOUTH_AGES）の転出超過（0.5 なら流出が半減）
+推計結果は、仮定の組とデータの版ごとにメモ化し、ディスクのキャッシュ（diskcache）にも残す。
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from seseragism import data, store
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+SEXES = ("男", "女")
+MALE, FEMALE = 0, 1
+# 出生に占める男児の割合（出生性比 105）
+BIRTH_MALE_SHARE = 105 / 205
+# 推計する年数
+HORIZON = 30
+# 流出の仮定を変える「若者・子育て世代」の年齢（下限以上・上限未満）
+YOUTH_AGES = (15, 40)
+# 流出の仮定の比較（名前, 若者・子育て世代の転出超過の倍率）
+YOUTH_SCENARIOS: tuple[tuple[str, float], ...] = (("現状", 1.0), ("半減", 0.5), ("なし", 0.0))
+# 集計に使う年齢区分（名前, 下限以上, 上限未満）
+AGE_GROUPS: tuple[tuple[str, int, int], ...] = (
+    ("0〜14歳", 0, 15),
+    ("15〜39歳", 15, 40),
+    ("40〜64歳", 40, 65),
+    ("65歳以上", 65, 100),
+)
+
+
+@dataclass(frozen=True)
+class Assumptions:
+    """推計の仮定（基準の率に掛ける倍率）。"""
+
+    fertility: float = 1.0
+    migration: float = 1.0
+    youth_outflow: float = 1.0
+
+
+@dataclass(frozen=True)
+class CohortRates:
+    """年齢別の率（性 × 年齢、出生率は女性の年齢別）。"""
+
+    survival: np.ndarray
+    fertility: np.ndarray
+    migration: np.ndarray
+
+
+@dataclass(frozen=True)
+class CohortProjection:
+    """推計結果。population は（年, 性, 年齢）で、年の先頭が基準年。"""
+
+    years: tuple[int, ...]
+    assumptions: Assumptions
+    population: np.ndarray
+
+    def totals(self) -> pd.DataFrame:
+        """年ごとの総人口（年, 人口）。"""
+        import numpy as np
+        import pandas as pd
+
+        return pd.DataFrame({"年": self.years, "人口": np.rint(self.population.sum(axis=(1, 2))).astype(np.int64)})
+
+    def age_groups(self, groups: Sequence[tuple[str, int, int]] = AGE_GROUPS) -> pd.DataFrame:
+        """年 × 年齢区分の人口（男女計、1人単位に丸める）。"""
+        import numpy as np
+        import pandas as pd
+
+        both = self.population.sum(axis=1)
+        columns = {name: np.rint(both[:, low:high].sum(axis=1)).astype(np.int64) for name, low, high in groups}
+        return pd.DataFrame({"年": self.years, **columns})
+
+
+def project(
+    base: np.ndarray,
+    survival: np.ndarray,
+    fertility: np.ndarray,
+    migration: np.ndarray,
+    years: int = HORIZON,
+) -> np.ndarray:
+    """基準人口（性, 年齢）から years 年分を推計する。
+
+    survival・migration は（…, 性, 年齢）、fertility は（…, 年齢）で、… がシナリオの次元
+    （なければ1シナリオ）。戻り値は（…, 年, 性, 年齢）で、年の 0 番目が基準人口。
+    """
+    import numpy as np
+
+    base = np.asarray(base, dtype=np.float64)
+    survival = np.asarray(survival, dtype=np.float64)
+    fertility = np.asarray(fertility, dtype=np.float64)
+    growth = 1 + np.asarray(migration, dtype=np.float64)
+    scenarios = np.broadcast_shapes(survival.shape[:-2], growth.shape[:-2], fertility.shape[:-1])
+    newborn = np.array([BIRTH_MALE_SHARE, 1 - BIRTH_MALE_SHARE]) * survival[..., 0]
+
+    paths = np.empty(scenarios + (years + 1,) + base.shape)
+    current = np.broadcast_to(base, scenarios + base.shape)
+    paths[..., 0, :, :] = current
+    for t in range(1, years + 1):
+        births = (current[..., FEMALE, :] * fertility).sum(axis=-1)
+        aged = np.empty(scenarios + base.shape)
+        aged[..., 1:] = current[..., :-1] * survival[..., :-1]
+        aged[..., -1] += current[..., -1] * survival[..., -1]
+        aged[..., 0] = births[..., None] * newborn
+        current = aged * growth
+        paths[..., t, :, :] = current
+    return paths
+
+
+def scenario_rates(rates: CohortRates, assumptions: Sequence[Assumptions]) -> CohortRates:
+    """仮定の組ごとの率（先頭にシナリオの次元を足したもの）。"""
+    import numpy as np
+
+    fertility = np.array([a.fertility for a in assumptions])
+    migration = np.array([a.migration for a in assumptions])
+    youth = np.array([a.youth_outflow for a in assumptions])
+    ages = np.arange(rates.migration.shape[-1])
+    outflow = (ages >= YOUTH_AGES[0]) & (ages < YOUTH_AGES[1]) & (rates.migration < 0)
+    scale = np.where(outflow, youth[:, None, None], 1.0) * migration[:, None, None]
+    return CohortRates(
+        survival=np.broadcast_to(rates.survival, (len(assumptions),) + rates.survival.shape),
+        fertility=rates.fertility * fertility[:, None],
+        migration=rates.migration * scale,
+    )
+
+
+# ============================================================
+# ダッシュボード用（データストアの基準人口・率を使う）
+# ============================================================
+@store.cached_on("population_by_age")
+def base_population() -> np.ndarray:
+    """基準年の人口（性, 年齢）。"""
+    import numpy as np
+
+    df = data.population_by_age()
+    return np.stack([df[sex].to_numpy(dtype=np.float64) for sex in SEXES])
+
+
+@store.cached_on("cohort_rates")
+def base_rates() -> CohortRates:
+    """基準の生残率・出生率・純移動率。"""
+    import numpy as np
+
+    df = data.cohort_rates()
+    return CohortRates(
+        survival=np.stack([df[f"生残率_{sex}"].to_numpy(dtype=np.float64) for sex in SEXES]),
+        fertility=df["出生率"].to_numpy(dtype=np.float64),
+        migration=np.stack([df[f"純移動率_{sex}"].to_numpy(dtype=np.float64) for sex in SEXES]),
+    )
+
+
+def base_year() -> int:
+    """基準年（人口の実績の最終年。年齢別人口はこの年のもの）。"""
+    return int(data.population_actual()["年"].iloc[-1])
+
+
+def sweep(assumptions: Sequence[Assumptions], years: int = HORIZON) -> np.ndarray:
+    """仮定の組をまとめて推計する（シナリオ, 年, 性, 年齢）。"""
+    rates = scenario_rates(base_rates(), assumptions)
+    return project(base_population(), rates.survival, rates.fertility, rates.migration, years)
+
+
+@store.cached_on("population_actual", "population_by_age", "cohort_rates", persist=True)
+def cohort_projection(assumptions: Assumptions = Assumptions(), years: int = HORIZON) -> CohortProjection:
+    """仮定の組ごとの推計（仮定とデータの版ごとにキャッシュ）。結果は変更しないこと。"""
+    start = base_year()
+    population = sweep((assumptions,), years)[0]
+    population.flags.writeable = False
+    return CohortProjection(
+        years=tuple(range(start, start + years + 1)),
+        assumptions=assumptions,
+        population=population,
+    )
+
+
+@store.cached_on("population_actual", "population_by_age", "cohort_rates", persist=True)
+def youth_outflow_paths(
+    scenarios: tuple[tuple[str, float], ...] = YOUTH_SCENARIOS, years: int = HORIZON
+) -> pd.DataFrame:
+    """若者・子育て世代（YOUTH_AGES）の人口の推移（年, シナリオ名ごとの列）。結果は変更しないこと。
+
+    scenarios は（名前, 転出超過の倍率）の組。転出超過の倍率だけを変え、ほかの率は
+    基準のままにした比較用。
+    """
+    import numpy as np
+    import pandas as pd
+
+    low, high = YOUTH_AGES
+    paths = sweep(tuple(Assumptions(youth_outflow=factor) for _, factor in scenarios), years)
+    youth = np.rint(paths[..., low:high].sum(axis=(-2, -1))).astype(np.int64)
+    start = base_year()
+    frame = pd.DataFrame(youth.T, columns=[name for name, _ in scenarios])
+    frame.insert(0, "年", range(start, start + years + 1))
+    return frame
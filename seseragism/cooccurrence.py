@@ -0,0 +1,123 @@
+"""
+グループ × キーワードの共起分析
+
+ワークショップの各グループ（班）に現れたキーワードを、グループ × キーワードの
+0/1 の接続行列 A にし、行列積で
+  ・キーワード × キーワードの共起数   C = Aᵀ A（対角はそのキーワードが出た班の数）
+  ・キーワード群のカバー             A · s > 0 の班（s は群に含まれるキーワードの指示ベクトル）
+を求める。
+
+A は非ゼロ要素の (行, 列) だけを持つ疎行列（COO 形式の NumPy 配列）で、
+積は非ゼロ要素どうしの組を bincount で数えて計算する。計算量は
+各グループのキーワード数の2乗和に比例するので、年間数百グループ・
+数千語でも全体の密行列を作るより速い。
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from seseragism import data, store
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+
+@dataclass(frozen=True)
+class Incidence:
+    """グループ × キーワードの接続行列（COO 形式、行順）。
+
+    キーワードは出現した班の多い順（同数なら最初に現れた順）に並ぶ。
+    """
+
+    groups: tuple[str, ...]
+    keywords: tuple[str, ...]
+    rows: np.ndarray  # 非ゼロ要素の行（グループ）番号、昇順
+    cols: np.ndarray  # 非ゼロ要素の列（キーワード）番号
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return len(self.groups), len(self.keywords)
+
+    def to_frame(self) -> pd.DataFrame:
+        """接続行列を密な DataFrame（行: グループ, 列: キーワード）にする。"""
+        import numpy as np
+        import pandas as pd
+
+        dense = np.zeros(self.shape, dtype=np.int64)
+        dense[self.rows, self.cols] = 1
+        return pd.DataFrame(dense, index=list(self.groups), columns=list(self.keywords))
+
+
+def incidence(groups: Iterable[tuple[str, Sequence[str]]]) -> Incidence:
+    """(グループ名, キーワード...) の並びから接続行列を作る。"""
+    import numpy as np
+
+    names: list[str] = []
+    index: dict[str, int] = {}
+    rows: list[int] = []
+    cols: list[int] = []
+    for row, (name, words) in enumerate(groups):
+        names.append(name)
+        for word in words:
+            cols.append(index.setdefault(word, len(index)))
+            rows.append(row)
+    n_words = len(index)
+
+    # 同じ班で重複したキーワードは1つにまとめる（np.unique で行順にも揃う）
+    cells = np.unique(np.asarray(rows, dtype=np.int64) * n_words + np.asarray(cols, dtype=np.int64))
+    row_ids, col_ids = np.divmod(cells, max(n_words, 1))
+
+    # 列を出現した班の多い順に並べ替える
+    frequency = np.bincount(col_ids, minlength=n_words)
+    order = np.lexsort((np.arange(n_words), -frequency))
+    rank = np.empty(n_words, dtype=np.int64)
+    rank[order] = np.arange(n_words)
+    words = list(index)
+    return Incidence(
+        groups=tuple(names),
+        keywords=tuple(words[i] for i in order),
+        rows=row_ids,
+        cols=rank[col_ids],
+    )
+
+
+def cooccurrence(inc: Incidence) -> pd.DataFrame:
+    """キーワード × キーワードの共起数（両方が現れた班の数）。対角は出現した班の数。"""
+    import numpy as np
+    import pandas as pd
+
+    n_groups, n_words = inc.shape
+    # 各非ゼロ要素を、同じ行のすべての非ゼロ要素と組にする（行ごとの直積を一度に作る）
+    sizes = np.bincount(inc.rows, minlength=n_groups)
+    starts = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+    repeat = sizes[inc.rows]
+    left = np.repeat(inc.cols, repeat)
+    offsets = np.arange(repeat.sum()) - np.repeat(np.cumsum(repeat) - repeat, repeat)
+    right = inc.cols[np.repeat(starts[inc.rows], repeat) + offsets]
+    product = np.bincount(left * n_words + right, minlength=n_words * n_words).reshape(n_words, n_words)
+    return pd.DataFrame(product, index=list(inc.keywords), columns=list(inc.keywords))
+
+
+def coverage(inc: Incidence, keywords: Sequence[str]) -> tuple[str, ...]:
+    """指定したキーワードのいずれかが現れた班の名前。"""
+    import numpy as np
+
+    selector = np.isin(np.asarray(inc.keywords, dtype=object), list(keywords))
+    hits = np.bincount(inc.rows, weights=selector[inc.cols], minlength=len(inc.groups)) > 0
+    return tuple(name for name, hit in zip(inc.groups, hits) if hit)
+
+
+@store.cached_on("workshop_teams")
+def team_incidence() -> Incidence:
+    """ワークショップの班 × キーワードの接続行列（データの版ごとにキャッシュ）。"""
+    return incidence(data.workshop_teams())
+
+
+@store.cached_on("workshop_teams")
+def team_cooccurrence() -> pd.DataFrame:
+    """ワークショップのキーワード共起数（データの版ごとにキャッシュ）。結果は変更しないこと。"""
+    return cooccurrence(team_incidence())
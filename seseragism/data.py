@@ -0,0 +1,85 @@
+"""
+データセット
+
+ダッシュボードに表示する数値データを、型付きの関数として提供する。
+実体は data/<バージョン>/ の Arrow IPC ファイルで、読み込みとキャッシュは
+seseragism.store が行う（ファイル内容のハッシュがキー）。結果の DataFrame は
+全セッションで同じオブジェクトを共有するので、呼び出し側で変更しないこと
+（加工するときは .copy() する）。
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from seseragism import store
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+# ============================================================
+# 三島市統計
+# ============================================================
+def population_actual() -> pd.DataFrame:
+    """人口の実績（年, 人口）。住民基本台帳ベース（日本人住民）。
+
+    出典: jp.gdfreak.com / 住民基本台帳
+    """
+    return store.read_frame("population_actual")
+
+
+def population_decline_rates() -> pd.DataFrame:
+    """将来推計に使う年率（年, 増減率[%]）。近年の減少率 約-1.0〜-1.3% をベースに設定。"""
+    return store.read_frame("population_decline_rates")
+
+
+def tourism() -> pd.DataFrame:
+    """観光客数の推移（年, 観光客数（千人））。"""
+    return store.read_frame("tourism")
+
+
+def businesses() -> pd.DataFrame:
+    """事業所数の推移（年, 事業所数）。"""
+    return store.read_frame("businesses")
+
+
+def population_by_age() -> pd.DataFrame:
+    """基準年（人口の実績の最終年）の各歳・男女別人口（年齢, 男, 女）。99 は99歳以上。
+
+    5歳階級の人口を各歳に按分した推計値で、総数は population_actual の最終年に合わせている。
+    """
+    return store.read_frame("population_by_age")
+
+
+def cohort_rates() -> pd.DataFrame:
+    """コーホート要因法の年齢別の率（年齢, 生残率_男, 生残率_女, 出生率, 純移動率_男, 純移動率_女）。
+
+    生残率は a 歳から1年後に生存している割合、出生率は女性1人あたりの年間出生数
+    （合計特殊出生率 1.35 相当）、純移動率は転入超過数 ÷ 人口（年率）。
+    全国の生命表と近年の転出入の傾向をもとに設定した想定値。
+    """
+    return store.read_frame("cohort_rates")
+
+
+# ============================================================
+# ワークショップ
+# ============================================================
+def workshop_keywords() -> pd.DataFrame:
+    """全チームの議論から抽出したキーワードの出現回数（キーワード, 出現回数）。"""
+    return store.read_frame("workshop_keywords")
+
+
+def workshop_values() -> pd.DataFrame:
+    """「変えたくない三島の良さ」の価値カテゴリと重要度（カテゴリ, 重要度）。0〜100。"""
+    return store.read_frame("workshop_values")
+
+
+@store.cached_on("workshop_teams")
+def workshop_teams() -> tuple[tuple[str, tuple[str, ...]], ...]:
+    """各チームから抽出したキーワード（(班, キーワード...), ...）。ファイル上の順序を保つ。"""
+    df = store.read_frame("workshop_teams")
+    teams: dict[str, list[str]] = {}
+    for team, keyword in zip(df["班"], df["キーワード"]):
+        teams.setdefault(team, []).append(keyword)
+    return tuple((team, tuple(keywords)) for team, keywords in teams.items())
@@ -0,0 +1,224 @@
+"""
+ディスクのキャッシュ（プロセス内のキャッシュの下の段。再起動・再デプロイをまたいで残る）
+
+プロセス内のキャッシュ（lru_cache・st.cache_resource）は再起動のたびに消える。
+推計（モンテカルロ）やテキストマイニングのような重い計算の結果は persistent() /
+store.cached_on(..., persist=True) でディスクにも保存し、再起動後のプロセスや
+同じホストの別のレプリカは、計算し直さずにファイルから読む。
+
+  ・キー   … 関数の名前・コードの版（定義したモジュールのソースの SHA-256）・引数
+             （store.cached_on では表の内容ハッシュも）。データかコードが変われば別のキーになる
+  ・形式   … pickle（プロトコル 5）。numpy・Arrow のバッファは pickle の外に 64 バイト境界で
+             並べ、読むときはメモリマップのバッファをそのまま参照する（コピーしない。読み取り専用）
+  ・追い出し … 書き込みのたびに、最後に使ってから MAX_AGE_SECONDS を過ぎたものを消し、
+             合計が MAX_BYTES を超えていれば使った時刻の古い順に消す
+
+置き場は既定で .cache/seseragism/。環境変数 SESERAGISM_CACHE_DIR で変更でき、
+空文字にするとディスクのキャッシュを使わない。ファイルは別名で書いてから置き換えるので、
+複数のプロセスが同じ置き場を使ってもよい。読み書きに失敗したときは計算した結果を
+そのまま返す（キャッシュが使えないだけで画面は止めない）。
+"""
+
+from __future__ import annotations
+
+import hashlib
+import inspect
+import logging
+import mmap
+import os
+import pickle
+import struct
+import threading
+import time
+from collections.abc import Callable
+from functools import lru_cache, wraps
+from pathlib import Path
+from typing import TypeVar
+
+CACHE_DIR_ENV = "SESERAGISM_CACHE_DIR"
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent.parent / ".cache" / "seseragism"
+
+# 置き場の合計サイズの上限と、使われないまま残す期間
+MAX_BYTES = 512 * 1024 * 1024
+MAX_AGE_SECONDS = 30 * 24 * 3600
+
+SUFFIX = ".pkl"
+MAGIC = b"SSRGPKL1"
+ALIGNMENT = 64
+# 形式: MAGIC, pickle のバイト数, バッファ数, 各バッファのバイト数, pickle, バッファ（ALIGNMENT 境界）
+_COUNTS = struct.Struct("<QI")
+_LENGTH = struct.Struct("<Q")
+
+T = TypeVar("T")
+
+_LOGGER = logging.getLogger(__name__)
+_lock = threading.Lock()
+_counts = {"hits": 0, "misses": 0, "errors": 0}
+
+
+def cache_dir() -> Path | None:
+    """置き場のディレクトリ（ディスクのキャッシュを使わない設定なら None）。"""
+    override = os.environ.get(CACHE_DIR_ENV)
+    if override is None:
+        return DEFAULT_CACHE_DIR
+    return Path(override) if override else None
+
+
+@lru_cache(maxsize=None)
+def fingerprint(func: Callable) -> str:
+    """関数のコードの版（定義したモジュールのソースの SHA-256。取れなければ関数のソース）。"""
+    func = inspect.unwrap(func)
+    module = inspect.getmodule(func)
+    try:
+        source = inspect.getsource(module) if module is not None else inspect.getsource(func)
+    except (OSError, TypeError):
+        source = func.__code__.co_code.hex()
+    return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+
+def entry_key(func: Callable, key: object) -> str:
+    """エントリのファイル名（関数の名前・コードの版・キーの repr の SHA-256）。
+
+    key は結果を決める値をすべて含み、repr がプロセスをまたいで同じになるもの
+    （数値・文字列・タプル・パス・frozen dataclass など）にする。
+    """
+    name = f"{func.__module__}.{func.__qualname__}"
+    return hashlib.sha256(repr((name, fingerprint(func), key)).encode("utf-8")).hexdigest()
+
+
+def _aligned(offset: int) -> int:
+    return -offset % ALIGNMENT
+
+
+def dump(value: object, path: Path) -> int:
+    """value を path に書く（別名で書いてから置き換える）。書いたバイト数を返す。"""
+    buffers: list[pickle.PickleBuffer] = []
+    payload = pickle.dumps(value, protocol=5, buffer_callback=buffers.append)
+    raws = [b.raw() for b in buffers]
+    header = MAGIC + _COUNTS.pack(len(payload), len(raws)) + b"".join(_LENGTH.pack(r.nbytes) for r in raws)
+    temp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with temp.open("wb") as f:
+            offset = f.write(header) + f.write(payload)
+            for raw in raws:
+                offset += f.write(b"\0" * _aligned(offset))
+                offset += f.write(raw)
+        os.replace(temp, path)
+    finally:
+        temp.unlink(missing_ok=True)
+    return offset
+
+
+def load(path: Path) -> object:
+    """dump() で書いたファイルを読む（バッファはメモリマップを参照する）。"""
+    with path.open("rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    view = memoryview(mapped)
+    if view[:len(MAGIC)] != MAGIC:
+        raise ValueError(f"{path}: ディスクのキャッシュの形式ではありません")
+    offset = len(MAGIC)
+    payload_size, count = _COUNTS.unpack_from(view, offset)
+    offset += _COUNTS.size
+    lengths = [_LENGTH.unpack_from(view, offset + i * _LENGTH.size)[0] for i in range(count)]
+    offset += count * _LENGTH.size
+    payload = view[offset:offset + payload_size]
+    offset += payload_size
+    buffers = []
+    for length in lengths:
+        offset += _aligned(offset)
+        buffers.append(view[offset:offset + length])
+        offset += length
+    if offset > len(view):
+        raise ValueError(f"{path}: ファイルが途中で切れています")
+    return pickle.loads(payload, buffers=buffers)
+
+
+def evict(directory: Path, max_bytes: int = MAX_BYTES, max_age: float = MAX_AGE_SECONDS) -> int:
+    """古いエントリを消す（期限切れ → 上限を超えた分を使った時刻の古い順）。消した数を返す。"""
+    entries = []
+    for path in directory.glob(f"*{SUFFIX}"):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:  # 別のプロセスが先に消した
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+    entries.sort()
+    now = time.time()
+    total = sum(size for _, size, _ in entries)
+    removed = 0
+    for used, size, path in entries:
+        if now - used <= max_age and total <= max_bytes:
+            break
+        path.unlink(missing_ok=True)
+        total -= size
+        removed += 1
+    return removed
+
+
+def call(func: Callable[..., T], key: object, compute: Callable[[], T]) -> T:
+    """key のエントリがあれば読み、なければ compute() の結果を書いてから返す。"""
+    directory = cache_dir()
+    if directory is None:
+        return compute()
+    path = directory / f"{entry_key(func, key)}{SUFFIX}"
+    try:
+        value = load(path)
+    except FileNotFoundError:
+        pass
+    except Exception:  # 壊れたファイルは消して計算し直す
+        _LOGGER.warning("disk cache entry %s is unreadable; recomputing", path.name, exc_info=True)
+        path.unlink(missing_ok=True)
+        _count("errors")
+    else:
+        _count("hits")
+        try:
+            os.utime(path)  # 使った時刻（追い出しの順番）
+        except OSError:
+            pass
+        return value
+    _count("misses")
+    value = compute()
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        dump(value, path)
+        evict(directory)
+    except Exception:
+        _LOGGER.warning("could not write disk cache entry for %s", func.__qualname__, exc_info=True)
+        _count("errors")
+    return value
+
+
+def persistent(func: Callable[..., T]) -> Callable[..., T]:
+    """引数をキーにして結果をディスクにも保存するデコレータ。
+
+    引数が結果を決める値（データの内容ハッシュを含む）をすべて持つ関数に使う。
+    プロセス内のキャッシュ（lru_cache）の内側に置き、メモリに無いときだけディスクを見る。
+    """
+
+    @wraps(func)
+    def wrapper(*args, **kwargs) -> T:
+        return call(func, (args, sorted(kwargs.items())), lambda: func(*args, **kwargs))
+
+    return wrapper
+
+
+def _count(name: str) -> None:
+    with _lock:
+        _counts[name] += 1
+
+
+def usage() -> dict:
+    """このプロセスの読み書きの回数と、置き場のエントリ数・合計バイト数。"""
+    directory = cache_dir()
+    sizes = [p.stat().st_size for p in directory.glob(f"*{SUFFIX}")] if directory and directory.is_dir() else []
+    with _lock:
+        counts = dict(_counts)
+    return {"directory": str(directory) if directory else None, "entries": len(sizes), "bytes": sum(sizes), **counts}
+
+
+def clear() -> int:
+    """置き場のエントリをすべて消す。消した数を返す。"""
+    directory = cache_dir()
+    if directory is None or not directory.is_dir():
+        return 0
+    return evict(directory, max_bytes=-1)
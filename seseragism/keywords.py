@@ -0,0 +1,206 @@
+"""
+ワークショップのキーワード抽出
+
+ワークショップの議事録・メモ（data/workshop/ 以下の .txt / .md、UTF-8）を
+1行ずつ読みながら正規化し、
+  ・辞書語（KEYWORD_VARIANTS の表記ゆれをまとめた代表語）の出現回数
+  ・カタカナ・漢字の連なりから取った文字 n-gram の出現回数（辞書にない語の候補）
+を数えて、キーワード頻度表と抽出キーワード数を求める。
+
+集計はファイル単位で、ファイル内容のハッシュごとにキャッシュする（全体の集計は
+ディスクのキャッシュ diskcache にも残す）。
+議事録を追加・修正したときは、そのファイルだけを数え直して合算する。
+議事録が1つもないときは、データストアの workshop_keywords 表（公表済みの集計）を使う。
+
+読み込むディレクトリは環境変数 SESERAGISM_WORKSHOP_DIR で変更できる。
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import unicodedata
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from seseragism import data, diskcache, store
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+WORKSHOP_DIR = store.DATA_ROOT / "workshop"
+WORKSHOP_DIR_ENV = "SESERAGISM_WORKSHOP_DIR"
+TRANSCRIPT_SUFFIXES = (".txt", ".md")
+
+# 代表語 → 表記ゆれ（正規化後の表記で書く）。頻度表はこの代表語で集計する。
+# 表記は本文の部分一致で数える。ただし1文字の表記（漢字に限る）は、前後が漢字でなく
+# （水曜日・給食・緑色には当たらない）、後ろが SINGLE_KANJI_EXCLUDED_NEXT の表記でも
+# ないときだけ数える（「水がきれい」「緑の多い」には当たる）。
+KEYWORD_VARIANTS: dict[str, tuple[str, ...]] = {
+    "オープン": ("オープン", "開かれた", "開放的"),
+    "ウェルカム": ("ウェルカム", "welcome", "歓迎"),
+    "受け入れる": ("受け入れ", "受入れ", "受入", "うけいれ"),
+    "つながり": ("つながり", "つながる", "繋がり", "繋がる"),
+    "水": ("水", "湧水", "水辺", "水の都", "水のまち", "せせらぎ", "清流"),
+    "歴史": ("歴史", "伝統"),
+    "人の温かさ": ("人の温かさ", "温かい", "あたたかい", "優しい"),
+    "食": ("食", "食文化", "食べ物", "食材", "グルメ", "うなぎ", "コロッケ"),
+    "自然": ("自然", "緑", "緑豊か", "みどり", "富士山"),
+    "チャレンジ": ("チャレンジ", "挑戦"),
+}
+
+# 1文字の表記 → 続くと別の語になる表記（送り仮名で動詞になるものなど）
+SINGLE_KANJI_EXCLUDED_NEXT: dict[str, tuple[str, ...]] = {
+    "食": ("べ", "う", "わ", "え", "っ", "ら"),
+}
+
+# 頻度表に載せる語数（グラフの色数と合わせる）
+TOP_KEYWORDS = 10
+# n-gram 候補として数える長さと、抽出キーワードとみなす最小出現回数
+NGRAM_SIZES = (2, 3, 4)
+MIN_NGRAM_COUNT = 3
+
+_KANJI = "㐀-䶿一-鿿々"
+_WORD_RUN = re.compile(rf"[゠-ヿ{_KANJI}]{{2,}}")
+
+
+@dataclass(frozen=True)
+class FileCounts:
+    """1ファイル分の集計。"""
+
+    terms: Counter  # 代表語 → 出現回数
+    ngrams: Counter  # n-gram → 出現回数
+
+
+@dataclass(frozen=True)
+class KeywordSummary:
+    """キーワード抽出の結果。"""
+
+    frequencies: pd.DataFrame  # キーワード, 出現回数（多い順に TOP_KEYWORDS 語）
+    extracted: int | None  # 抽出キーワード数（議事録がないときは None）
+    candidates: tuple[tuple[str, int], ...]  # 辞書にない頻出 n-gram（多い順）
+    files: int
+
+
+def normalize(text: str) -> str:
+    """NFKC で全角英数・半角カナを揃え、英字を小文字にし、空白を除く。"""
+    return "".join(unicodedata.normalize("NFKC", text).lower().split())
+
+
+def transcript_files(directory: Path | None = None) -> list[Path]:
+    """議事録ファイルの一覧（パス順）。"""
+    directory = directory or Path(os.environ.get(WORKSHOP_DIR_ENV) or WORKSHOP_DIR)
+    if not directory.is_dir():
+        return []
+    return sorted(p for p in directory.rglob("*") if p.suffix in TRANSCRIPT_SUFFIXES and p.is_file())
+
+
+@lru_cache(maxsize=8)
+def _term_pattern(variants: tuple[tuple[str, tuple[str, ...]], ...]) -> tuple[re.Pattern, dict[str, str]]:
+    """表記ゆれをまとめた正規表現（長い表記を優先）と、表記 → 代表語の対応。"""
+    canonical = {normalize(v): term for term, forms in variants for v in forms}
+    not_kanji = sorted(v for v in canonical if len(v) == 1 and not re.fullmatch(f"[{_KANJI}]", v))
+    if not_kanji:
+        raise ValueError(f"1文字の表記 {not_kanji} は漢字でないので、別の語との境目が分かりません")
+    alternatives = []
+    for v in sorted(canonical, key=len, reverse=True):
+        if len(v) > 1:
+            alternatives.append(re.escape(v))
+            continue
+        # 1文字の漢字は、前後が漢字でなく、後ろが別の語になる表記でもないときだけ
+        excluded = "".join(f"|{re.escape(e)}" for e in SINGLE_KANJI_EXCLUDED_NEXT.get(v, ()))
+        alternatives.append(f"(?<![{_KANJI}]){re.escape(v)}(?![{_KANJI}]{excluded})")
+    return re.compile("|".join(alternatives)), canonical
+
+
+def count_lines(lines: Iterable[str], variants: tuple[tuple[str, tuple[str, ...]], ...]) -> FileCounts:
+    """行の並びを順に正規化して数える（全文をメモリに載せない）。"""
+    pattern, canonical = _term_pattern(variants)
+    terms: Counter = Counter()
+    ngrams: Counter = Counter()
+    for line in lines:
+        text = normalize(line)
+        if not text:
+            continue
+        terms.update(canonical[m.group()] for m in pattern.finditer(text))
+        for run in _WORD_RUN.findall(text):
+            for n in NGRAM_SIZES:
+                if len(run) >= n:
+                    ngrams.update(run[i:i + n] for i in range(len(run) - n + 1))
+    return FileCounts(terms=terms, ngrams=ngrams)
+
+
+@lru_cache(maxsize=1024)
+def _count_file(path: Path, digest: str, variants: tuple[tuple[str, tuple[str, ...]], ...]) -> FileCounts:
+    with path.open(encoding="utf-8", errors="replace") as f:
+        return count_lines(f, variants)
+
+
+def _candidates(ngrams: Counter, variants: tuple[tuple[str, tuple[str, ...]], ...]) -> list[tuple[str, int]]:
+    """頻出 n-gram から、辞書語と、同じ回数で現れる長い n-gram の一部分を除く。"""
+    known = {normalize(v) for _, forms in variants for v in forms}
+    known_words = [k for k in known if len(k) >= 2]  # 1文字の辞書語（「水」など）を含むだけなら除かない
+    frequent = sorted(
+        ((gram, count) for gram, count in ngrams.items() if count >= MIN_NGRAM_COUNT),
+        key=lambda item: (-len(item[0]), -item[1], item[0]),
+    )
+    kept: list[tuple[str, int]] = []
+    covered: dict[str, int] = {}  # 採用済みの長い n-gram の部分文字列 → その最大出現回数
+    for gram, count in frequent:
+        if any(gram in k or k in gram for k in known_words) or count <= covered.get(gram, 0):
+            continue
+        kept.append((gram, count))
+        for n in NGRAM_SIZES:
+            for i in range(len(gram) - n + 1):
+                sub = gram[i:i + n]
+                if sub != gram and covered.get(sub, 0) < count:
+                    covered[sub] = count
+    return sorted(kept, key=lambda item: (-item[1], item[0]))
+
+
+@lru_cache(maxsize=16)
+@diskcache.persistent
+def _extract(
+    files: tuple[tuple[Path, str], ...],
+    variants: tuple[tuple[str, tuple[str, ...]], ...],
+) -> KeywordSummary:
+    import pandas as pd
+
+    terms: Counter = Counter()
+    ngrams: Counter = Counter()
+    for path, digest in files:
+        counts = _count_file(path, digest, variants)
+        terms.update(counts.terms)
+        ngrams.update(counts.ngrams)
+    candidates = _candidates(ngrams, variants)
+    top = terms.most_common(TOP_KEYWORDS)
+    return KeywordSummary(
+        frequencies=pd.DataFrame({"キーワード": [t for t, _ in top], "出現回数": [c for _, c in top]}),
+        extracted=sum(1 for c in terms.values() if c > 0) + len(candidates),
+        candidates=tuple(candidates),
+        files=len(files),
+    )
+
+
+def extract(files: Iterable[Path], variants: dict[str, tuple[str, ...]] | None = None) -> KeywordSummary:
+    """議事録ファイルからキーワードを抽出する（ファイルの版ごとにキャッシュ）。"""
+    variants = variants or KEYWORD_VARIANTS
+    keyed = tuple((path, store.file_digest(path)) for path in files)
+    return _extract(keyed, tuple((term, tuple(forms)) for term, forms in variants.items()))
+
+
+@store.cached_on("workshop_keywords")
+def _published() -> KeywordSummary:
+    return KeywordSummary(
+        frequencies=data.workshop_keywords(), extracted=None, candidates=(), files=0
+    )
+
+
+def workshop_keyword_summary() -> KeywordSummary:
+    """ダッシュボード用のキーワード集計。議事録がなければ公表済みの集計を返す。"""
+    files = transcript_files()
+    return extract(files) if files else _published()
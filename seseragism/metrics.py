@@ -0,0 +1,100 @@
+"""
+指標の計算
+
+data のデータセットから、画面に出す推計値・要約値を計算する。
+結果は入力の表の内容ハッシュをキーにキャッシュされ、データが差し替えられると計算し直される。
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from seseragism import data, projection, store
+
+
+# ============================================================
+# 人口
+# ============================================================
+# 「近年」の増減率を見る年数と、推計で下回る年を示す人口の節目
+RECENT_YEARS = 5
+POPULATION_MILESTONE = 100_000
+
+
+@dataclass(frozen=True)
+class PopulationSummary:
+    """人口動態サマリ。"""
+
+    latest_year: int
+    latest: int
+    peak_year: int
+    peak: int
+    decline_from_peak: int
+    decline_pct: float  # ピーク比（%、減少は負）
+    recent_rate_low: float  # 直近 RECENT_YEARS 年の実績の増減率（%/年）の最小・最大
+    recent_rate_high: float
+    first_projected_year: int
+    projected_year: int
+    projected: int
+    rate_low: float  # 推計に使った増減率（%/年、上乗せ込み）の最小・最大
+    rate_high: float
+    milestone_year: int | None  # 推計で POPULATION_MILESTONE を下回る最初の年（期間内に無ければ None）
+
+
+@store.cached_on("population_actual", "population_decline_rates")
+def population_summary(shift: float = 0.0) -> PopulationSummary:
+    """実績のピーク・最新値と推計の最終値をまとめる。shift は増減率への上乗せ（ポイント）。"""
+    actual = data.population_actual()
+    rates = data.population_decline_rates()["増減率"] + shift
+    paths = projection.population_paths(shift)
+    peak_index = actual["人口"].idxmax()
+    peak = int(actual["人口"].loc[peak_index])
+    latest = int(actual["人口"].iloc[-1])
+    recent = (actual["人口"].pct_change() * 100).iloc[-RECENT_YEARS:]
+    below = paths.loc[paths["人口"] < POPULATION_MILESTONE, "年"]
+    return PopulationSummary(
+        latest_year=int(actual["年"].iloc[-1]),
+        latest=latest,
+        peak_year=int(actual["年"].loc[peak_index]),
+        peak=peak,
+        decline_from_peak=peak - latest,
+        decline_pct=(latest - peak) / peak * 100,
+        recent_rate_low=float(recent.min()),
+        recent_rate_high=float(recent.max()),
+        first_projected_year=int(paths["年"].iloc[0]),
+        projected_year=int(paths["年"].iloc[-1]),
+        projected=int(paths["人口"].iloc[-1]),
+        rate_low=float(rates.min()),
+        rate_high=float(rates.max()),
+        milestone_year=int(below.iloc[0]) if len(below) else None,
+    )
+
+
+# ============================================================
+# 事業所数
+# ============================================================
+@dataclass(frozen=True)
+class BusinessSummary:
+    """事業所数の増減（初年 → 最新年）。"""
+
+    first_year: int
+    first: int
+    latest_year: int
+    latest: int
+    change: int
+    change_pct: float
+
+
+@store.cached_on("businesses")
+def business_summary() -> BusinessSummary:
+    """事業所数の初年と最新年を比べる。"""
+    df = data.businesses()
+    first = int(df["事業所数"].iloc[0])
+    latest = int(df["事業所数"].iloc[-1])
+    return BusinessSummary(
+        first_year=int(df["年"].iloc[0]),
+        first=first,
+        latest_year=int(df["年"].iloc[-1]),
+        latest=latest,
+        change=latest - first,
+        change_pct=(latest - first) / first * 100,
+    )
@@ -0,0 +1,134 @@
+"""
+1回分の実行の詳細プロファイル（cProfile / tracemalloc）
+
+遅い再実行の原因を関数単位で調べるためのもの。run_profiled() で関数を1回だけ
+cProfile の下で実行し、統計を pstats 形式で profiles/ 以下に保存して、
+累積時間の上位を返す。memory=True なら tracemalloc も有効にして、
+割り当ての多い行の上位とスナップショットも保存する。
+
+tracemalloc はプロセス全体の割り当てを数えるので、同時に描画中のほかの
+セッションの分も含まれる。同時に実行できるプロファイルは1つだけ。
+
+URL パラメータだけで誰でもサーバーにファイルを書けないよう、環境変数
+SESERAGISM_PROFILING=1 のときだけ有効（enabled()）。保存したファイルは直近
+MAX_PROFILES 回分だけ残し、古いものは保存のたびに消す。
+保存先は環境変数 SESERAGISM_PROFILE_DIR で変更できる。
+"""
+
+from __future__ import annotations
+
+import cProfile
+import os
+import pstats
+import threading
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+from seseragism import store
+
+PROFILE_DIR = store.DATA_ROOT.parent / "profiles"
+PROFILE_DIR_ENV = "SESERAGISM_PROFILE_DIR"
+PROFILING_ENV = "SESERAGISM_PROFILING"
+# 残しておくプロファイルの回数（pstats と tracemalloc の組で1回）
+MAX_PROFILES = 20
+# 画面に返す上位の件数
+TOP_ENTRIES = 25
+# tracemalloc で記録する呼び出し元の深さ
+TRACEMALLOC_FRAMES = 1
+
+_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class ProfileReport:
+    """プロファイル結果の要約。"""
+
+    label: str
+    seconds: float
+    stats_path: Path
+    functions: list[tuple[str, int, float, float]]  # 関数, 呼び出し回数, 自身の時間(ms), 累積時間(ms)
+    snapshot_path: Path | None = None
+    allocations: list[tuple[str, int, int]] | None = None  # 行, 割り当て量(bytes), 件数
+
+
+class ProfilerBusy(RuntimeError):
+    """ほかのプロファイルを実行中。"""
+
+
+def enabled() -> bool:
+    """プロファイルを受け付ける設定か（環境変数 SESERAGISM_PROFILING=1）。"""
+    return os.environ.get(PROFILING_ENV) == "1"
+
+
+def profile_dir() -> Path:
+    """プロファイルの保存先。"""
+    return Path(os.environ.get(PROFILE_DIR_ENV) or PROFILE_DIR)
+
+
+def prune(directory: Path, keep: int = MAX_PROFILES) -> int:
+    """直近 keep 回分より古いプロファイルを消す。消した回数を返す。"""
+    runs = sorted(directory.glob("*.pstats"), key=lambda p: p.name, reverse=True)
+    for path in runs[keep:]:
+        path.unlink(missing_ok=True)
+        path.with_suffix(".tracemalloc").unlink(missing_ok=True)
+    return len(runs[keep:])
+
+
+def _top_functions(stats: pstats.Stats, top: int) -> list[tuple[str, int, float, float]]:
+    rows = []
+    for (filename, line, name), (_, calls, self_time, cumulative, _) in stats.stats.items():  # type: ignore[attr-defined]
+        where = f"{Path(filename).name}:{line}({name})" if line else name
+        rows.append((where, calls, self_time * 1000, cumulative * 1000))
+    return sorted(rows, key=lambda r: -r[3])[:top]
+
+
+def run_profiled(func: Callable[[], object], label: str, memory: bool = False, top: int = TOP_ENTRIES) -> ProfileReport:
+    """func を1回プロファイルして保存し、上位の項目を返す。
+
+    func が例外を送出した場合も、そこまでの統計を保存してから例外を送出し直す。
+    """
+    if not _lock.acquire(blocking=False):
+        raise ProfilerBusy("ほかのプロファイルを実行中です")
+    try:
+        directory = profile_dir()
+        directory.mkdir(parents=True, exist_ok=True)
+        # 同じ秒に複数のプロセスが保存しても重ならないよう、マイクロ秒とプロセス ID を付ける
+        stem = f"{datetime.now():%Y%m%d-%H%M%S-%f}-{os.getpid()}-{label}"
+        profiler = cProfile.Profile()
+        if memory:
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+        started = time.perf_counter()
+        try:
+            profiler.runcall(func)
+        finally:
+            seconds = time.perf_counter() - started
+            snapshot = tracemalloc.take_snapshot() if memory else None
+            if memory:
+                tracemalloc.stop()
+            stats_path = directory / f"{stem}.pstats"
+            profiler.dump_stats(stats_path)
+            snapshot_path = None
+            if snapshot is not None:
+                snapshot_path = directory / f"{stem}.tracemalloc"
+                snapshot.dump(str(snapshot_path))
+            prune(directory, MAX_PROFILES)
+        allocations = None
+        if snapshot is not None:
+            allocations = [
+                (str(stat.traceback[0]), stat.size, stat.count)
+                for stat in snapshot.statistics("lineno")[:top]
+            ]
+        return ProfileReport(
+            label=label,
+            seconds=seconds,
+            stats_path=stats_path,
+            functions=_top_functions(pstats.Stats(profiler), top),
+            snapshot_path=snapshot_path,
+            allocations=allocations,
+        )
+    finally:
+        _lock.release()
@@ -0,0 +1,119 @@
+"""
+人口の将来推計エンジン
+
+基準人口に、年ごとの増減率（%）の系列を掛けていく単純な推計を、
+増減率を NumPy 配列（シナリオ × 年）として受け取り、全シナリオまとめて計算する。
+  ・決定的なスイープ     … 基準の増減率に一律の上乗せ（ポイント）を変えて並べる
+  ・モンテカルロ         … 増減率にばらつきを加えた多数の経路から、年ごとの分位点を求める
+従来の推計と同じく、各年で1人単位に丸めてから次の年に進む（Python の round と
+同じ偶数丸め）。年数は高々数十なので年のループは残し、シナリオ方向をベクトル化する。
+
+結果は引数（基準人口・増減率・条件）ごとにメモ化し、ディスクのキャッシュ（diskcache）にも残す。
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from seseragism import data, diskcache, store
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+# ファンチャートに描く分位点（%）
+PERCENTILES = (5, 25, 50, 75, 95)
+# モンテカルロの経路数と乱数の種（同じ条件なら同じ結果になるよう固定）
+MONTE_CARLO_PATHS = 2000
+MONTE_CARLO_SEED = 2025
+
+PROJECTION_CACHE_MAX_ENTRIES = 128
+
+
+def project(base: float, rates) -> np.ndarray:
+    """増減率（%）の配列（…, 年）から人口の経路（…, 年）を求める。"""
+    import numpy as np
+
+    rates = np.asarray(rates, dtype=np.float64)
+    growth = 1 + rates / 100
+    paths = np.empty(rates.shape, dtype=np.float64)
+    current = np.full(rates.shape[:-1], float(base))
+    for t in range(rates.shape[-1]):
+        current = np.rint(current * growth[..., t])
+        paths[..., t] = current
+    return paths.astype(np.int64)
+
+
+def sweep(base: float, rates: Sequence[float], shifts: Sequence[float]) -> np.ndarray:
+    """基準の増減率に shifts（ポイント）をそれぞれ上乗せした経路（シナリオ × 年）。"""
+    import numpy as np
+
+    return project(base, np.asarray(rates)[None, :] + np.asarray(shifts, dtype=np.float64)[:, None])
+
+
+def monte_carlo(
+    base: float,
+    rates: Sequence[float],
+    sigma: float,
+    n_paths: int = MONTE_CARLO_PATHS,
+    seed: int = MONTE_CARLO_SEED,
+) -> np.ndarray:
+    """増減率にばらつきを加えた経路（経路 × 年）。
+
+    経路ごとの水準のずれ（標準偏差 sigma ポイント、全期間で共通）と、
+    年ごとの揺らぎ（標準偏差 sigma / 2 ポイント）を加える。
+    """
+    import numpy as np
+
+    rates = np.asarray(rates, dtype=np.float64)
+    rng = np.random.default_rng(seed)
+    level = rng.normal(0.0, sigma, size=(n_paths, 1))
+    noise = rng.normal(0.0, sigma / 2, size=(n_paths, rates.size))
+    return project(base, rates[None, :] + level + noise)
+
+
+@lru_cache(maxsize=PROJECTION_CACHE_MAX_ENTRIES)
+@diskcache.persistent
+def _fan(base: int, rates: tuple[float, ...], shift: float, sigma: float, n_paths: int, seed: int) -> np.ndarray:
+    import numpy as np
+
+    shifted = np.asarray(rates) + shift
+    if sigma <= 0:
+        return np.repeat(project(base, shifted)[None, :], len(PERCENTILES), axis=0)
+    paths = monte_carlo(base, shifted, sigma, n_paths, seed)
+    return np.rint(np.percentile(paths, PERCENTILES, axis=0)).astype(np.int64)
+
+
+def fan(base: int, years: Sequence[int], rates: Sequence[float], shift: float = 0.0, sigma: float = 0.0,
+        n_paths: int = MONTE_CARLO_PATHS, seed: int = MONTE_CARLO_SEED) -> pd.DataFrame:
+    """年ごとの分位点（年, p5, p25, p50, p75, p95）。条件ごとにメモ化する。"""
+    import pandas as pd
+
+    quantiles = _fan(int(base), tuple(float(r) for r in rates), float(shift), float(sigma), n_paths, seed)
+    frame = pd.DataFrame(quantiles.T, columns=[f"p{p}" for p in PERCENTILES])
+    frame.insert(0, "年", list(years))
+    return frame
+
+
+# ============================================================
+# ダッシュボード用（データストアの人口・増減率を使う）
+# ============================================================
+@store.cached_on("population_actual", "population_decline_rates")
+def population_paths(shift: float = 0.0) -> pd.DataFrame:
+    """実績の最終年を起点にした推計（年, 人口）。shift は増減率への上乗せ（ポイント）。"""
+    import pandas as pd
+
+    actual = data.population_actual()
+    rates = data.population_decline_rates()
+    projected = project(int(actual["人口"].iloc[-1]), rates["増減率"].to_numpy() + shift)
+    return pd.DataFrame({"年": rates["年"], "人口": projected})
+
+
+@store.cached_on("population_actual", "population_decline_rates")
+def population_fan(shift: float = 0.0, sigma: float = 0.0) -> pd.DataFrame:
+    """推計の分位点（年, p5 … p95）。sigma は増減率のばらつき（ポイント）。"""
+    actual = data.population_actual()
+    rates = data.population_decline_rates()
+    return fan(int(actual["人口"].iloc[-1]), rates["年"].tolist(), rates["増減率"].tolist(), shift, sigma)
@@ -0,0 +1,182 @@
+"""
+ワーカープロセス間で共有する読み取り専用の置き場（/dev/shm のメモリマップ）
+
+イベント時のように dashboard.py のプロセスを複数並べると、プロセスごとに同じ
+DataFrame・配列を持つことになり、メモリがデータ量 × プロセス数で増える。
+call() で作った結果は、共有メモリ（tmpfs の /dev/shm）のファイルに diskcache と同じ形式
+（pickle 5 + バッファは pickle の外）で置き、どのプロセスもそのファイルをメモリマップして
+バッファを直接参照する。物理メモリ上の実体は1つなので、メモリはデータ量だけで増える。
+
+  ・最初に要求したプロセスが計算して置き、同時に要求したほかのプロセスはロックで待って
+    それを読む（ワーカーの数だけ同じ計算をしない）
+  ・計算したプロセスも、手元の結果は捨てて置いたファイルを読み直す
+  ・読んだ配列・DataFrame は読み取り専用（変更しようとすると ValueError）
+  ・キーは diskcache と同じく関数の名前・コードの版・引数（データの内容ハッシュを含む）
+  ・合計が MAX_BYTES を超えたら使った時刻の古い順に消す（読み込み中のプロセスの
+    マップはそのまま使える。実体は最後のマップが外れたときに解放される）
+
+Arrow の表（store.read_table）と diskcache から読んだ結果は、ファイルのメモリマップ
+なので、もともとページキャッシュを通してプロセス間で共有されている。ここで共有するのは、
+それを DataFrame・numpy 配列に変換したもの（変換のたびにプロセスごとのコピーになるもの）。
+
+既定では使わない（ワーカーが1つなら共有する相手がいないので）。複数のワーカーを
+並べるときに、環境変数 SESERAGISM_SHARED_DIR に置き場を指定して有効にする。
+全ワーカーで同じディレクトリを指定し、メモリ上に置くため tmpfs（/dev/shm）の下にする。
+
+    SESERAGISM_SHARED_DIR=/dev/shm/seseragism-$(id -u) streamlit run app.py --server.port 8501
+
+置き場のファイルは pickle として読むので、ほかのユーザーが書けるディレクトリは使わない。
+置き場が無ければ所有者だけが使える権限（0700）で作り、既にあるときは、このプロセスの
+ユーザーの所有で権限が 0700 のディレクトリ（シンボリックリンクでないもの）でなければ
+共有せずに計算する（ログに警告を出す）。
+
+置き場のファイルはプロセスが終わっても残る（tmpfs なので OS の再起動までメモリを使う）。
+全ワーカーを止めたあとに clear() を呼ぶか、ディレクトリごと消す:
+
+    SESERAGISM_SHARED_DIR=/dev/shm/seseragism-$(id -u) python -c "from seseragism import shared; shared.clear()"
+    rm -rf /dev/shm/seseragism-$(id -u)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import stat
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TypeVar
+
+from seseragism import diskcache
+
+SHARED_DIR_ENV = "SESERAGISM_SHARED_DIR"
+# 置き場を作る tmpfs（Linux）
+SHM_ROOT = Path("/dev/shm")
+
+# 置き場の合計サイズの上限（メモリを使うので、ディスクのキャッシュより小さく）
+MAX_BYTES = 256 * 1024 * 1024
+# 計算中のロック（キーのハッシュで振り分けるファイルの数）
+LOCK_STRIPES = 64
+
+T = TypeVar("T")
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def shared_dir() -> Path | None:
+    """置き場のディレクトリ（SESERAGISM_SHARED_DIR を指定していなければ None）。"""
+    directory = os.environ.get(SHARED_DIR_ENV)
+    return Path(directory) if directory else None
+
+
+def _prepare(directory: Path) -> bool:
+    """置き場を（無ければ 0700 で）作り、安全に使えるか確かめる。"""
+    try:
+        directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        info = directory.lstat()
+    except OSError:
+        _LOGGER.warning("could not create shared store %s", directory, exc_info=True)
+        return False
+    if not hasattr(os, "getuid"):  # 所有者を確かめられない環境では共有しない
+        return False
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid() or info.st_mode & 0o077:
+        _LOGGER.warning(
+            "shared store %s must be a directory owned by uid %d with mode 0700; not sharing",
+            directory, os.getuid(),
+        )
+        return False
+    try:
+        (directory / "locks").mkdir(mode=0o700, exist_ok=True)
+    except OSError:
+        _LOGGER.warning("could not create shared store %s", directory, exc_info=True)
+        return False
+    return True
+
+
+def _load(path: Path) -> object:
+    """エントリを読む（無ければ FileNotFoundError。読めないファイルは消して FileNotFoundError）。"""
+    try:
+        return diskcache.load(path)
+    except FileNotFoundError:
+        raise
+    except Exception:
+        _LOGGER.warning("shared entry %s is unreadable; recomputing", path.name, exc_info=True)
+        path.unlink(missing_ok=True)
+        raise FileNotFoundError(path) from None
+
+
+@contextmanager
+def _locked(directory: Path, name: str) -> Iterator[None]:
+    """name ごとのプロセス間ロック（fcntl が無い環境ではロックしない）。"""
+    try:
+        import fcntl
+    except ImportError:
+        yield
+        return
+    stripe = int(hashlib.sha256(name.encode()).hexdigest()[:8], 16) % LOCK_STRIPES
+    with (directory / "locks" / f"{stripe:02d}.lock").open("a") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def call(func: Callable[..., T], key: object, compute: Callable[[], T]) -> T:
+    """key のエントリを共有の置き場から読む（無ければ compute() の結果を置いてから読む）。"""
+    directory = shared_dir()
+    if directory is None or not _prepare(directory):
+        return compute()
+    path = directory / f"{diskcache.entry_key(func, key)}{diskcache.SUFFIX}"
+    try:
+        value = _load(path)
+    except FileNotFoundError:
+        pass
+    else:
+        try:
+            os.utime(path)  # 使った時刻（追い出しの順番）
+        except OSError:
+            pass
+        return value
+    with _locked(directory, path.name):
+        try:  # 待っている間にほかのプロセスが置いた
+            return _load(path)
+        except FileNotFoundError:
+            pass
+        value = compute()
+        try:
+            diskcache.dump(value, path)
+            diskcache.evict(directory, max_bytes=MAX_BYTES)
+            return diskcache.load(path)
+        except OSError:  # 置き場が一杯など。このプロセスだけで持つ
+            _LOGGER.warning("could not write shared entry for %s", func.__qualname__, exc_info=True)
+            return value
+
+
+def usage() -> dict:
+    """置き場のエントリ数と合計バイト数。"""
+    directory = shared_dir()
+    pattern = f"*{diskcache.SUFFIX}"
+    sizes = [p.stat().st_size for p in directory.glob(pattern)] if directory and directory.is_dir() else []
+    return {"directory": str(directory) if directory else None, "entries": len(sizes), "bytes": sum(sizes)}
+
+
+def clear() -> int:
+    """置き場のエントリとロックのファイルをすべて消し、空になったディレクトリも消す。
+
+    使っているワーカーをすべて止めてから呼ぶ。消したエントリの数を返す。
+    """
+    directory = shared_dir()
+    if directory is None or not directory.is_dir():
+        return 0
+    removed = diskcache.evict(directory, max_bytes=-1)
+    locks = directory / "locks"
+    for path in locks.glob("*.lock"):
+        path.unlink(missing_ok=True)
+    for path in (locks, directory):
+        try:
+            path.rmdir()
+        except OSError:  # 無い・ほかのファイルが残っている
+            pass
+    return removed
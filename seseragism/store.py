@@ -0,0 +1,186 @@
+"""
+列指向のデータストア（Arrow IPC）
+
+データは data/<バージョン>/ 以下に表ごとの Arrow IPC ファイル（.arrow）として置き、
+同じディレクトリの manifest.json に各ファイルの SHA-256 と行数を記録する。
+統計の更新はコードの修正ではなく、新しいバージョンのディレクトリを追加して行う
+（tools/build_data_store.py で CSV から作成できる）。
+
+読み込むバージョンは data/ 以下で名前が最も新しいもの。環境変数
+SESERAGISM_DATA_DIR でバージョンのディレクトリを直接指定することもできる。
+
+ファイルはメモリマップで読み、結果はファイル内容のハッシュをキーにキャッシュする。
+DataFrame への変換結果は、複数のワーカープロセスで1つを共有する（shared）。
+ファイルを差し替えれば（mtime・サイズが変わるので）次の読み込みで自動的に更新される。
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from collections.abc import Callable
+from functools import lru_cache, wraps
+from pathlib import Path
+from typing import TYPE_CHECKING, TypeVar
+
+from seseragism import diskcache, shared
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
+
+DATA_ROOT = Path(__file__).resolve().parent.parent / "data"
+MANIFEST_NAME = "manifest.json"
+DATA_DIR_ENV = "SESERAGISM_DATA_DIR"
+
+# 表の定義（列名 → Arrow の型名）。CSV からの変換と読み込み時の検査で使う。
+TABLES: dict[str, dict[str, str]] = {
+    "population_actual": {"年": "int64", "人口": "int64"},
+    "population_decline_rates": {"年": "int64", "増減率": "float64"},
+    "tourism": {"年": "int64", "観光客数（千人）": "int64"},
+    "businesses": {"年": "int64", "事業所数": "int64"},
+    "population_by_age": {"年齢": "int64", "男": "int64", "女": "int64"},
+    "cohort_rates": {
+        "年齢": "int64",
+        "生残率_男": "float64",
+        "生残率_女": "float64",
+        "出生率": "float64",
+        "純移動率_男": "float64",
+        "純移動率_女": "float64",
+    },
+    "survey_responses": {"回答ID": "int64", "評価": "int64", "三島市在住": "bool", "在住年数": "float64"},
+    "workshop_keywords": {"キーワード": "string", "出現回数": "int64"},
+    "workshop_values": {"カテゴリ": "string", "重要度": "int64"},
+    "workshop_teams": {"班": "string", "キーワード": "string"},
+    "tourism_daily": {"日付": "date32[day]", "観光客数": "int64"},
+    "business_registrations": {"年月": "date32[day]", "登録数": "int64"},
+}
+
+# 版に無くてもよい表（あるときだけ画面に出す、長い時系列など）
+OPTIONAL_TABLES = frozenset({"tourism_daily", "business_registrations"})
+
+# 1プロセスで保持する読み込み結果の上限（表 × 版）
+FRAME_CACHE_MAX_ENTRIES = 64
+# ファイル内容ハッシュを覚えておく数（パス × mtime × サイズ。差し替えのたびに増える）
+DIGEST_CACHE_MAX_ENTRIES = 256
+
+T = TypeVar("T")
+
+
+def data_dir() -> Path:
+    """読み込むバージョンのディレクトリを返す。"""
+    override = os.environ.get(DATA_DIR_ENV)
+    if override:
+        return Path(override)
+    versions = sorted(p for p in DATA_ROOT.iterdir() if (p / MANIFEST_NAME).is_file())
+    if not versions:
+        raise FileNotFoundError(f"{DATA_ROOT} にデータのバージョンがありません")
+    return versions[-1]
+
+
+@lru_cache(maxsize=DIGEST_CACHE_MAX_ENTRIES)
+def _file_digest(path: Path, mtime_ns: int, size: int) -> str:
+    """ファイル内容の SHA-256（mtime とサイズが同じ間は再計算しない）。"""
+    h = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def file_digest(path: Path) -> str:
+    """ファイル内容の SHA-256 を返す（キャッシュのキー）。"""
+    stat = path.stat()
+    return _file_digest(path, stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=8)
+def _read_manifest(path: Path, digest: str) -> dict:
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def manifest(directory: Path | None = None) -> dict:
+    """バージョンの manifest.json を返す。"""
+    path = (directory or data_dir()) / MANIFEST_NAME
+    return _read_manifest(path, file_digest(path))
+
+
+def table_path(name: str) -> Path:
+    """表のファイルパスを返す。"""
+    directory = data_dir()
+    entry = manifest(directory)["tables"].get(name)
+    if entry is None:
+        raise KeyError(f"{directory}: 表 {name!r} は manifest にありません")
+    return directory / entry["file"]
+
+
+def has_table(name: str) -> bool:
+    """読み込むバージョンに表があるか。"""
+    return name in manifest()["tables"]
+
+
+def table_digest(name: str) -> str:
+    """表のファイル内容ハッシュ（キャッシュのキー）。"""
+    return file_digest(table_path(name))
+
+
+@lru_cache(maxsize=FRAME_CACHE_MAX_ENTRIES)
+def _read_table(name: str, path: Path, digest: str) -> pa.Table:
+    import pyarrow as pa
+
+    expected = manifest(path.parent)["tables"][name]["sha256"]
+    if digest != expected:
+        raise ValueError(f"{path}: 内容が manifest の SHA-256 と一致しません")
+    with pa.memory_map(str(path)) as source:
+        table = pa.ipc.open_file(source).read_all()
+    missing = set(TABLES.get(name, {})) - set(table.column_names)
+    if missing:
+        raise ValueError(f"{path}: 列 {sorted(missing)} がありません")
+    return table
+
+
+@lru_cache(maxsize=FRAME_CACHE_MAX_ENTRIES)
+def _read_frame(name: str, path: Path, digest: str) -> pd.DataFrame:
+    # to_pandas はプロセスごとのコピーになるので、ワーカー間の共有の置き場を通す。
+    # 日付の列は datetime64 にする（datetime.date の object 列はバッファとして共有できない）
+    return shared.call(
+        _read_frame, (name, digest), lambda: _read_table(name, path, digest).to_pandas(date_as_object=False)
+    )
+
+
+def read_table(name: str) -> pa.Table:
+    """表を Arrow Table として読む（メモリマップ上のバッファをそのまま参照する）。"""
+    path = table_path(name)
+    return _read_table(name, path, file_digest(path))
+
+
+def read_frame(name: str) -> pd.DataFrame:
+    """表を DataFrame として読む。結果は共有されるので変更しないこと。"""
+    path = table_path(name)
+    return _read_frame(name, path, file_digest(path))
+
+
+def cached_on(*tables: str, persist: bool = False) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """関数の結果を、引数と指定した表の内容ハッシュをキーにメモ化するデコレータ。
+
+    表が差し替えられるとキーが変わるので、派生指標も自動的に計算し直される。
+    persist=True なら、同じキーでディスクのキャッシュ（diskcache）にも保存する。
+    """
+
+    def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        @lru_cache(maxsize=FRAME_CACHE_MAX_ENTRIES)
+        def cached(digests: tuple[str, ...], *args, **kwargs) -> T:
+            if persist:
+                key = (digests, args, sorted(kwargs.items()))
+                return diskcache.call(func, key, lambda: func(*args, **kwargs))
+            return func(*args, **kwargs)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs) -> T:
+            return cached(tuple(table_digest(t) for t in tables), *args, **kwargs)
+
+        wrapper.cache_clear = cached.cache_clear  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
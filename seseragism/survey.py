@@ -0,0 +1,143 @@
+"""
+アンケートの集計（回答者単位）
+
+回答者1人を1行とするデータ（回答ID, 評価, 三島市在住, 在住年数）を読み込み、
+スコア分布・平均・最頻値・高評価の割合・在住者の集計をベクトル演算で求める。
+
+既定ではデータストアの survey_responses 表を読む。環境変数
+SESERAGISM_SURVEY_FILE（または関数の path 引数）で、アンケートシステムから
+書き出した CSV / Parquet をそのまま読み込むこともできる。集計結果は
+ファイル内容のハッシュごとにキャッシュされる。
+
+    評価       … 設問1「地域活性化の現状評価」（10点満点）。未回答は空欄
+    三島市在住 … 三島市に住んでいるか（true / false）
+    在住年数   … 三島市での在住年数。在住者以外は空欄
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from seseragism import shared, store
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+RESPONSES_TABLE = "survey_responses"
+SURVEY_FILE_ENV = "SESERAGISM_SURVEY_FILE"
+COLUMNS = store.TABLES[RESPONSES_TABLE]
+
+
+@dataclass(frozen=True)
+class SurveySummary:
+    """設問1の評価と回答者属性の集計。"""
+
+    respondents: int
+    scored: int  # 設問1に回答した人数
+    mean: float
+    mode: int
+    high_threshold: int
+    high_share_pct: float  # high_threshold 点以上の割合（%、設問1の回答者に対する）
+    residents: int
+    mean_residency_years: float
+
+
+def _source(path: Path | str | None) -> Path:
+    if path is None:
+        path = os.environ.get(SURVEY_FILE_ENV) or store.table_path(RESPONSES_TABLE)
+    return Path(path)
+
+
+@lru_cache(maxsize=8)
+def _read_responses(path: Path, digest: str) -> pd.DataFrame:
+    # 回答は大きくなりうるので、複数のワーカープロセスで1つを共有する
+    return shared.call(_read_responses, (path, digest), lambda: _load_responses(path))
+
+
+def _load_responses(path: Path) -> pd.DataFrame:
+    import pandas as pd
+
+    columns = list(COLUMNS)
+    suffix = path.suffix.lower()
+    if suffix == ".csv":
+        return pd.read_csv(path, usecols=columns)
+    if suffix == ".parquet":
+        return pd.read_parquet(path, columns=columns)
+    if suffix in (".arrow", ".feather"):
+        from pyarrow import feather
+
+        return feather.read_table(path, columns=columns, memory_map=True).to_pandas()
+    raise ValueError(f"{path}: 対応していない形式です（CSV / Parquet / Arrow）")
+
+
+def load_responses(path: Path | str | None = None) -> pd.DataFrame:
+    """回答者単位のデータを読む。結果は共有されるので変更しないこと。"""
+    source = _source(path)
+    return _read_responses(source, store.file_digest(source))
+
+
+def _scores(responses: pd.DataFrame):
+    """設問1の評価（未回答を除いた整数の配列）。"""
+    import numpy as np
+
+    scores = responses["評価"].to_numpy(dtype=float, na_value=np.nan)
+    return scores[~np.isnan(scores)].astype(np.int64)
+
+
+def score_histogram(responses: pd.DataFrame) -> pd.DataFrame:
+    """設問1の回答分布（点数, 回答数）。最低点から最高点まで、0件の点数も含む。"""
+    import numpy as np
+    import pandas as pd
+
+    scores = _scores(responses)
+    if scores.size == 0:
+        return pd.DataFrame({"点数": [], "回答数": []}, dtype="int64")
+    low = int(scores.min())
+    counts = np.bincount(scores - low)
+    return pd.DataFrame({"点数": np.arange(low, low + counts.size), "回答数": counts})
+
+
+def summarize(responses: pd.DataFrame, high_threshold: int = 7) -> SurveySummary:
+    """回答者単位のデータを集計する。"""
+    import numpy as np
+
+    scores = _scores(responses)
+    resident = responses["三島市在住"].to_numpy(dtype=bool, na_value=False)
+    years = responses["在住年数"].to_numpy(dtype=float, na_value=np.nan)[resident]
+    counts = np.bincount(scores - scores.min()) if scores.size else np.zeros(1, dtype=np.int64)
+    return SurveySummary(
+        respondents=len(responses),
+        scored=int(scores.size),
+        mean=float(scores.mean()) if scores.size else float("nan"),
+        mode=int(scores.min() + counts.argmax()) if scores.size else 0,
+        high_threshold=high_threshold,
+        high_share_pct=float((scores >= high_threshold).mean() * 100) if scores.size else 0.0,
+        residents=int(resident.sum()),
+        mean_residency_years=float(np.nanmean(years)) if np.isfinite(years).any() else float("nan"),
+    )
+
+
+@lru_cache(maxsize=16)
+def _summary(path: Path, digest: str, high_threshold: int) -> SurveySummary:
+    return summarize(_read_responses(path, digest), high_threshold)
+
+
+@lru_cache(maxsize=16)
+def _histogram(path: Path, digest: str) -> pd.DataFrame:
+    return score_histogram(_read_responses(path, digest))
+
+
+def survey_summary(path: Path | str | None = None, high_threshold: int = 7) -> SurveySummary:
+    """アンケートの集計（ファイルの版ごとにキャッシュ）。"""
+    source = _source(path)
+    return _summary(source, store.file_digest(source), high_threshold)
+
+
+def survey_scores(path: Path | str | None = None) -> pd.DataFrame:
+    """設問1の回答分布（ファイルの版ごとにキャッシュ）。結果は変更しないこと。"""
+    source = _source(path)
+    return _histogram(source, store.file_digest(source))
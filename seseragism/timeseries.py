@@ -0,0 +1,187 @@
+"""
+長い時系列の間引き（ダウンサンプリング）
+
+日別の観光客数や月別の事業所登録数のように点数の多い系列は、全点をブラウザに送らず、
+グラフの横幅（ピクセル数）に見合う点数まで間引いてから描く。
+  ・LTTB（Largest-Triangle-Three-Buckets）… 区間ごとに、折れ線の形を最もよく保つ1点を選ぶ
+  ・min-max                                … 区間ごとの最小・最大の2点を残す（突出した日を落とさない）
+表示期間を狭めたときは、その期間だけを切り出して間引き直すので、拡大するほど細かくなる。
+
+x は昇順の数値または datetime64 の配列。欠測（NaN）は事前に除いておくこと。
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from seseragism import shared, store
+
+if TYPE_CHECKING:
+    import datetime
+
+    import numpy as np
+    import pandas as pd
+
+# 間引いた後の点数の目安（メイン列のグラフの横幅 px 程度）
+PIXEL_BUDGET = 1200
+# これより点数が多い系列は WebGL（Scattergl）で描く
+WEBGL_THRESHOLD = 1000
+
+# 長い系列の表 → (x の列, y の列, 間引き方)。表はデータストアにあるときだけ表示する。
+LONG_SERIES: dict[str, tuple[str, str, str]] = {
+    "tourism_daily": ("日付", "観光客数", "minmax"),
+    "business_registrations": ("年月", "登録数", "lttb"),
+}
+
+
+@dataclass(frozen=True)
+class SeriesView:
+    """表示期間を切り出して間引いた系列。"""
+
+    frame: pd.DataFrame  # x の列, y の列（間引き後）
+    points: int  # 表示期間内の元の点数
+    first: datetime.date  # 系列全体の最初と最後（期間を選ぶスライダーの範囲）
+    last: datetime.date
+
+
+def _numeric(x: np.ndarray) -> np.ndarray:
+    """x を先頭からの差の float にする（datetime64 でも面積の計算に使えるように）。"""
+    import numpy as np
+
+    if np.issubdtype(x.dtype, np.datetime64):
+        x = x.view(np.int64)
+    return (x - x[0]).astype(np.float64)
+
+
+def window(x: np.ndarray, y: np.ndarray, start=None, end=None) -> tuple[np.ndarray, np.ndarray]:
+    """x が start 以上・end 以下の部分（x は昇順。コピーしない）。"""
+    import numpy as np
+
+    lo = 0 if start is None else int(np.searchsorted(x, start, side="left"))
+    hi = len(x) if end is None else int(np.searchsorted(x, end, side="right"))
+    return x[lo:hi], y[lo:hi]
+
+
+def lttb(x: np.ndarray, y: np.ndarray, n: int) -> np.ndarray:
+    """LTTB で n 点に間引いたときの添字（昇順。先頭と末尾の点を含む）。"""
+    import numpy as np
+
+    size = len(y)
+    if n >= size or n < 3:
+        return np.arange(size)
+    xs = _numeric(x)
+    ys = np.asarray(y, dtype=np.float64)
+
+    # 先頭・末尾を除いた点を n - 2 個の区間に分け、各区間の平均を累積和でまとめて求める
+    edges = np.linspace(1, size - 1, n - 1).astype(np.int64)
+    cx = np.concatenate(([0.0], np.cumsum(xs)))
+    cy = np.concatenate(([0.0], np.cumsum(ys)))
+    widths = np.diff(edges)
+    mean_x = np.append((cx[edges[1:]] - cx[edges[:-1]]) / widths, xs[-1])
+    mean_y = np.append((cy[edges[1:]] - cy[edges[:-1]]) / widths, ys[-1])
+
+    selected = np.empty(n, dtype=np.int64)
+    selected[0], selected[-1] = 0, size - 1
+    a = 0
+    for i in range(n - 2):
+        lo, hi = edges[i], edges[i + 1]
+        # 直前に選んだ点 a・次の区間の平均と作る三角形の面積（の2倍）が最大の点を選ぶ
+        area = np.abs(
+            (xs[a] - mean_x[i + 1]) * (ys[lo:hi] - ys[a]) - (xs[a] - xs[lo:hi]) * (mean_y[i + 1] - ys[a])
+        )
+        a = lo + int(area.argmax())
+        selected[i + 1] = a
+    return selected
+
+
+def minmax(y: np.ndarray, n: int) -> np.ndarray:
+    """n / 2 個の区間ごとに最小・最大の点を残したときの添字（昇順。先頭と末尾の点を含む）。"""
+    import numpy as np
+
+    size = len(y)
+    if n >= size or n < 4:
+        return np.arange(size)
+    width = -(-size // (n // 2))
+    buckets = -(-size // width)  # 埋め草だけの区間ができないよう、幅から区間数を決め直す
+    # 区間の長さを揃えて (区間, 幅) の2次元にし、行ごとに argmin / argmax を取る
+    padded = np.empty(buckets * width, dtype=np.float64)
+    padded[:size] = y
+    offsets = np.arange(buckets) * width
+    padded[size:] = np.inf
+    low = offsets + padded.reshape(buckets, width).argmin(axis=1)
+    padded[size:] = -np.inf
+    high = offsets + padded.reshape(buckets, width).argmax(axis=1)
+    return np.unique(np.concatenate(([0, size - 1], low, high)))
+
+
+def downsample(
+    x: np.ndarray, y: np.ndarray, budget: int = PIXEL_BUDGET, method: str = "lttb"
+) -> tuple[np.ndarray, np.ndarray]:
+    """budget 点程度に間引いた (x, y)。点数が budget 以下ならそのまま返す。"""
+    if method == "lttb":
+        index = lttb(x, y, budget)
+    elif method == "minmax":
+        index = minmax(y, budget)
+    else:
+        raise ValueError(f"間引き方 {method!r} は lttb / minmax のいずれか")
+    return x[index], y[index]
+
+
+# ============================================================
+# ダッシュボード用（データストアの長い系列を使う）
+# ============================================================
+@lru_cache(maxsize=8)
+def _arrays(name: str, digest: str) -> tuple[np.ndarray, np.ndarray]:
+    # 日付・値の配列への変換（と並べ替え）はコピーになるので、複数のワーカープロセスで1つを共有する
+    return shared.call(_arrays, (name, digest), lambda: _load_arrays(name))
+
+
+def _load_arrays(name: str) -> tuple[np.ndarray, np.ndarray]:
+    import numpy as np
+
+    x_column, y_column, _ = LONG_SERIES[name]
+    table = store.read_table(name)
+    x = table.column(x_column).to_numpy()
+    y = table.column(y_column).to_numpy().astype(np.float64, copy=False)
+    if not (x[1:] >= x[:-1]).all():
+        order = np.argsort(x, kind="stable")
+        x, y = x[order], y[order]
+    return x, y
+
+
+@lru_cache(maxsize=store.FRAME_CACHE_MAX_ENTRIES)
+def _view(name: str, digest: str, start, end, budget: int) -> SeriesView:
+    import pandas as pd
+
+    x_column, y_column, method = LONG_SERIES[name]
+    x, y = _arrays(name, digest)
+    xs, ys = window(x, y, start, end)
+    points = len(xs)
+    xs, ys = downsample(xs, ys, budget, method)
+    return SeriesView(
+        frame=pd.DataFrame({x_column: xs, y_column: ys}),
+        points=points,
+        first=x[0].astype("datetime64[D]").item(),
+        last=x[-1].astype("datetime64[D]").item(),
+    )
+
+
+def series_view(
+    name: str,
+    start: datetime.date | None = None,
+    end: datetime.date | None = None,
+    budget: int = PIXEL_BUDGET,
+) -> SeriesView | None:
+    """長い系列の表示期間を切り出して間引く（期間と表の版ごとにキャッシュ）。
+
+    表がデータストアに無いときは None。結果は共有されるので変更しないこと。
+    """
+    import numpy as np
+
+    if not store.has_table(name):
+        return None
+    start = None if start is None else np.datetime64(start, "D")
+    end = None if end is None else np.datetime64(end, "D")
+    return _view(name, store.table_digest(name), start, end, budget)
@@ -0,0 +1,151 @@
+"""
+処理時間の計測（常時有効の軽量スパン）
+
+ページの描画・チャートの構築・Markdown の送信などを span() / timed() で囲み、
+名前ごとに直近 SPAN_HISTORY 件の所要時間をプロセス内に残す（全セッション共通）。
+1回の記録は perf_counter 2回とロック付きの追加だけなので、常に有効にしておける。
+
+  ・summary()      … 名前ごとの件数と p50 / p95 / p99（ms）
+  ・to_jsonl()     … 保持している記録を JSON Lines にする（オフラインの分析用）
+環境変数 SESERAGISM_TIMING_LOG にファイルを指定すると、記録のたびに1行ずつ追記もする。
+
+記録にはその時点で描画中のページ（page_context() で設定）の名前も残すので、
+チャートの構築時間をページごとに分けて見られる。
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import statistics
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from functools import wraps
+from typing import TypeVar
+
+# 名前ごとに保持する直近の記録数
+SPAN_HISTORY = 1024
+TIMING_LOG_ENV = "SESERAGISM_TIMING_LOG"
+
+T = TypeVar("T")
+
+_current_page: ContextVar[str] = ContextVar("seseragism_timing_page", default="")
+
+
+@dataclass(frozen=True)
+class Span:
+    """1回分の記録。"""
+
+    kind: str  # page / figure / chart / markdown など
+    name: str
+    page: str
+    started: float  # UNIX 時刻（秒）
+    ms: float
+
+
+@dataclass(frozen=True)
+class SpanStats:
+    """名前ごとの集計（ms）。"""
+
+    kind: str
+    name: str
+    count: int
+    p50: float
+    p95: float
+    p99: float
+    last: float
+
+
+class Recorder:
+    """記録の保持と集計（スレッドセーフ）。"""
+
+    def __init__(self, history: int = SPAN_HISTORY) -> None:
+        self._history = history
+        self._lock = threading.Lock()
+        self._spans: dict[tuple[str, str], deque[Span]] = {}
+
+    def record(self, span: Span) -> None:
+        with self._lock:
+            key = (span.kind, span.name)
+            spans = self._spans.get(key)
+            if spans is None:
+                spans = self._spans[key] = deque(maxlen=self._history)
+            spans.append(span)
+        log = os.environ.get(TIMING_LOG_ENV)
+        if log:
+            with open(log, "a", encoding="utf-8") as f:
+                f.write(json.dumps(asdict(span), ensure_ascii=False) + "\n")
+
+    def spans(self) -> list[Span]:
+        """保持している記録（開始時刻順）。"""
+        with self._lock:
+            spans = [s for group in self._spans.values() for s in group]
+        return sorted(spans, key=lambda s: s.started)
+
+    def summary(self) -> list[SpanStats]:
+        """名前ごとの集計（種類・p95 の大きい順）。"""
+        with self._lock:
+            groups = {key: [s.ms for s in spans] for key, spans in self._spans.items()}
+        stats = []
+        for (kind, name), values in groups.items():
+            if len(values) > 1:
+                cuts = statistics.quantiles(values, n=100, method="inclusive")
+                p50, p95, p99 = cuts[49], cuts[94], cuts[98]
+            else:
+                p50 = p95 = p99 = values[0]
+            stats.append(SpanStats(kind, name, len(values), p50, p95, p99, values[-1]))
+        return sorted(stats, key=lambda s: (s.kind, -s.p95))
+
+    def to_jsonl(self) -> str:
+        """保持している記録を JSON Lines にする。"""
+        return "".join(json.dumps(asdict(s), ensure_ascii=False) + "\n" for s in self.spans())
+
+    def clear(self) -> None:
+        with self._lock:
+            self._spans.clear()
+
+
+RECORDER = Recorder()
+
+
+@contextmanager
+def span(kind: str, name: str) -> Iterator[None]:
+    """with ブロックの所要時間を記録する。"""
+    started = time.time()
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        ms = (time.perf_counter() - t0) * 1000
+        RECORDER.record(Span(kind, name, _current_page.get(), started, ms))
+
+
+@contextmanager
+def page_context(name: str) -> Iterator[None]:
+    """ブロック内の記録に、描画中のページ名を付ける。"""
+    token = _current_page.set(name)
+    try:
+        yield
+    finally:
+        _current_page.reset(token)
+
+
+def timed(kind: str, name: str | None = None) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """関数の呼び出しごとに所要時間を記録するデコレータ（名前の既定は関数名）。"""
+
+    def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        label = name or func.__name__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs) -> T:
+            with span(kind, label):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,120 @@
+"""
+起動時のキャッシュのウォームアップと準備完了の通知
+
+デプロイや再起動の直後は、最初の閲覧者がデータの読み込み・集計・チャートの構築を
+すべて待つことになる。サーバーの起動時に Warmup.start() で処理（名前 → 引数なしの関数）
+をスレッドプールで並列に実行し、プロセス内のキャッシュを温めておく。
+
+  1. データストアの全表の読み込み（data_tasks()。各ページが共通で使う入力）
+  2. start() に渡した関数が返す処理（ダッシュボードの各ページの描画など）を並列に
+処理の一覧を作る関数もバックグラウンドで呼ぶので、スクリプトの読み込みなどの
+重い準備でサーバーの起動を待たせない。
+キャッシュはこのプロセスのメモリにあるので、別プロセス（ProcessPool）では温まらない。
+numpy / pyarrow の処理は GIL を手放すので、スレッドでも並列に進む。
+
+すべて終わると ready になり、環境変数 SESERAGISM_READY_FILE にファイルを指定していれば、
+そこに結果（JSON）を書く（開始時に古いファイルは消す）。失敗した処理があっても
+ready にはする（そのページのキャッシュが冷えているだけなので）。失敗は status() の
+errors に残し、ログにも出す。
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from seseragism import store
+
+READY_FILE_ENV = "SESERAGISM_READY_FILE"
+# ウォームアップのスレッド名の接頭辞（ログの絞り込み用）
+THREAD_NAME = "seseragism-warmup"
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def data_tasks() -> dict[str, Callable[[], object]]:
+    """データストアの全表を読み込む処理（表名 → 関数）。"""
+    return {
+        f"table:{name}": (lambda name=name: store.read_frame(name))
+        for name in store.TABLES
+        if store.has_table(name)
+    }
+
+
+class Warmup:
+    """ウォームアップの実行と状態（プロセスに1つ。start() は最初の1回だけ有効）。"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+        self._started: float | None = None
+        self._seconds: float | None = None
+        self._timings: dict[str, float] = {}
+        self._errors: dict[str, str] = {}
+
+    def start(self, tasks: Callable[[], dict[str, Callable[[], object]]], workers: int | None = None) -> bool:
+        """バックグラウンドのスレッドで開始する（開始済みなら何もせず False）。"""
+        with self._lock:
+            if self._started is not None:
+                return False
+            self._started = time.perf_counter()
+        ready_file = os.environ.get(READY_FILE_ENV)
+        if ready_file:
+            Path(ready_file).unlink(missing_ok=True)
+        threading.Thread(target=self._run, args=(tasks, workers), name=THREAD_NAME, daemon=True).start()
+        return True
+
+    def _run_task(self, name: str, func: Callable[[], object]) -> None:
+        started = time.perf_counter()
+        try:
+            func()
+        except Exception as exc:  # 1つの失敗で残りを止めない
+            _LOGGER.exception("warm-up task %s failed", name)
+            self._errors[name] = f"{type(exc).__name__}: {exc}"
+        self._timings[name] = round((time.perf_counter() - started) * 1000, 1)
+
+    def _run(self, tasks: Callable[[], dict[str, Callable[[], object]]], workers: int | None) -> None:
+        try:
+            for make_stage in (data_tasks, tasks):
+                stage: dict[str, Callable[[], object]] = {}
+                self._run_task(make_stage.__name__, lambda: stage.update(make_stage()))
+                with ThreadPoolExecutor(max_workers=workers or max(len(stage), 1),
+                                        thread_name_prefix=THREAD_NAME) as pool:
+                    for name, func in stage.items():
+                        pool.submit(self._run_task, name, func)
+        finally:
+            self._seconds = time.perf_counter() - self._started
+            self._done.set()
+            _LOGGER.info("warm-up finished in %.1f s (%d errors)", self._seconds, len(self._errors))
+            ready_file = os.environ.get(READY_FILE_ENV)
+            if ready_file:
+                Path(ready_file).write_text(json.dumps(self.status(), ensure_ascii=False), encoding="utf-8")
+
+    @property
+    def ready(self) -> bool:
+        return self._done.is_set()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """終わるまで待つ（timeout 秒で打ち切ったら False）。"""
+        return self._done.wait(timeout)
+
+    def status(self) -> dict:
+        """状態（準備完了か・経過秒・処理ごとの ms・失敗）。"""
+        started = self._started is not None
+        seconds = self._seconds if self.ready else (time.perf_counter() - self._started if started else 0.0)
+        return {
+            "ready": self.ready,
+            "started": started,
+            "seconds": round(seconds, 2),
+            "tasks_ms": dict(self._timings),
+            "errors": dict(self._errors),
+        }
+
+
+WARMUP = Warmup()
@@ -0,0 +1,23 @@
+"""
+テストの共通設定
+
+リポジトリのルートを import の対象に入れ、ディスクのキャッシュ・共有の置き場は
+テストごとの一時ディレクトリに向ける（開発中の .cache/ や /dev/shm を汚さない）。
+
+使い方:
+    python -m pytest -q
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+
+@pytest.fixture(autouse=True)
+def _isolated_caches(tmp_path, monkeypatch):
+    monkeypatch.setenv("SESERAGISM_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.delenv("SESERAGISM_SHARED_DIR", raising=False)
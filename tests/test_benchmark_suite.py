@@ -0,0 +1,89 @@
+"""tools/benchmark_suite.py（ベンチマークの履歴と悪化の判定）のテスト。"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+
+import benchmark_suite  # noqa: E402
+
+
+def _record(host="box", python="3.11.7", import_ms=100.0, first_ms=50.0, rerun_ms=20.0):
+    return {
+        "host": host,
+        "python": python,
+        "startup": {"import_dashboard_ms": import_ms, "server_ready_ms": 900.0},
+        "pages": {"(default)": {"first_ms": first_ms, "rerun_ms": rerun_ms, "messages": 10, "bytes": 1000}},
+    }
+
+
+def test_previous_record_matches_host_and_python():
+    history = [_record(import_ms=1), _record(host="other", import_ms=2), _record(python="3.12", import_ms=3)]
+    assert benchmark_suite.previous_record(history, _record())["startup"]["import_dashboard_ms"] == 1
+    assert benchmark_suite.previous_record(history, _record(host="new")) is None
+
+
+def test_regressions_use_the_threshold():
+    before = _record()
+    after = _record(import_ms=115.0, first_ms=54.0, rerun_ms=30.0)
+    assert benchmark_suite.regressions(after, before, 10) == [
+        "startup.import_dashboard_ms", "(default).rerun_ms",
+    ]
+    assert benchmark_suite.regressions(after, None, 10) == []
+
+
+def test_new_pages_and_zero_baselines_are_not_regressions():
+    before = _record(rerun_ms=0.0)
+    after = _record(rerun_ms=5.0)
+    after["pages"]["new"] = {"first_ms": 999.0, "rerun_ms": 999.0}
+    assert benchmark_suite.regressions(after, before, 10) == []
+
+
+def test_load_history_reads_json_lines(tmp_path):
+    path = tmp_path / "history.jsonl"
+    assert benchmark_suite.load_history(path) == []
+    path.write_text("\n".join(json.dumps(r) for r in (_record(import_ms=1), _record(import_ms=2))) + "\n\n")
+    assert [r["startup"]["import_dashboard_ms"] for r in benchmark_suite.load_history(path)] == [1, 2]
+
+
+def test_server_starts_without_disk_cache_or_shared_memory(monkeypatch):
+    started = {}
+
+    class _Server:
+        def __init__(self, script, env=None):
+            started.update(script=script, env=env)
+
+        def __enter__(self):
+            raise RuntimeError("stop")
+
+        def __exit__(self, *exc):
+            return False
+
+    monkeypatch.setattr(benchmark_suite, "measure_import", lambda script: {"import_dashboard_ms": 0.0})
+    monkeypatch.setattr(benchmark_suite, "serve_app", _Server)
+    with pytest.raises(RuntimeError, match="stop"):
+        benchmark_suite.run(1)
+    assert started["script"] == "dashboard.py"
+    assert started["env"]["SESERAGISM_CACHE_DIR"] == ""
+    assert started["env"]["SESERAGISM_SHARED_DIR"] is None
+
+
+def test_serve_app_drops_variables_set_to_none(monkeypatch):
+    import st_client
+
+    captured = {}
+
+    def _popen(args, env, **kwargs):
+        captured.update(env)
+        raise RuntimeError("stop")
+
+    monkeypatch.setenv("SESERAGISM_SHARED_DIR", "/dev/shm/seseragism-test")
+    monkeypatch.setattr(st_client.subprocess, "Popen", _popen)
+    with pytest.raises(RuntimeError, match="stop"):
+        with st_client.serve_app("dashboard.py", env=benchmark_suite.COLD_CACHE_ENV):
+            pass
+    assert captured["SESERAGISM_CACHE_DIR"] == ""
+    assert "SESERAGISM_SHARED_DIR" not in captured
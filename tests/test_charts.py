@@ -0,0 +1,44 @@
+"""seseragism/charts.py（図の組み立てとシリアライズ）のテスト。"""
+
+import gc
+import json
+
+import numpy as np
+import plotly.io as pio
+
+from seseragism import charts
+
+
+def _figure(height=None):
+    layout = {"height": height} if height else {}
+    return charts.figure([{"type": "bar", "x": np.arange(3), "y": np.array([3.0, 1.0, 2.0])}], layout)
+
+
+def test_figures_use_the_registered_template():
+    fig = _figure()
+    assert charts.TEMPLATE_NAME in pio.templates
+    assert fig.to_dict()["layout"]["template"] == charts.template()
+    assert charts.validate(fig).layout.template.layout.plot_bgcolor == charts.TEMPLATE_LAYOUT["plot_bgcolor"]
+
+
+def test_spec_matches_what_st_plotly_chart_sends():
+    fig = _figure(300)
+    sent = pio.to_json(fig.to_dict(), validate=False)
+    assert json.loads(charts.spec(fig)) == json.loads(sent)
+
+
+def test_spec_is_serialized_once_per_figure():
+    fig, other = _figure(), _figure(200)
+    first = charts.spec(fig)
+    assert charts.spec(fig) is first
+    assert charts.spec(other) != first
+
+
+def test_spec_is_released_with_the_figure():
+    fig = _figure()
+    charts.spec(fig)
+    key = id(fig)
+    assert key in charts._specs
+    del fig
+    gc.collect()
+    assert key not in charts._specs
@@ -0,0 +1,93 @@
+"""seseragism.cohort（年齢 × 男女別の推計）のテスト。"""
+
+import numpy as np
+
+from seseragism import cohort, data
+
+AGES = 100
+
+
+def _rates(seed: int = 0):
+    rng = np.random.default_rng(seed)
+    survival = rng.uniform(0.9, 1.0, (2, AGES))
+    fertility = np.where((np.arange(AGES) >= 15) & (np.arange(AGES) < 50), rng.uniform(0, 0.08, AGES), 0.0)
+    migration = rng.uniform(-0.02, 0.02, (2, AGES))
+    return survival, fertility, migration
+
+
+def _leslie(survival, fertility, migration) -> np.ndarray:
+    """1年分の推計を密な行列（性 × 年齢 を並べた 200 × 200）で書いたもの。"""
+    n = AGES
+    matrix = np.zeros((2 * n, 2 * n))
+    for sex in (cohort.MALE, cohort.FEMALE):
+        block = slice(sex * n, (sex + 1) * n)
+        sub = np.zeros((n, n))
+        sub[np.arange(1, n), np.arange(n - 1)] = survival[sex, :-1]
+        sub[n - 1, n - 1] += survival[sex, -1]
+        share = cohort.BIRTH_MALE_SHARE if sex == cohort.MALE else 1 - cohort.BIRTH_MALE_SHARE
+        matrix[block, block] = sub
+        matrix[sex * n, cohort.FEMALE * n:] = fertility * share * survival[sex, 0]
+    return np.diag(1 + migration.reshape(-1)) @ matrix
+
+
+def test_one_step_matches_dense_leslie_matrix():
+    survival, fertility, migration = _rates()
+    base = np.random.default_rng(1).uniform(100, 1000, (2, AGES))
+    paths = cohort.project(base, survival, fertility, migration, years=3)
+    matrix = _leslie(survival, fertility, migration)
+    state = base.reshape(-1)
+    for t in range(1, 4):
+        state = matrix @ state
+        np.testing.assert_allclose(paths[t].reshape(-1), state, rtol=1e-12)
+    np.testing.assert_array_equal(paths[0], base)
+
+
+def test_closed_population_without_births_only_ages():
+    base = np.ones((2, AGES))
+    paths = cohort.project(base, np.ones((2, AGES)), np.zeros(AGES), np.zeros((2, AGES)), years=5)
+    np.testing.assert_allclose(paths.sum(axis=(1, 2)), 2 * AGES)  # 死亡・移動・出生なしなら総数は一定
+    np.testing.assert_array_equal(paths[5][:, :5], 0)
+
+
+def test_scenarios_match_single_runs():
+    survival, fertility, migration = _rates(2)
+    base = np.random.default_rng(3).uniform(100, 1000, (2, AGES))
+    rates = cohort.CohortRates(survival, fertility, migration)
+    assumptions = (cohort.Assumptions(), cohort.Assumptions(fertility=1.2, youth_outflow=0.0))
+    scenario = cohort.scenario_rates(rates, assumptions)
+    swept = cohort.project(base, scenario.survival, scenario.fertility, scenario.migration, years=4)
+    for i in range(len(assumptions)):
+        single = cohort.project(base, survival, scenario.fertility[i], scenario.migration[i], years=4)
+        np.testing.assert_allclose(swept[i], single)
+
+
+def test_youth_outflow_only_scales_outflow_in_youth_ages():
+    survival, fertility, migration = _rates(4)
+    rates = cohort.CohortRates(survival, fertility, migration)
+    scaled = cohort.scenario_rates(rates, (cohort.Assumptions(youth_outflow=0.5),)).migration[0]
+    low, high = cohort.YOUTH_AGES
+    youth_out = np.zeros(AGES, dtype=bool)
+    youth_out[low:high] = True
+    affected = youth_out & (migration < 0)
+    np.testing.assert_allclose(scaled[affected], migration[affected] * 0.5)
+    np.testing.assert_allclose(scaled[~affected], migration[~affected])
+
+
+def test_dashboard_outputs_follow_the_base_data():
+    projection = cohort.cohort_projection(years=10)
+    totals = projection.totals()
+    groups = projection.age_groups()
+    actual = data.population_actual()
+    assert totals["年"].tolist() == list(range(cohort.base_year(), cohort.base_year() + 11))
+    assert abs(int(totals["人口"].iloc[0]) - int(actual["人口"].iloc[-1])) <= 1
+    # 年齢区分は 0〜99 歳を重ならずに覆う（丸めの差は区分の数まで）
+    assert [(low, high) for _, low, high in cohort.AGE_GROUPS] == [(0, 15), (15, 40), (40, 65), (65, 100)]
+    np.testing.assert_allclose(groups.iloc[:, 1:].sum(axis=1), totals["人口"], atol=len(cohort.AGE_GROUPS))
+
+
+def test_youth_outflow_paths_have_named_scenarios():
+    paths = cohort.youth_outflow_paths(years=10)
+    assert list(paths.columns) == ["年"] + [name for name, _ in cohort.YOUTH_SCENARIOS]
+    last = paths.iloc[-1]
+    assert last["現状"] < last["半減"] < last["なし"]
+    assert paths.iloc[0]["現状"] == paths.iloc[0]["なし"]
@@ -0,0 +1,45 @@
+"""seseragism.cooccurrence（班 × キーワードの共起）のテスト。"""
+
+import numpy as np
+import pytest
+
+from seseragism import cooccurrence
+
+GROUPS = [
+    ("A", ["水", "歴史", "水"]),  # 同じ班の重複は1つに数える
+    ("B", ["水", "食"]),
+    ("C", []),
+    ("D", ["食", "歴史", "自然"]),
+]
+
+
+def test_cooccurrence_matches_dense_product():
+    inc = cooccurrence.incidence(GROUPS)
+    dense = inc.to_frame().to_numpy()
+    assert dense.max() == 1
+    result = cooccurrence.cooccurrence(inc)
+    np.testing.assert_array_equal(result.to_numpy(), dense.T @ dense)
+    assert list(result.index) == list(inc.keywords)
+
+
+def test_keywords_ordered_by_group_frequency_then_first_seen():
+    inc = cooccurrence.incidence(GROUPS)
+    assert inc.keywords == ("水", "歴史", "食", "自然")
+    assert inc.shape == (4, 4)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_random_incidence_matches_dense_product(seed):
+    rng = np.random.default_rng(seed)
+    vocabulary = [f"w{i}" for i in range(30)]
+    groups = [(f"g{i}", list(rng.choice(vocabulary, rng.integers(0, 8)))) for i in range(40)]
+    inc = cooccurrence.incidence(groups)
+    dense = inc.to_frame().to_numpy()
+    np.testing.assert_array_equal(cooccurrence.cooccurrence(inc).to_numpy(), dense.T @ dense)
+
+
+def test_coverage_lists_groups_with_any_keyword():
+    inc = cooccurrence.incidence(GROUPS)
+    assert cooccurrence.coverage(inc, ["食"]) == ("B", "D")
+    assert cooccurrence.coverage(inc, ["自然", "歴史"]) == ("A", "D")
+    assert cooccurrence.coverage(inc, ["存在しない"]) == ()
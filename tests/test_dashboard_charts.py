@@ -0,0 +1,61 @@
+"""dashboard.plotly_chart（シリアライズ済みの図の送信と、st.plotly_chart への切り替え）のテスト。"""
+
+import json
+
+import pytest
+from streamlit.elements.lib import layout_utils, utils
+from streamlit.testing.v1 import AppTest
+
+import dashboard
+
+
+def _script():
+    import dashboard
+    from seseragism import charts
+
+    for i, height in enumerate((300, None)):
+        layout = {"height": height} if height else {}
+        fig = charts.figure([{"type": "bar", "x": [1, 2], "y": [i, 3]}], layout)
+        dashboard.plotly_chart(f"test-{i}", fig)
+
+
+@pytest.fixture(autouse=True)
+def _reset(monkeypatch):
+    monkeypatch.setattr(dashboard, "_spec_path_failed", False)
+
+
+def _run() -> AppTest:
+    at = AppTest.from_function(_script)
+    at.run(timeout=60)
+    assert not at.exception, at.exception
+    return at
+
+
+def _bars(at: AppTest) -> list:
+    return [json.loads(chart.proto.spec)["data"][0]["y"] for chart in at.get("plotly_chart")]
+
+
+def test_sends_the_serialized_spec():
+    at = _run()
+    assert _bars(at) == [[0, 3], [1, 3]]
+    assert not dashboard._spec_path_failed
+
+
+def _raise(exc):
+    def fail(*args, **kwargs):
+        raise exc("internal API changed")
+
+    return fail
+
+
+@pytest.mark.parametrize("module, name, exc", [
+    # ID の登録前に失敗する
+    (utils, "compute_and_register_element_id", TypeError),
+    # ID を登録したあとに失敗する（同じ ID で st.plotly_chart を呼ぶと重複エラーになる）
+    (layout_utils, "LayoutConfig", AttributeError),
+])
+def test_falls_back_to_st_plotly_chart(monkeypatch, module, name, exc):
+    monkeypatch.setattr(module, name, _raise(exc))
+    at = _run()
+    assert _bars(at) == [[0, 3], [1, 3]]
+    assert dashboard._spec_path_failed
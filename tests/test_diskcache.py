@@ -0,0 +1,142 @@
+"""seseragism/diskcache.py（ディスクのキャッシュ）のテスト。"""
+
+import os
+import time
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from seseragism import diskcache
+
+
+def _square(x):
+    return x * x
+
+
+def _cube(x):
+    return x ** 3
+
+
+def test_round_trip_maps_buffers_read_only_and_aligned(tmp_path):
+    value = {
+        "array": np.arange(1001, dtype=np.float64),
+        "small": np.arange(3, dtype=np.int8),
+        "frame": pd.DataFrame({"a": np.arange(5), "b": np.linspace(0, 1, 5)}),
+        "table": pa.table({"x": pa.array(range(7))}),
+        "text": "せせらぎ",
+    }
+    path = tmp_path / "entry.pkl"
+    size = diskcache.dump(value, path)
+    assert size == path.stat().st_size
+    loaded = diskcache.load(path)
+
+    np.testing.assert_array_equal(loaded["array"], value["array"])
+    np.testing.assert_array_equal(loaded["small"], value["small"])
+    pd.testing.assert_frame_equal(loaded["frame"], value["frame"])
+    assert loaded["table"].equals(value["table"])
+    assert loaded["text"] == "せせらぎ"
+    for array in (loaded["array"], loaded["small"]):
+        assert not array.flags.writeable
+        assert array.ctypes.data % diskcache.ALIGNMENT == 0
+    with pytest.raises(ValueError):
+        loaded["array"][0] = 1.0
+
+
+def test_load_rejects_foreign_and_truncated_files(tmp_path):
+    foreign = tmp_path / "foreign.pkl"
+    foreign.write_bytes(b"not a cache entry")
+    with pytest.raises(ValueError):
+        diskcache.load(foreign)
+    truncated = tmp_path / "truncated.pkl"
+    diskcache.dump(np.arange(1000), truncated)
+    truncated.write_bytes(truncated.read_bytes()[:-100])
+    with pytest.raises(ValueError):
+        diskcache.load(truncated)
+
+
+def test_entry_key_follows_the_function_key_and_code(monkeypatch):
+    key = diskcache.entry_key(_square, (1,))
+    assert key == diskcache.entry_key(_square, (1,))
+    assert key != diskcache.entry_key(_square, (2,))
+    assert key != diskcache.entry_key(_cube, (1,))
+    diskcache.fingerprint.cache_clear()
+    monkeypatch.setattr(diskcache.inspect, "getsource", lambda obj: "changed source")
+    try:
+        assert key != diskcache.entry_key(_square, (1,))
+    finally:
+        diskcache.fingerprint.cache_clear()
+
+
+def _entry(directory, name, size, age):
+    path = directory / f"{name}{diskcache.SUFFIX}"
+    path.write_bytes(b"\0" * size)
+    used = time.time() - age
+    os.utime(path, (used, used))
+    return path
+
+
+def test_evict_removes_expired_then_least_recently_used(tmp_path):
+    expired = _entry(tmp_path, "expired", 10, diskcache.MAX_AGE_SECONDS + 60)
+    old = _entry(tmp_path, "old", 100, 300)
+    middle = _entry(tmp_path, "middle", 100, 200)
+    new = _entry(tmp_path, "new", 100, 100)
+    other = tmp_path / "note.txt"
+    other.write_text("x")
+
+    assert diskcache.evict(tmp_path, max_bytes=250) == 2
+    assert not expired.exists() and not old.exists()
+    assert middle.exists() and new.exists() and other.exists()
+    assert diskcache.evict(tmp_path, max_bytes=-1) == 2
+    assert other.exists()
+
+
+def test_call_computes_once_and_reads_back(tmp_path, monkeypatch):
+    monkeypatch.setenv(diskcache.CACHE_DIR_ENV, str(tmp_path))
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return np.arange(10)
+
+    before = diskcache.usage()
+    first = diskcache.call(_square, ("k",), compute)
+    second = diskcache.call(_square, ("k",), compute)
+    np.testing.assert_array_equal(first, second)
+    assert len(calls) == 1
+    assert not second.flags.writeable
+    after = diskcache.usage()
+    assert (after["misses"] - before["misses"], after["hits"] - before["hits"]) == (1, 1)
+    assert after["entries"] == 1
+    assert diskcache.clear() == 1
+
+
+def test_persistent_keys_on_the_arguments(tmp_path, monkeypatch):
+    monkeypatch.setenv(diskcache.CACHE_DIR_ENV, str(tmp_path))
+    calls = []
+
+    @diskcache.persistent
+    def power(x, exponent=2):
+        calls.append((x, exponent))
+        return x ** exponent
+
+    assert [power(3), power(3), power(3, exponent=3), power(3, exponent=3)] == [9, 9, 27, 27]
+    assert calls == [(3, 2), (3, 3)]
+
+
+def test_empty_setting_disables_the_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv(diskcache.CACHE_DIR_ENV, "")
+    calls = []
+    for _ in range(2):
+        diskcache.call(_square, ("k",), lambda: calls.append(1))
+    assert diskcache.cache_dir() is None
+    assert len(calls) == 2
+
+
+def test_corrupt_entry_is_recomputed(tmp_path, monkeypatch):
+    monkeypatch.setenv(diskcache.CACHE_DIR_ENV, str(tmp_path))
+    path = tmp_path / f"{diskcache.entry_key(_square, ('k',))}{diskcache.SUFFIX}"
+    path.write_bytes(diskcache.MAGIC + b"\xff" * 40)
+    assert diskcache.call(_square, ("k",), lambda: "fresh") == "fresh"
+    assert diskcache.load(path) == "fresh"
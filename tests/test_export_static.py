@@ -0,0 +1,104 @@
+"""tools/export_static.py（静的サイトの書き出し）のテスト。"""
+
+import json
+import re
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+
+import export_static  # noqa: E402
+
+import dashboard  # noqa: E402
+
+
+def test_hashed_names_follow_the_content():
+    a = export_static._hashed_name("charts", b"a", ".js")
+    assert re.fullmatch(r"charts-[0-9a-f]{12}\.js", a)
+    assert a == export_static._hashed_name("charts", b"a", ".js")
+    assert a != export_static._hashed_name("charts", b"b", ".js")
+
+
+def test_css_url_matches_only_relative_references():
+    css = (
+        'src: url("files/a.woff2"), url(b.woff), url(\'c.woff\');'
+        ' background: url("data:image/svg+xml,x"), url(https://example.com/d.png), url(/e.png);'
+    )
+    assert [ref for _, ref in export_static.CSS_URL.findall(css)] == ["files/a.woff2", "b.woff", "c.woff"]
+
+
+def test_write_assets_bundles_stylesheets_and_their_files(tmp_path, monkeypatch):
+    static = tmp_path / "static"
+    (static / "fonts" / "files").mkdir(parents=True)
+    (static / "fonts" / "files" / "a.woff2").write_bytes(b"font")
+    (static / "fonts" / "font.css").write_text('@font-face { src: url("files/a.woff2"); }', encoding="utf-8")
+    (static / "site.css").write_text('body { background: url("data:image/svg+xml,x"); }', encoding="utf-8")
+    monkeypatch.setattr(dashboard, "STATIC_DIR", static)
+    monkeypatch.setattr(dashboard, "STYLESHEETS", ["fonts/font.css", "missing.css", "site.css"])
+
+    out = tmp_path / "site"
+    assets = export_static.write_assets(out)
+    css = (out / assets["css"]).read_text(encoding="utf-8")
+    assert 'url("fonts/files/a.woff2")' in css
+    assert 'url("data:image/svg+xml,x")' in css
+    assert css.index("/* fonts/font.css */") < css.index("/* site.css */") < css.index("公開版")
+    assert (out / "assets" / "fonts" / "files" / "a.woff2").read_bytes() == b"font"
+    assert all((out / path).is_file() for path in assets.values())
+    assert export_static.write_assets(out) == assets
+
+
+def test_page_files():
+    funcs = [page for page, _, _ in dashboard.PAGES]
+    names = [export_static.page_file(i, func) for i, func in enumerate(funcs)]
+    assert names[0] == "index.html"
+    assert len(set(names)) == len(names)
+    assert all(name.endswith(".html") and not name.startswith("page_") for name in names)
+
+
+def _node(kind, **fields):
+    return SimpleNamespace(type=kind, **fields)
+
+
+def test_html_writer_elements():
+    writer = export_static.HtmlWriter()
+    markdown = _node("markdown", value="**強調** <span>x</span>")
+    chart = _node("plotly_chart", proto=SimpleNamespace(spec='{"data":[]}'))
+    expander = _node(
+        "expander", label="<詳細>", proto=SimpleNamespace(expanded=True),
+        children={0: chart, 1: _node("button")},
+    )
+    slider = _node("slider", label="増減率", value=(1, 3))
+    html = writer.block(_node("main", children={0: markdown, 1: expander, 2: slider}))
+
+    assert "<strong>強調</strong> <span>x</span>" in html
+    assert '<details class="expander" open><summary>&lt;詳細&gt;</summary>' in html
+    assert '<div class="stPlotlyChart" data-figure="fig-1"></div>' in html
+    assert '<script type="application/json" id="fig-1">{"data":[]}</script>' in html
+    assert "増減率：1 〜 3（公開版では固定）" in html
+    assert writer.figures == 1
+    assert writer.skipped == ["button"]
+
+
+def test_document_loads_plotly_only_with_figures():
+    assets = {"plotly": "assets/plotly.js", "css": "assets/s.css", "charts": "assets/c.js"}
+    without = export_static.render_document("<題>", "", "", "", assets, 0)
+    with_figures = export_static.render_document("題", "", "", "", assets, 2)
+    assert "plotly.js" not in without and "&lt;題&gt;" in without
+    assert '<script src="assets/plotly.js" defer></script>' in with_figures
+
+
+@pytest.mark.filterwarnings("ignore")
+def test_export_writes_linked_pages(tmp_path):
+    results = export_static.export(tmp_path)
+    assert [name for name, *_ in results] == [export_static.page_file(i, f) for i, (f, _, _) in enumerate(dashboard.PAGES)]
+    for name, _, figures, size in results:
+        document = (tmp_path / name).read_text(encoding="utf-8")
+        assert len(document.encode("utf-8")) == size
+        for href in re.findall(r'(?:href|src)="([^"#]+)"', document):
+            assert (tmp_path / href).is_file(), (name, href)
+        specs = re.findall(r'<script type="application/json" id="fig-\d+">(.*?)</script>', document, re.S)
+        assert len(specs) == figures == document.count("data-figure=")
+        assert all("data" in json.loads(spec) for spec in specs)
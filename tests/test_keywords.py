@@ -0,0 +1,46 @@
+"""seseragism.keywords（議事録のキーワード抽出）のテスト。"""
+
+import pytest
+
+from seseragism import keywords
+
+
+def _variants(mapping=None):
+    mapping = mapping or keywords.KEYWORD_VARIANTS
+    return tuple((term, tuple(forms)) for term, forms in mapping.items())
+
+
+def test_single_character_forms_do_not_match_inside_other_words():
+    counts = keywords.count_lines(["水曜日に食べる", "緑色のペン", "給食と香水", "食わず嫌い"], _variants())
+    assert counts.terms["水"] == 0
+    assert counts.terms["食"] == 0
+    assert counts.terms["自然"] == 0
+
+
+def test_single_character_forms_match_as_words():
+    counts = keywords.count_lines(["水がきれい", "三島の水、緑の多いまち", "食の魅力"], _variants())
+    assert counts.terms["水"] == 2
+    assert counts.terms["自然"] == 1
+    assert counts.terms["食"] == 1
+
+
+def test_longer_forms_win_over_single_characters():
+    counts = keywords.count_lines(["湧水の水辺で食べ物の話"], _variants())
+    assert counts.terms["水"] == 2
+    assert counts.terms["食"] == 1
+
+
+def test_variants_are_counted_under_their_canonical_term():
+    counts = keywords.count_lines(["湧水と清流、せせらぎのまち", "ＷＥＬＣＯＭＥ　歓迎"], _variants())
+    assert counts.terms["水"] == 3
+    assert counts.terms["ウェルカム"] == 2
+
+
+def test_single_character_forms_must_be_kanji():
+    with pytest.raises(ValueError):
+        keywords.count_lines(["み"], _variants({"水": ("み",)}))
+
+
+def test_candidates_keep_ngrams_that_contain_a_single_character_form():
+    counts = keywords.count_lines(["水源地を守る"] * keywords.MIN_NGRAM_COUNT, _variants())
+    assert keywords._candidates(counts.ngrams, _variants()) == [("水源地", keywords.MIN_NGRAM_COUNT)]
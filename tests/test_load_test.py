@@ -0,0 +1,24 @@
+"""tools/load_test.py（負荷試験の集計）のテスト。"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+
+import load_test  # noqa: E402
+
+PARAMS = {"ramp": 1.0, "duration": 10.0}
+
+
+def test_runs_with_a_script_exception_are_errors_not_latency():
+    samples = [
+        {"kind": "open", "page": "(default)", "at": 2.0, "seconds": 0.1, "bytes": 100},
+        {"kind": "navigate", "page": "stats", "at": 3.0, "seconds": 0.3, "bytes": 100},
+        {"kind": "navigate", "page": "stats", "at": 4.0, "error": "KeyError"},
+        {"kind": "open", "page": "", "at": 0.5, "error": "TimeoutError"},  # ramp 中の失敗も数える
+    ]
+    result = load_test.summarize(samples, sessions=2, params=PARAMS, sampler=None, client_cpu=0.0)
+    assert result["runs"] == 2
+    assert result["errors"] == 2
+    assert result["latency_ms"]["max"] == 300.0
+    assert set(result["pages_ms"]) == {"(default)", "stats"}
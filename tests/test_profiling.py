@@ -0,0 +1,39 @@
+"""seseragism/profiling.py（1回分の詳細プロファイル）のテスト。"""
+
+import pytest
+
+from seseragism import profiling
+
+
+@pytest.fixture
+def directory(tmp_path, monkeypatch):
+    monkeypatch.setenv(profiling.PROFILE_DIR_ENV, str(tmp_path))
+    return tmp_path
+
+
+@pytest.mark.parametrize("value, expected", [("1", True), ("0", False), ("", False), ("yes", False), (None, False)])
+def test_enabled_only_with_the_flag(monkeypatch, value, expected):
+    if value is None:
+        monkeypatch.delenv(profiling.PROFILING_ENV, raising=False)
+    else:
+        monkeypatch.setenv(profiling.PROFILING_ENV, value)
+    assert profiling.enabled() is expected
+
+
+def test_runs_in_the_same_second_get_their_own_files(directory):
+    reports = [profiling.run_profiled(lambda: sum(range(100)), "page") for _ in range(3)]
+    assert len({r.stats_path for r in reports}) == 3
+    assert all(r.stats_path.is_file() for r in reports)
+
+
+def test_memory_run_saves_a_snapshot(directory):
+    report = profiling.run_profiled(lambda: [bytes(1000) for _ in range(100)], "page", memory=True)
+    assert report.snapshot_path.is_file()
+    assert report.snapshot_path.stem == report.stats_path.stem
+    assert report.allocations
+
+
+def test_only_the_latest_runs_are_kept(directory, monkeypatch):
+    monkeypatch.setattr(profiling, "MAX_PROFILES", 2)
+    reports = [profiling.run_profiled(lambda: None, f"p{i}", memory=i == 0) for i in range(4)]
+    assert sorted(directory.iterdir()) == sorted(r.stats_path for r in reports[-2:])
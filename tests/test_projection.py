@@ -0,0 +1,45 @@
+"""seseragism.projection・metrics（総人口の推計）のテスト。"""
+
+import numpy as np
+
+from seseragism import metrics, projection
+
+
+def test_project_rounds_each_year_like_python_round():
+    expected, current = [], 100_000.0
+    for rate in (-1.25, -0.5, 2.0):
+        current = round(current * (1 + rate / 100))
+        expected.append(current)
+    assert projection.project(100_000, [-1.25, -0.5, 2.0]).tolist() == expected
+
+
+def test_sweep_rows_match_single_projections():
+    rates = [-1.0, -0.8, -0.6]
+    swept = projection.sweep(50_000, rates, [-0.5, 0.0, 0.5])
+    for row, shift in zip(swept, (-0.5, 0.0, 0.5)):
+        np.testing.assert_array_equal(row, projection.project(50_000, np.asarray(rates) + shift))
+
+
+def test_fan_quantiles_are_ordered_and_deterministic():
+    years, rates = list(range(2026, 2036)), [-1.0] * 10
+    fan = projection.fan(100_000, years, rates, sigma=0.5, n_paths=500)
+    quantiles = fan[[f"p{p}" for p in projection.PERCENTILES]].to_numpy()
+    assert (np.diff(quantiles, axis=1) >= 0).all()
+    assert fan.equals(projection.fan(100_000, years, rates, sigma=0.5, n_paths=500))
+
+
+def test_fan_without_spread_is_the_deterministic_path():
+    fan = projection.fan(100_000, [2026, 2027], [-1.0, -1.0])
+    for p in projection.PERCENTILES:
+        assert fan[f"p{p}"].tolist() == projection.project(100_000, [-1.0, -1.0]).tolist()
+
+
+def test_summary_follows_the_shift():
+    low, high = metrics.population_summary(-1.0), metrics.population_summary(1.0)
+    assert low.projected < high.projected
+    assert low.rate_high < high.rate_low
+    paths = projection.population_paths(-1.0)
+    if low.milestone_year is not None:
+        crossing = paths.loc[paths["年"] == low.milestone_year, "人口"].item()
+        assert crossing < metrics.POPULATION_MILESTONE
+        assert (paths.loc[paths["年"] < low.milestone_year, "人口"] >= metrics.POPULATION_MILESTONE).all()
@@ -0,0 +1,123 @@
+"""seseragism/shared.py（ワーカープロセス間の共有の置き場）のテスト。"""
+
+import os
+import subprocess
+import sys
+import textwrap
+from contextlib import contextmanager
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from seseragism import shared
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def _arrays():
+    return np.arange(1000)
+
+
+@pytest.fixture
+def directory(tmp_path, monkeypatch):
+    directory = tmp_path / "shared"
+    monkeypatch.setenv(shared.SHARED_DIR_ENV, str(directory))
+    return directory
+
+
+def test_disabled_unless_a_directory_is_set(monkeypatch):
+    monkeypatch.delenv(shared.SHARED_DIR_ENV, raising=False)
+    assert shared.shared_dir() is None
+    calls = []
+    for _ in range(2):
+        shared.call(_arrays, ("k",), lambda: calls.append(1) or _arrays())
+    assert len(calls) == 2
+    assert shared.usage()["entries"] == 0
+    monkeypatch.setenv(shared.SHARED_DIR_ENV, "")
+    assert shared.shared_dir() is None
+
+
+def test_computes_once_and_returns_read_only_maps(directory):
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return _arrays()
+
+    first = shared.call(_arrays, ("k",), compute)
+    second = shared.call(_arrays, ("k",), compute)
+    assert len(calls) == 1
+    np.testing.assert_array_equal(first, second)
+    for array in (first, second):
+        assert not array.flags.writeable
+    assert shared.usage()["entries"] == 1
+
+
+def test_other_processes_read_the_stored_entry(directory):
+    # キーの関数はどのプロセスでも同じ名前になるもの（モジュール名が固定）を使う
+    shared.call(shared.usage, ("k",), _arrays)
+    script = textwrap.dedent("""
+        import sys
+        sys.path.insert(0, sys.argv[1])
+        from seseragism import shared
+
+        def recompute():
+            raise AssertionError("recomputed")
+
+        print(int(shared.call(shared.usage, ("k",), recompute).sum()))
+    """)
+    out = subprocess.run([sys.executable, "-c", script, str(ROOT)], capture_output=True, text=True, check=True)
+    assert int(out.stdout) == int(_arrays().sum())
+
+
+def test_clear_removes_entries_locks_and_the_directory(directory):
+    shared.call(_arrays, ("a",), _arrays)
+    shared.call(_arrays, ("b",), _arrays)
+    assert shared.clear() == 2
+    assert not directory.exists()
+    assert shared.clear() == 0
+
+
+def test_new_directory_is_private(directory):
+    shared.call(_arrays, ("k",), _arrays)
+    assert directory.stat().st_mode & 0o777 == 0o700
+
+
+@pytest.mark.parametrize("unsafe", ["mode", "symlink", "owner"])
+def test_refuses_directories_other_users_could_write(tmp_path, monkeypatch, unsafe):
+    target = tmp_path / "planted"
+    target.mkdir(mode=0o700)
+    directory = target
+    if unsafe == "mode":
+        target.chmod(0o777)
+    elif unsafe == "symlink":
+        directory = tmp_path / "link"
+        directory.symlink_to(target)
+    else:
+        if os.getuid() != 0:
+            pytest.skip("所有者を変えるには root が必要")
+        os.chown(target, 65534, -1)
+    # 置き場に仕込まれたエントリ（読まれたら失敗）
+    planted = target / f"{shared.diskcache.entry_key(_arrays, ('k',))}{shared.diskcache.SUFFIX}"
+    shared.diskcache.dump(np.zeros(3), planted)
+    monkeypatch.setenv(shared.SHARED_DIR_ENV, str(directory))
+
+    np.testing.assert_array_equal(shared.call(_arrays, ("k",), _arrays), _arrays())
+    assert shared.call(_arrays, ("k",), _arrays).flags.writeable  # 計算した結果（置き場から読んでいない）
+
+
+def test_unreadable_entry_found_under_the_lock_is_recomputed(directory, monkeypatch):
+    path = directory / f"{shared.diskcache.entry_key(_arrays, ('k',))}{shared.diskcache.SUFFIX}"
+    locked = shared._locked
+
+    @contextmanager
+    def truncated_while_waiting(directory, name):
+        # ロックを待つ間に、ほかのプロセスが途中で切れたファイルを置いた
+        path.write_bytes(shared.diskcache.MAGIC + b"\xff" * 40)
+        with locked(directory, name):
+            yield
+
+    monkeypatch.setattr(shared, "_locked", truncated_while_waiting)
+    np.testing.assert_array_equal(shared.call(_arrays, ("k",), _arrays), _arrays())
+    np.testing.assert_array_equal(shared.diskcache.load(path), _arrays())
@@ -0,0 +1,88 @@
+"""seseragism.store（Arrow IPC のデータストア）のテスト。"""
+
+import hashlib
+import json
+
+import pyarrow as pa
+import pytest
+
+from seseragism import store
+
+
+def _write_version(directory, tables, sha256=None):
+    """表（名前 → pyarrow.Table）を Arrow IPC で書き、manifest.json を作る。"""
+    directory.mkdir(parents=True, exist_ok=True)
+    entries = {}
+    for name, table in tables.items():
+        path = directory / f"{name}.arrow"
+        with pa.OSFile(str(path), "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+        digest = (sha256 or {}).get(name) or hashlib.sha256(path.read_bytes()).hexdigest()
+        entries[name] = {"file": path.name, "sha256": digest, "rows": table.num_rows}
+    (directory / store.MANIFEST_NAME).write_text(json.dumps({"tables": entries}), encoding="utf-8")
+    return directory
+
+
+def _businesses(counts):
+    return pa.table({"年": list(range(2020, 2020 + len(counts))), "事業所数": counts})
+
+
+@pytest.fixture
+def version(tmp_path, monkeypatch):
+    directory = tmp_path / "2099-01"
+    monkeypatch.setenv(store.DATA_DIR_ENV, str(directory))
+    return directory
+
+
+def test_reads_a_table(version):
+    _write_version(version, {"businesses": _businesses([10, 12])})
+    assert store.read_frame("businesses")["事業所数"].tolist() == [10, 12]
+    assert store.has_table("businesses")
+    assert not store.has_table("tourism")
+
+
+def test_sha256_mismatch_is_rejected(version):
+    _write_version(version, {"businesses": _businesses([10, 12])}, sha256={"businesses": "0" * 64})
+    with pytest.raises(ValueError, match="SHA-256"):
+        store.read_table("businesses")
+
+
+def test_missing_column_is_rejected(version):
+    _write_version(version, {"businesses": pa.table({"年": [2020, 2021]})})
+    with pytest.raises(ValueError, match="事業所数"):
+        store.read_table("businesses")
+
+
+def test_table_not_in_manifest(version):
+    _write_version(version, {"businesses": _businesses([10])})
+    with pytest.raises(KeyError):
+        store.read_table("tourism")
+
+
+def test_cached_on_recomputes_when_a_table_file_changes(version):
+    calls = []
+
+    @store.cached_on("businesses")
+    def total(scale):
+        calls.append(scale)
+        return int(store.read_frame("businesses")["事業所数"].sum()) * scale
+
+    _write_version(version, {"businesses": _businesses([10, 12])})
+    assert total(1) == 22
+    assert total(1) == 22
+    assert calls == [1]
+
+    _write_version(version, {"businesses": _businesses([10, 12, 15])})
+    assert total(1) == 37
+    assert calls == [1, 1]
+    assert total(2) == 74
+    assert calls == [1, 1, 2]
+
+
+def test_file_digest_cache_is_bounded(tmp_path):
+    assert store._file_digest.cache_info().maxsize == store.DIGEST_CACHE_MAX_ENTRIES
+    path = tmp_path / "data.bin"
+    path.write_bytes(b"abc")
+    assert store.file_digest(path) == hashlib.sha256(b"abc").hexdigest()
+    path.write_bytes(b"abcd")
+    assert store.file_digest(path) == hashlib.sha256(b"abcd").hexdigest()
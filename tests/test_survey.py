@@ -0,0 +1,134 @@
+"""seseragism.survey（回答者単位のアンケート集計）のテスト。"""
+
+import math
+from collections import Counter
+
+import pandas as pd
+import pytest
+
+from seseragism import survey
+
+# 回答者8人：評価の未回答が2人、在住者のうち在住年数の空欄が1人
+RESPONSES = pd.DataFrame({
+    "回答ID": range(1, 9),
+    "評価": [7, 3, None, 9, 7, None, 3, 8],
+    "三島市在住": [True, False, True, True, False, True, False, True],
+    "在住年数": [12.0, None, 40.0, None, None, 5.0, None, 30.0],
+})
+
+
+def _row_wise(responses, high_threshold=7):
+    """1行ずつ数える素朴な集計（ベクトル演算版と突き合わせる基準）。"""
+    scores = []
+    residents = 0
+    years = []
+    for row in responses.itertuples(index=False):
+        score, resident, residency = row[1], row[2], row[3]
+        if not pd.isna(score):
+            scores.append(int(score))
+        if not pd.isna(resident) and resident:
+            residents += 1
+            if not pd.isna(residency):
+                years.append(float(residency))
+    counts = Counter(scores)
+    top = max(counts.values(), default=0)
+    return survey.SurveySummary(
+        respondents=len(responses),
+        scored=len(scores),
+        mean=sum(scores) / len(scores) if scores else float("nan"),
+        mode=min(s for s, c in counts.items() if c == top) if scores else 0,
+        high_threshold=high_threshold,
+        high_share_pct=sum(s >= high_threshold for s in scores) / len(scores) * 100 if scores else 0.0,
+        residents=residents,
+        mean_residency_years=sum(years) / len(years) if years else float("nan"),
+    )
+
+
+def _assert_same(actual, expected):
+    for field in survey.SurveySummary.__dataclass_fields__:
+        a, e = getattr(actual, field), getattr(expected, field)
+        if isinstance(e, float) and math.isnan(e):
+            assert math.isnan(a), field
+        else:
+            assert a == pytest.approx(e), field
+
+
+@pytest.mark.parametrize("high_threshold", [7, 8])
+def test_summary_matches_row_wise_reference(high_threshold):
+    _assert_same(survey.summarize(RESPONSES, high_threshold), _row_wise(RESPONSES, high_threshold))
+
+
+def test_unanswered_scores_count_as_respondents_only():
+    summary = survey.summarize(RESPONSES)
+    assert summary.respondents == 8
+    assert summary.scored == 6
+    assert summary.mean == pytest.approx(37 / 6)
+    assert summary.mode == 3  # 3点と7点が2人ずつ：低い方
+    assert summary.high_share_pct == pytest.approx(4 / 6 * 100)
+
+
+def test_residency_mean_ignores_non_residents_and_blanks():
+    summary = survey.summarize(RESPONSES)
+    assert summary.residents == 5
+    assert summary.mean_residency_years == pytest.approx((12 + 40 + 5 + 30) / 4)
+
+
+def test_histogram_has_every_score_between_min_and_max():
+    histogram = survey.score_histogram(RESPONSES)
+    assert histogram["点数"].tolist() == list(range(3, 10))
+    assert histogram["回答数"].tolist() == [2, 0, 0, 0, 2, 1, 1]
+    assert histogram["回答数"].sum() == survey.summarize(RESPONSES).scored
+
+
+def test_empty_input():
+    empty = RESPONSES.iloc[:0]
+    summary = survey.summarize(empty)
+    _assert_same(summary, _row_wise(empty))
+    assert summary.respondents == summary.scored == summary.residents == 0
+    assert survey.score_histogram(empty).empty
+
+
+def test_all_scores_unanswered():
+    unanswered = RESPONSES.assign(評価=None)
+    summary = survey.summarize(unanswered)
+    assert summary.scored == 0
+    assert math.isnan(summary.mean)
+    assert survey.score_histogram(unanswered).empty
+
+
+def test_csv_and_parquet_exports_give_the_same_summary(tmp_path):
+    csv = tmp_path / "export.csv"
+    parquet = tmp_path / "export.parquet"
+    RESPONSES.to_csv(csv, index=False)
+    RESPONSES.to_parquet(parquet, index=False)
+    expected = _row_wise(RESPONSES)
+    _assert_same(survey.survey_summary(csv), expected)
+    _assert_same(survey.survey_summary(parquet), expected)
+    pd.testing.assert_frame_equal(survey.survey_scores(csv), survey.survey_scores(parquet))
+
+
+def test_export_is_read_from_environment(tmp_path, monkeypatch):
+    csv = tmp_path / "export.csv"
+    RESPONSES.iloc[:3].to_csv(csv, index=False)
+    monkeypatch.setenv(survey.SURVEY_FILE_ENV, str(csv))
+    assert survey.survey_summary().respondents == 3
+
+
+def test_summary_follows_file_changes(tmp_path):
+    csv = tmp_path / "export.csv"
+    RESPONSES.to_csv(csv, index=False)
+    assert survey.survey_summary(csv).respondents == 8
+    RESPONSES.iloc[:5].to_csv(csv, index=False)
+    assert survey.survey_summary(csv).respondents == 5
+
+
+def test_unsupported_format(tmp_path):
+    path = tmp_path / "export.xlsx"
+    path.write_bytes(b"")
+    with pytest.raises(ValueError):
+        survey.load_responses(path)
+
+
+def test_published_data_matches_row_wise_reference():
+    responses = survey.load_responses()
+    _assert_same(survey.survey_summary(), _row_wise(responses))
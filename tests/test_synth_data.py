@@ -0,0 +1,53 @@
+"""tools/synth_data.py（規模を変えた合成データ）のテスト。"""
+
+import sys
+from pathlib import Path
+
+import pyarrow as pa
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+
+import synth_data  # noqa: E402
+from seseragism import store  # noqa: E402
+
+ROWS = 250
+
+
+@pytest.fixture(scope="module")
+def tables():
+    return synth_data.generate(ROWS)
+
+
+def test_same_seed_gives_the_same_data(tables):
+    again = synth_data.generate(ROWS)
+    assert all(tables[name].equals(again[name]) for name in tables)
+    other = synth_data.generate(ROWS, seed=synth_data.DEFAULT_SEED + 1)
+    assert not tables["survey_responses"].equals(other["survey_responses"])
+    assert synth_data.transcript_lines(20) == synth_data.transcript_lines(20)
+
+
+def test_tables_follow_the_store_schema(tables):
+    assert set(tables) == set(store.TABLES)
+    for name, columns in store.TABLES.items():
+        expected = {column: pa.type_for_alias(alias) for column, alias in columns.items()}
+        table = tables[name].select(list(columns))
+        assert {field.name: field.type for field in table.schema} == expected, name
+
+
+def test_row_counts_follow_rows(tables):
+    for name in ("survey_responses", "workshop_teams", "population_actual", "tourism", "businesses", "tourism_daily"):
+        assert tables[name].num_rows == ROWS, name
+    assert tables["business_registrations"].num_rows == min(ROWS, synth_data.MAX_MONTHS)
+    assert tables["workshop_keywords"].num_rows == 10
+    years = tables["population_actual"]["年"].to_pylist()
+    assert years[-1] == int(store.read_frame("population_actual")["年"].iloc[-1])
+    assert years == list(range(years[0], years[0] + ROWS))
+
+
+def test_written_directory_reads_back_through_the_store(tmp_path, monkeypatch):
+    out_dir = synth_data.write(tmp_path / "synth", 40)
+    assert len((out_dir / "workshop" / "synthetic.txt").read_text(encoding="utf-8").splitlines()) == 40
+    monkeypatch.setenv(store.DATA_DIR_ENV, str(out_dir))
+    assert store.manifest()["version"] == "synthetic-40"
+    assert len(store.read_frame("survey_responses")) == 40
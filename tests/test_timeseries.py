@@ -0,0 +1,88 @@
+"""seseragism.timeseries（長い系列の間引き）のテスト。"""
+
+import numpy as np
+import pytest
+
+from seseragism import timeseries
+
+# 区間数で割り切れない長さを多めに
+SIZES = [5, 7, 100, 1201, 4999, 5000, 100_003]
+BUDGETS = [4, 5, 10, 1200]
+
+
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("n", BUDGETS)
+def test_minmax_indices_are_in_range_sorted_and_unique(size, n):
+    y = np.random.default_rng(size + n).normal(size=size)
+    index = timeseries.minmax(y, n)
+    assert index.min() >= 0 and index.max() < size
+    assert (np.diff(index) > 0).all()
+    assert index[0] == 0 and index[-1] == size - 1
+    if n < size:
+        assert len(index) <= n + 2
+
+
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("n", BUDGETS)
+def test_minmax_keeps_every_bucket_extreme(size, n):
+    y = np.random.default_rng(size * n).normal(size=size)
+    kept = set(timeseries.minmax(y, n).tolist())
+    if n >= size:
+        assert kept == set(range(size))
+        return
+    width = -(-size // (n // 2))
+    for lo in range(0, size, width):
+        bucket = y[lo:lo + width]
+        assert lo + int(bucket.argmin()) in kept
+        assert lo + int(bucket.argmax()) in kept
+
+
+def _lttb_reference(x, y, n):
+    """LTTB を定義どおりに1点ずつ書いたもの（区間の切り方は実装と同じ）。"""
+    size = len(y)
+    edges = np.linspace(1, size - 1, n - 1).astype(np.int64)
+    selected, a = [0], 0
+    for i in range(n - 2):
+        lo, hi = edges[i], edges[i + 1]
+        if i + 1 < n - 2:
+            nxt = slice(edges[i + 1], edges[i + 2])
+            cx, cy = x[nxt].mean(), y[nxt].mean()
+        else:
+            cx, cy = x[-1], y[-1]
+        best, best_area = lo, -1.0
+        for j in range(lo, hi):
+            area = abs((x[a] - cx) * (y[j] - y[a]) - (x[a] - x[j]) * (cy - y[a]))
+            if area > best_area:
+                best, best_area = j, area
+        selected.append(best)
+        a = best
+    return np.array(selected + [size - 1])
+
+
+@pytest.mark.parametrize("size,n", [(50, 10), (1001, 100), (3333, 300)])
+def test_lttb_matches_reference(size, n):
+    rng = np.random.default_rng(size)
+    x = np.arange(size, dtype=np.float64)
+    y = rng.normal(size=size).cumsum()
+    np.testing.assert_array_equal(timeseries.lttb(x, y, n), _lttb_reference(x, y, n))
+
+
+def test_lttb_returns_n_sorted_points_for_dates():
+    x = np.datetime64("2015-01-01") + np.arange(10_000)
+    y = np.random.default_rng(0).normal(size=10_000)
+    index = timeseries.lttb(x, y, 500)
+    assert len(index) == 500
+    assert (np.diff(index) > 0).all()
+    assert index[0] == 0 and index[-1] == 9_999
+
+
+def test_window_and_downsample():
+    x = np.datetime64("2020-01-01") + np.arange(1000)
+    y = np.arange(1000, dtype=np.float64)
+    xs, ys = timeseries.window(x, y, np.datetime64("2020-02-01"), np.datetime64("2020-02-10"))
+    assert xs[0] == np.datetime64("2020-02-01") and xs[-1] == np.datetime64("2020-02-10")
+    assert np.shares_memory(ys, y)  # 切り出しはコピーしない
+    small_x, small_y = timeseries.downsample(xs, ys, budget=100)
+    assert len(small_x) == len(xs)  # budget 以下ならそのまま
+    with pytest.raises(ValueError):
+        timeseries.downsample(x, y, budget=10, method="median")
@@ -0,0 +1,71 @@
+"""seseragism/timing.py（処理時間のスパン）のテスト。"""
+
+import json
+
+import pytest
+
+from seseragism import timing
+
+
+def _span(name, ms, kind="chart", page="", started=0.0):
+    return timing.Span(kind, name, page, started, ms)
+
+
+@pytest.fixture
+def recorder(monkeypatch):
+    recorder = timing.Recorder(history=100)
+    monkeypatch.setattr(timing, "RECORDER", recorder)
+    monkeypatch.delenv(timing.TIMING_LOG_ENV, raising=False)
+    return recorder
+
+
+def test_summary_percentiles(recorder):
+    for ms in range(1, 101):
+        recorder.record(_span("a", float(ms), started=ms))
+    recorder.record(_span("b", 7.0, kind="page"))
+    stats = {s.name: s for s in recorder.summary()}
+    assert (stats["a"].count, stats["a"].p50, stats["a"].p95, stats["a"].p99) == (100, 50.5, 95.05, 99.01)
+    assert stats["a"].last == 100.0
+    assert (stats["b"].count, stats["b"].p50, stats["b"].p99, stats["b"].last) == (1, 7.0, 7.0, 7.0)
+    assert [s.kind for s in recorder.summary()] == ["chart", "page"]
+
+
+def test_history_keeps_the_latest_spans(recorder):
+    for ms in range(150):
+        recorder.record(_span("a", float(ms), started=ms))
+    (stats,) = recorder.summary()
+    assert stats.count == 100
+    assert recorder.spans()[0].ms == 50.0
+
+
+def test_span_and_timed_record_the_current_page(recorder):
+    @timing.timed("figure")
+    def build():
+        return 42
+
+    with timing.page_context("統計"):
+        with timing.span("chart", "人口"):
+            pass
+        assert build() == 42
+    with timing.span("chart", "外"):
+        pass
+    pages = {(s.kind, s.name): s.page for s in recorder.spans()}
+    assert pages == {("chart", "人口"): "統計", ("figure", "build"): "統計", ("chart", "外"): ""}
+    assert all(s.ms >= 0 for s in recorder.spans())
+
+
+def test_span_records_even_when_the_block_raises(recorder):
+    with pytest.raises(RuntimeError), timing.span("page", "落ちる"):
+        raise RuntimeError
+    assert [s.name for s in recorder.spans()] == ["落ちる"]
+
+
+def test_to_jsonl_and_log_file(recorder, tmp_path, monkeypatch):
+    log = tmp_path / "timing.jsonl"
+    monkeypatch.setenv(timing.TIMING_LOG_ENV, str(log))
+    recorder.record(_span("b", 2.0, started=2.0))
+    recorder.record(_span("a", 1.0, page="統計", started=1.0))
+    lines = [json.loads(line) for line in recorder.to_jsonl().splitlines()]
+    assert [line["name"] for line in lines] == ["a", "b"]
+    assert lines[0] == {"kind": "chart", "name": "a", "page": "統計", "started": 1.0, "ms": 1.0}
+    assert [json.loads(line)["name"] for line in log.read_text(encoding="utf-8").splitlines()] == ["b", "a"]
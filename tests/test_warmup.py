@@ -0,0 +1,124 @@
+"""seseragism.warmup（起動時のウォームアップ）と app.py の /ready のテスト。"""
+
+import asyncio
+import json
+import threading
+
+import pytest
+
+from seseragism import warmup
+
+
+@pytest.fixture
+def events(monkeypatch):
+    """データの段の処理を差し替え、実行した順を記録するリストを返す。"""
+    log = []
+
+    def data_tasks():
+        return {f"table:{name}": (lambda name=name: log.append(("data", name))) for name in ("a", "b")}
+
+    monkeypatch.setattr(warmup, "data_tasks", data_tasks)
+    return log
+
+
+def _run(tasks, workers=None):
+    runner = warmup.Warmup()
+    assert runner.start(lambda: tasks, workers)
+    assert runner.wait(10)
+    return runner
+
+
+def test_data_stage_finishes_before_page_tasks(events):
+    def page(name):
+        return lambda: events.append(("page", name, len(events)))
+
+    _run({"page:x": page("x"), "page:y": page("y")})
+    kinds = [event[0] for event in events]
+    assert kinds == ["data", "data", "page", "page"]
+    assert all(event[2] >= 2 for event in events if event[0] == "page")
+
+
+def test_start_only_once(events):
+    runner = _run({})
+    assert not runner.start(lambda: {})
+
+
+def test_failures_are_recorded_and_do_not_stop_other_tasks(events):
+    def broken():
+        raise RuntimeError("boom")
+
+    runner = _run({"page:bad": broken, "page:good": lambda: events.append(("page", "good"))})
+    status = runner.status()
+    assert status["ready"]
+    assert status["errors"] == {"page:bad": "RuntimeError: boom"}
+    assert ("page", "good") in events
+    assert set(status["tasks_ms"]) >= {"table:a", "table:b", "page:bad", "page:good", "data_tasks"}
+
+
+def test_failure_to_list_tasks_is_recorded(events):
+    def tasks():
+        raise OSError("no script")
+
+    runner = warmup.Warmup()
+    runner.start(tasks)
+    assert runner.wait(10)
+    assert runner.status()["errors"] == {"tasks": "OSError: no script"}
+    assert [event[0] for event in events] == ["data", "data"]
+
+
+def test_ready_file_is_replaced_with_the_final_status(events, tmp_path, monkeypatch):
+    ready_file = tmp_path / "ready.json"
+    ready_file.write_text("stale", encoding="utf-8")
+    monkeypatch.setenv(warmup.READY_FILE_ENV, str(ready_file))
+    release = threading.Event()
+
+    runner = warmup.Warmup()
+    runner.start(lambda: {"page:slow": lambda: release.wait(10)})
+    assert not ready_file.exists()  # 開始時に古いファイルを消す
+    release.set()
+    assert runner.wait(10)
+    written = json.loads(ready_file.read_text(encoding="utf-8"))
+    assert written["ready"] is True
+    assert written["tasks_ms"].keys() == runner.status()["tasks_ms"].keys()
+
+
+def test_ready_endpoint_turns_200_when_warm(events, monkeypatch):
+    import app
+
+    runner = warmup.Warmup()
+    monkeypatch.setattr(warmup, "WARMUP", runner)
+    release = threading.Event()
+
+    assert asyncio.run(app.ready(None)).status_code == 503  # 開始前
+    runner.start(lambda: {"page:slow": lambda: release.wait(10)})
+    response = asyncio.run(app.ready(None))
+    assert response.status_code == 503
+    assert json.loads(response.body)["started"] is True
+    release.set()
+    assert runner.wait(10)
+    response = asyncio.run(app.ready(None))
+    assert response.status_code == 200
+    assert json.loads(response.body)["ready"] is True
+    assert response.headers["cache-control"] == "no-cache"
+
+
+def test_page_tasks_lists_every_page_without_running_main(monkeypatch):
+    import streamlit as st
+
+    import app
+
+    def fail(*args, **kwargs):
+        raise AssertionError("main() が実行された")
+
+    monkeypatch.setattr(st, "set_page_config", fail)
+    monkeypatch.setattr(st, "navigation", fail)
+    tasks = app.page_tasks()
+    assert list(tasks) == [
+        "page:page_vision_evolution",
+        "page:page_seseragism",
+        "page:page_action_principles",
+        "page:page_workshop_analysis",
+        "page:page_survey_analysis",
+        "page:page_statistics",
+    ]
+    assert all(func.__module__ == "__main__" for func in tasks.values())
@@ -0,0 +1,177 @@
+"""
+起動・ページ描画のベンチマーク（JSON 履歴つき）
+
+次の項目を1回分の記録としてまとめ、履歴ファイル（JSON Lines、1行1記録）に追記する。
+  ・import dashboard の時間（新しいプロセスで計測、tools/coldstart.py と同じ方法）
+  ・`streamlit run dashboard.py` の起動からヘルスチェックが通るまでの時間
+  ・ページごとの初回描画時間（起動直後のサーバーで、そのページを最初に開いたとき）
+  ・ページごとの再実行時間（同じページを繰り返し再実行したときの中央値）
+  ・ページごとの ForwardMsg の件数とバイト数
+冷えたキャッシュでの時間を測るので、起動時にウォームアップする app.py ではなく
+dashboard.py を直接起動し、ディスクキャッシュ（SESERAGISM_CACHE_DIR）と共有メモリ
+（SESERAGISM_SHARED_DIR）も切っておく。
+記録にはコミット・データのバージョン・Python / Streamlit のバージョン・ホスト名を残す。
+同じホストの直前の記録と比べて、時間が --threshold %以上増えた項目を「悪化」として表示する
+（--fail-on-regression なら終了コード 1）。
+
+使い方:
+    python tools/benchmark_suite.py
+    python tools/benchmark_suite.py --repeat 10 --history benchmarks/history.jsonl
+    python tools/benchmark_suite.py --no-save --fail-on-regression   # CI 用
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from coldstart import measure as measure_import  # noqa: E402
+from st_client import StreamlitClient, serve_app  # noqa: E402
+
+DEFAULT_HISTORY = ROOT / "benchmarks" / "history.jsonl"
+# 比較する時間の項目（ページ単位）
+PAGE_TIMINGS = ("first_ms", "rerun_ms")
+# サーバーに渡す環境変数（空文字はディスクキャッシュを切る、None は変数を消す）
+COLD_CACHE_ENV = {"SESERAGISM_CACHE_DIR": "", "SESERAGISM_SHARED_DIR": None}
+
+
+async def _measure_pages(port: int, repeat: int) -> dict[str, dict]:
+    results: dict[str, dict] = {}
+    async with StreamlitClient(port) as client:
+        # 最初の実行で既定のページが描画され、ナビゲーション（ページ一覧）が届く
+        first = await client.run_page()
+        for url_pathname in list(client.pages):
+            # 既定のページは最初の実行が初回描画。ほかのページは最初の遷移が初回描画
+            cold = first if url_pathname == next(iter(client.pages)) else await client.run_page(url_pathname)
+            reruns = [await client.run_page(url_pathname) for _ in range(repeat)]
+            results[url_pathname or "(default)"] = {
+                "first_ms": round(cold.seconds * 1000, 1),
+                "rerun_ms": round(statistics.median(r.seconds for r in reruns) * 1000, 1),
+                "messages": reruns[-1].messages,
+                "bytes": reruns[-1].bytes,
+            }
+    return results
+
+
+def _git_commit() -> str | None:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"],
+                               cwd=ROOT, capture_output=True, text=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return f"{commit}-dirty" if dirty else commit
+
+
+def run(repeat: int) -> dict:
+    """1回分の記録を作る。"""
+    import streamlit
+
+    from seseragism import store
+
+    imported = measure_import(None)
+    started = time.perf_counter()
+    with serve_app("dashboard.py", env=COLD_CACHE_ENV) as (port, _):
+        ready_ms = (time.perf_counter() - started) * 1000
+        pages = asyncio.run(_measure_pages(port, repeat))
+    return {
+        "recorded": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": _git_commit(),
+        "data_version": store.data_dir().name,
+        "python": platform.python_version(),
+        "streamlit": streamlit.__version__,
+        "host": platform.node(),
+        "repeat": repeat,
+        "startup": {
+            "import_dashboard_ms": imported["import_dashboard_ms"],
+            "server_ready_ms": round(ready_ms, 1),
+        },
+        "pages": pages,
+    }
+
+
+def load_history(path: Path) -> list[dict]:
+    """履歴を古い順に読む（無ければ空）。"""
+    if not path.is_file():
+        return []
+    with path.open(encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def previous_record(history: list[dict], record: dict) -> dict | None:
+    """比較相手（同じホスト・同じ Python の直近の記録）。"""
+    for old in reversed(history):
+        if old.get("host") == record["host"] and old.get("python") == record["python"]:
+            return old
+    return None
+
+
+def regressions(record: dict, previous: dict | None, threshold_pct: float) -> list[str]:
+    """previous から threshold_pct %以上遅くなった項目の名前。"""
+    if previous is None:
+        return []
+    pairs = [(f"startup.{k}", v, previous["startup"].get(k)) for k, v in record["startup"].items()]
+    for page, timings in record["pages"].items():
+        for key in PAGE_TIMINGS:
+            pairs.append((f"{page}.{key}", timings[key], previous["pages"].get(page, {}).get(key)))
+    return [name for name, now, before in pairs if before and (now - before) / before * 100 >= threshold_pct]
+
+
+def _cell(now: float, before: float | None) -> str:
+    if not before:
+        return f"{now:>9.1f}"
+    return f"{now:>9.1f} ({(now - before) / before * 100:+5.0f}%)"
+
+
+def _print_report(record: dict, previous: dict | None, slow: list[str]) -> None:
+    prev_startup = previous["startup"] if previous else {}
+    prev_pages = previous["pages"] if previous else {}
+    if previous:
+        print(f"比較対象: {previous['recorded']}（{previous.get('commit')}）")
+    for key, value in record["startup"].items():
+        print(f"{key:<26} {_cell(value, prev_startup.get(key))} ms")
+    print(f"{'page':<26} {'first ms':>18} {'rerun ms':>18} {'messages':>9} {'bytes':>10}")
+    for page, r in record["pages"].items():
+        b = prev_pages.get(page, {})
+        print(f"{page:<26} {_cell(r['first_ms'], b.get('first_ms')):>18} "
+              f"{_cell(r['rerun_ms'], b.get('rerun_ms')):>18} {r['messages']:>9} {r['bytes']:>10,}")
+    for name in slow:
+        print(f"悪化: {name}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="再実行の計測回数（中央値を採用）")
+    parser.add_argument("--history", type=Path, default=DEFAULT_HISTORY, help="履歴ファイル（JSON Lines）")
+    parser.add_argument("--threshold", type=float, default=20.0, help="悪化とみなす増加率（%%、既定 20）")
+    parser.add_argument("--no-save", action="store_true", help="履歴に追記しない")
+    parser.add_argument("--fail-on-regression", action="store_true", help="悪化があれば終了コード 1")
+    args = parser.parse_args()
+
+    record = run(args.repeat)
+    previous = previous_record(load_history(args.history), record)
+    slow = regressions(record, previous, args.threshold)
+    _print_report(record, previous, slow)
+    if not args.no_save:
+        args.history.parent.mkdir(parents=True, exist_ok=True)
+        with args.history.open("a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        print(f"appended to {args.history}")
+    if slow and args.fail_on_regression:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""
+データストアのバージョン作成（CSV → Arrow IPC）
+
+表ごとの CSV（<表名>.csv、UTF-8、1行目が列名）を入れたディレクトリから、
+data/<バージョン>/ に Arrow IPC ファイルと manifest.json を書き出す。
+列と型は seseragism/store.py の TABLES に従う。CSV が無い表は、
+直前のバージョンのファイルをそのまま引き継ぐ（一部の表だけ更新できる）。
+日別の観光客数など store.OPTIONAL_TABLES の表は、どちらにも無ければ省く。
+
+ファイルは非圧縮で書く（メモリマップで読んだバッファをコピーせずに使えるように）。
+
+使い方:
+    python tools/build_data_store.py --source drop/ --version 2026-04
+    python tools/build_data_store.py --verify            # 最新版のハッシュを検査
+"""
+
+import argparse
+import hashlib
+import json
+import shutil
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from seseragism import store  # noqa: E402
+
+
+def _sha256(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _latest_version() -> Path | None:
+    versions = sorted(p for p in store.DATA_ROOT.glob("*") if (p / store.MANIFEST_NAME).is_file())
+    return versions[-1] if versions else None
+
+
+def convert_csv(csv_path: Path, name: str, out_path: Path) -> int:
+    """CSV を表の定義どおりの型で読み、Arrow IPC ファイルに書く。行数を返す。"""
+    import pyarrow as pa
+    from pyarrow import csv
+
+    schema = store.TABLES[name]
+    table = csv.read_csv(
+        csv_path,
+        convert_options=csv.ConvertOptions(
+            column_types={col: pa.type_for_alias(t) for col, t in schema.items()},
+            include_columns=list(schema),
+        ),
+    )
+    return write_table(table, out_path)
+
+
+def write_table(table, out_path: Path) -> int:
+    """Arrow Table を非圧縮の IPC ファイルに書く。行数を返す。"""
+    import pyarrow as pa
+
+    with pa.OSFile(str(out_path), "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+    return table.num_rows
+
+
+def manifest_entry(name: str, out_path: Path, rows: int, origin: str) -> dict:
+    """manifest.json の表1つ分の記録。"""
+    return {
+        "file": out_path.name,
+        "sha256": _sha256(out_path),
+        "rows": rows,
+        "columns": store.TABLES[name],
+        "source": origin,
+    }
+
+
+def write_manifest(out_dir: Path, version: str, tables: dict[str, dict]) -> None:
+    """バージョンのディレクトリに manifest.json を書く。"""
+    manifest = {
+        "version": version,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "tables": tables,
+    }
+    (out_dir / store.MANIFEST_NAME).write_text(
+        json.dumps(manifest, ensure_ascii=False, indent=2) + "\n", encoding="utf-8"
+    )
+
+
+def build(source: Path, version: str) -> Path:
+    """新しいバージョンのディレクトリを作成する。"""
+    out_dir = store.DATA_ROOT / version
+    if out_dir.exists():
+        raise SystemExit(f"{out_dir} は既に存在します（バージョンは作り直さず、新しく追加する）")
+    previous = _latest_version()
+    previous_tables = json.loads((previous / store.MANIFEST_NAME).read_text())["tables"] if previous else {}
+
+    out_dir.mkdir(parents=True)
+    tables = {}
+    for name in store.TABLES:
+        csv_path = source / f"{name}.csv"
+        out_path = out_dir / f"{name}.arrow"
+        if csv_path.is_file():
+            rows = convert_csv(csv_path, name, out_path)
+            origin = csv_path.name
+        elif name in previous_tables:
+            shutil.copyfile(previous / previous_tables[name]["file"], out_path)
+            rows = previous_tables[name]["rows"]
+            origin = f"{previous.name}/{previous_tables[name]['file']}"
+        elif name in store.OPTIONAL_TABLES:
+            continue
+        else:
+            shutil.rmtree(out_dir)
+            raise SystemExit(f"{csv_path} がなく、引き継げる前のバージョンもありません")
+        tables[name] = manifest_entry(name, out_path, rows, origin)
+        print(f"  {name:<26} {rows:>8} 行  <- {origin}")
+
+    write_manifest(out_dir, version, tables)
+    return out_dir
+
+
+def verify(directory: Path) -> bool:
+    """manifest の SHA-256 とファイルの内容が一致するか検査する。"""
+    manifest = json.loads((directory / store.MANIFEST_NAME).read_text())
+    ok = True
+    for name, entry in manifest["tables"].items():
+        path = directory / entry["file"]
+        good = path.is_file() and _sha256(path) == entry["sha256"]
+        ok &= good
+        print(f"  {name:<26} {'ok' if good else 'NG'}")
+    return ok
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--source", type=Path, help="表ごとの CSV を置いたディレクトリ")
+    parser.add_argument("--version", help="作成するバージョン名（例: 2026-04）")
+    parser.add_argument("--verify", action="store_true", help="最新版（または --version）を検査する")
+    args = parser.parse_args()
+
+    if args.verify:
+        directory = store.DATA_ROOT / args.version if args.version else _latest_version()
+        if directory is None:
+            raise SystemExit("検査するバージョンがありません")
+        print(directory.relative_to(ROOT))
+        sys.exit(0 if verify(directory) else 1)
+    if not (args.source and args.version):
+        parser.error("--source と --version を指定してください")
+
+    out_dir = build(args.source, args.version)
+    print(f"wrote {out_dir.relative_to(ROOT)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""
+Noto Sans JP サブセットフォントの生成
+
+ダッシュボードのソースに含まれる文字列リテラル（ページ本文・チャートの
+ラベル）と、画面に出るデータ（読み込むバージョンのデータストアの文字列の列、
+ワークショップの議事録）から実際に使う文字を集め、Noto Sans JP をその文字だけに
+サブセット化した WOFF2 を static/fonts/ に出力する。あわせて @font-face を
+定義した static/fonts/noto-sans-jp.css と manifest.json を書き出す。
+
+文字集合とフォントの内容ハッシュを manifest.json に記録しておき、
+変わっていなければ何もしない。本文の変更やデータの追加のあとはこのスクリプトを再実行する
+（--check で「再生成が必要か」だけを判定でき、必要なら終了コード 1）。
+
+フォントの取得は行わない（オフライン前提）。元フォントは Google Fonts の
+可変フォント NotoSansJP[wght].ttf（SIL OFL）を事前に用意して --source で渡す。
+依存: pip install fonttools brotli
+
+使い方:
+    python tools/build_font_subset.py --source /path/to/NotoSansJP[wght].ttf
+    python tools/build_font_subset.py --source /path/to/NotoSansJP[wght].ttf --check
+"""
+
+import argparse
+import ast
+import hashlib
+import json
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+FONT_DIR = ROOT / "static" / "fonts"
+MANIFEST_PATH = FONT_DIR / "manifest.json"
+FONT_CSS_PATH = FONT_DIR / "noto-sans-jp.css"
+FAMILY = "Noto Sans JP"
+
+# 文字を集める対象のソース（画面の文言はここに含まれる。データの文字は data_characters()）
+TEXT_SOURCES = ["dashboard.py", "seseragism/**/*.py"]
+
+
+def data_characters() -> set[str]:
+    """画面に出るデータの文字（データストアの文字列の列と、議事録の正規化前後の本文）。"""
+    import pyarrow as pa
+
+    from seseragism import keywords, store
+
+    chars: set[str] = set()
+    for name in store.manifest()["tables"]:
+        table = store.read_table(name)
+        chars.update("".join(table.column_names))
+        for column in table.columns:
+            if pa.types.is_string(column.type) or pa.types.is_large_string(column.type):
+                chars.update("".join(v for v in column.to_pylist() if v))
+    # 抽出したキーワード・候補語は正規化（NFKC など）した本文から取るので、両方を入れる
+    for path in keywords.transcript_files():
+        text = path.read_text(encoding="utf-8", errors="replace")
+        chars.update(text)
+        chars.update(keywords.normalize(text))
+    return chars
+
+
+def collect_characters(extra_files: list[Path]) -> str:
+    """ソース中の文字列リテラル・データ・追加テキストから、使用文字の一覧を返す。"""
+    chars: set[str] = set(chr(c) for c in range(0x20, 0x7F))  # ASCII（数値・記号）
+    chars.update(data_characters())
+    for pattern in TEXT_SOURCES:
+        for path in sorted(ROOT.glob(pattern)):
+            tree = ast.parse(path.read_text(encoding="utf-8"))
+            for node in ast.walk(tree):
+                if isinstance(node, ast.Constant) and isinstance(node.value, str):
+                    chars.update(node.value)
+    for path in extra_files:
+        chars.update(path.read_text(encoding="utf-8"))
+    return "".join(sorted(c for c in chars if c.isprintable()))
+
+
+def _fingerprint(text: str, source: Path) -> str:
+    h = hashlib.sha256(text.encode("utf-8"))
+    h.update(hashlib.sha256(source.read_bytes()).digest())
+    return h.hexdigest()
+
+
+def _weight_range(font) -> str:
+    """可変フォントなら wght 軸の範囲、そうでなければ固定ウェイトを返す。"""
+    if "fvar" in font:
+        for axis in font["fvar"].axes:
+            if axis.axisTag == "wght":
+                return f"{int(axis.minValue)} {int(axis.maxValue)}"
+    return str(font["OS/2"].usWeightClass)
+
+
+def build(source: Path, text: str, fingerprint: str) -> dict:
+    """サブセットWOFF2・@font-face CSS・manifest を書き出す。"""
+    from fontTools import subset
+    from fontTools.ttLib import TTFont
+
+    options = subset.Options()
+    options.flavor = "woff2"
+    options.layout_features = ["*"]
+    options.name_IDs = ["*"]
+    font = TTFont(source)
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(text=text)
+    subsetter.subset(font)
+
+    FONT_DIR.mkdir(parents=True, exist_ok=True)
+    for old in FONT_DIR.glob("NotoSansJP-*.woff2"):
+        old.unlink()
+    tmp = FONT_DIR / "NotoSansJP.woff2.tmp"
+    font.flavor = "woff2"
+    font.save(tmp)
+    digest = hashlib.sha256(tmp.read_bytes()).hexdigest()[:12]
+    # 内容ハッシュ入りのファイル名にして、長期キャッシュしても古い版が残らないようにする
+    font_file = f"NotoSansJP-{digest}.woff2"
+    tmp.rename(FONT_DIR / font_file)
+
+    FONT_CSS_PATH.write_text(
+        "/* tools/build_font_subset.py が生成。手で編集しない */\n"
+        "@font-face {\n"
+        f"    font-family: '{FAMILY}';\n"
+        "    font-style: normal;\n"
+        f"    font-weight: {_weight_range(font)};\n"
+        "    font-display: swap;\n"
+        f"    src: url('{font_file}') format('woff2');\n"
+        "}\n",
+        encoding="utf-8",
+    )
+    manifest = {
+        "fingerprint": fingerprint,
+        "source": source.name,
+        "file": font_file,
+        "characters": len(text),
+        "bytes": (FONT_DIR / font_file).stat().st_size,
+    }
+    MANIFEST_PATH.write_text(json.dumps(manifest, ensure_ascii=False, indent=2) + "\n")
+    return manifest
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--source", type=Path, required=True, help="元フォント（TTF/OTF）")
+    parser.add_argument("--extra", type=Path, nargs="*", default=[], help="文字を追加で集めるテキストファイル")
+    parser.add_argument("--check", action="store_true", help="再生成が必要かだけを判定する")
+    parser.add_argument("--force", action="store_true", help="変更がなくても再生成する")
+    args = parser.parse_args()
+
+    text = collect_characters(args.extra)
+    fingerprint = _fingerprint(text, args.source)
+    current = json.loads(MANIFEST_PATH.read_text()) if MANIFEST_PATH.exists() else {}
+    up_to_date = (
+        current.get("fingerprint") == fingerprint
+        and (FONT_DIR / current.get("file", "")).is_file()
+    )
+
+    if args.check:
+        print("up to date" if up_to_date else "stale: サブセットの再生成が必要です")
+        sys.exit(0 if up_to_date else 1)
+    if up_to_date and not args.force:
+        print(f"up to date: {current['file']} ({current['characters']} 文字)")
+        return
+
+    manifest = build(args.source, text, fingerprint)
+    print(f"wrote {manifest['file']}: {manifest['characters']} 文字, {manifest['bytes']:,} bytes")
+
+
+if __name__ == "__main__":
+    main()
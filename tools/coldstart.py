@@ -0,0 +1,117 @@
+"""
+コールドスタート計測（モジュール別のインポート時間）
+
+新しい Python プロセスを `-X importtime` 付きで起動し、
+  1. `import dashboard`（サーバー起動直後にスクリプトを読み込む段階）
+  2. 各ページの初回描画（そのページで追加に読み込まれるモジュール）
+のそれぞれについて、トップレベルのパッケージ別にインポート時間を集計する。
+ページはランタイムなし（bare mode）で関数を直接呼ぶので、Streamlit の
+警告がいくつか出るが計測には影響しない。
+
+使い方:
+    python tools/coldstart.py
+    python tools/coldstart.py --top 5 --json coldstart.json
+"""
+
+import argparse
+import json
+import re
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+MARKER = "coldstart-marker"
+_IMPORTTIME = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)")
+
+
+def _child_source(page: str | None) -> str:
+    """子プロセスで実行するコード。stdout に (import ms, 描画 ms) を出力する。"""
+    lines = [
+        "import sys, time",
+        f"sys.path.insert(0, {str(ROOT)!r})",
+        "t0 = time.perf_counter()",
+        "import dashboard",
+        "t1 = time.perf_counter()",
+    ]
+    if page:
+        lines += [
+            # importtime の出力（stderr）に段階の区切りを残す
+            f"print({MARKER!r}, file=sys.stderr, flush=True)",
+            f"dashboard.{page}()",
+        ]
+    lines.append("t2 = time.perf_counter()")
+    lines.append("print(f'{(t1 - t0) * 1000:.1f} {(t2 - t1) * 1000:.1f}')")
+    return "\n".join(lines)
+
+
+def _parse_importtime(stderr: str) -> tuple[dict[str, int], dict[str, int]]:
+    """importtime の出力を (マーカー前, マーカー後) のパッケージ別 self 時間[us] に集計する。"""
+    before: dict[str, int] = defaultdict(int)
+    after: dict[str, int] = defaultdict(int)
+    current = before
+    for line in stderr.splitlines():
+        if line.strip() == MARKER:
+            current = after
+            continue
+        m = _IMPORTTIME.match(line)
+        if m:
+            current[m.group(4).split(".")[0]] += int(m.group(1))
+    return dict(before), dict(after)
+
+
+def measure(page: str | None) -> dict:
+    """新しいプロセスで dashboard を読み込み（必要なら1ページ描画し）計測する。"""
+    started = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _child_source(page)],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    wall = (time.perf_counter() - started) * 1000
+    import_ms, page_ms = (float(v) for v in proc.stdout.split()[-2:])
+    before, after = _parse_importtime(proc.stderr)
+    return {
+        "process_ms": round(wall, 1),
+        "import_dashboard_ms": import_ms,
+        "page_ms": page_ms if page else None,
+        "imports_us": before if page is None else after,
+    }
+
+
+def _print_section(title: str, result: dict, top: int) -> None:
+    imports = sorted(result["imports_us"].items(), key=lambda kv: -kv[1])
+    total = sum(us for _, us in imports) / 1000
+    if result["page_ms"] is None:
+        print(f"== {title}: import dashboard {result['import_dashboard_ms']:.1f} ms "
+              f"(プロセス全体 {result['process_ms']:.0f} ms)")
+    else:
+        print(f"== {title}: 初回描画 {result['page_ms']:.1f} ms（うち追加インポート {total:.1f} ms）")
+    for name, us in imports[:top]:
+        print(f"   {name:<24} {us / 1000:8.1f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--top", type=int, default=8, help="表示するパッケージ数")
+    parser.add_argument("--json", type=Path, help="結果をJSONで保存する")
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(ROOT))
+    import dashboard  # ページ一覧を得るため（計測自体は子プロセスで行う）
+
+    results = {"import": measure(None)}
+    _print_section("起動", results["import"], args.top)
+    for page, _, _ in dashboard.PAGES:
+        results[page.__name__] = measure(page.__name__)
+        _print_section(page.__name__, results[page.__name__], args.top)
+    if args.json:
+        args.json.write_text(json.dumps(results, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,263 @@
+"""
+静的サイトの書き出し（CDN・普通の Web サーバーで配信する公開版）
+
+大きなイベントで閲覧者ごとに Streamlit のセッション（WebSocket と Python の再実行）を
+持たなくて済むよう、6ページをすべて静的な HTML に書き出す。各ページ関数を
+streamlit.testing の AppTest で1回ずつ実行し、送られた要素（Markdown・Plotly の図・
+expander）をそのまま HTML に置き換えるので、画面の中身はダッシュボードと同じになる。
+
+  ・plotly.js はバージョン付きの1ファイル（assets/plotly-<版>.min.js）を全ページで共有する。
+    ブラウザは最初のページで1回だけ取得し、あとはキャッシュを使う
+  ・図は Streamlit に送られた JSON（シリアライズ済み）を <script type="application/json">
+    にそのまま埋め込み、共通の assets/charts.js が読み込み時に描画する
+  ・CSS は static/ のスタイルシートと公開版用のレイアウトを1ファイルにまとめ、
+    内容ハッシュ付きの名前（assets/seseragism-<hash>.css）で置く（フォントも同梱）
+スライダーなどの操作部品は既定の値で描画し、その値を注記として残す。
+
+ページ関数は同じプロセスで順に実行するので、データの読み込みと図のキャッシュは
+ページ間で共有される（全ページで数秒の一括処理）。
+依存: pip install markdown-it-py
+
+使い方:
+    python tools/export_static.py --out site
+    SESERAGISM_DATA_DIR=data/2025-12 python tools/export_static.py --out /var/www/seseragism
+"""
+
+import argparse
+import hashlib
+import html
+import logging
+import re
+import shutil
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+DEFAULT_OUT = ROOT / "site"
+ASSETS = "assets"
+
+# 公開版だけで使うレイアウト（Streamlit の枠の代わり）。seseragism.css のセレクタ
+# （section[data-testid="stSidebar"]、.main .block-container など）に合う構造で書き出す。
+EXPORT_CSS = """
+/* ---------- 公開版（tools/export_static.py）のレイアウト ---------- */
+body { margin: 0; color: #31333f; background: #ffffff; }
+.app { display: flex; min-height: 100vh; }
+section[data-testid="stSidebar"] { flex: 0 0 244px; padding: 0 1rem; }
+.main { flex: 1; min-width: 0; }
+.main .block-container { margin: 0 auto; padding-left: 2rem; padding-right: 2rem; }
+.page-nav { list-style: none; margin: 0; padding: 0; }
+.page-nav a { display: block; padding: 0.35rem 0.5rem; border-radius: 6px; text-decoration: none; }
+.page-nav a[aria-current="page"] { background: rgba(255,255,255,0.18); font-weight: 700; }
+details.expander { border: 1px solid #d6e4ec; border-radius: 8px; margin-bottom: 1rem; padding: 0 1rem; }
+details.expander > summary { cursor: pointer; padding: 0.75rem 0; font-weight: 600; }
+.static-control { font-size: 0.85rem; color: #546e7a; margin: 0 0 0.5rem 0; }
+@media (max-width: 768px) {
+    .app { flex-direction: column; }
+    section[data-testid="stSidebar"] { flex: none; }
+    .main .block-container { padding-left: 1rem; padding-right: 1rem; }
+}
+"""
+
+# 図の描画（全ページ共通）。data-figure の id の JSON を Plotly.newPlot に渡す。
+CHARTS_JS = """
+document.addEventListener("DOMContentLoaded", function () {
+    document.querySelectorAll("[data-figure]").forEach(function (el) {
+        var spec = JSON.parse(document.getElementById(el.dataset.figure).textContent);
+        var layout = Object.assign({autosize: true}, spec.layout);
+        Plotly.newPlot(el, spec.data || [], layout, {responsive: true, displaylogo: false});
+    });
+});
+"""
+
+CSS_URL = re.compile(r"""url\((['"]?)(?!data:|https?:|/)([^'")]+)\1\)""")
+
+
+def _hashed_name(stem: str, content: bytes, suffix: str) -> str:
+    return f"{stem}-{hashlib.sha256(content).hexdigest()[:12]}{suffix}"
+
+
+def write_assets(out_dir: Path) -> dict[str, str]:
+    """共有の資産（plotly.js・まとめた CSS・charts.js）を書き出し、ページからのパスを返す。"""
+    import plotly
+    from plotly.offline import get_plotlyjs_version
+
+    import dashboard
+
+    assets = out_dir / ASSETS
+    assets.mkdir(parents=True, exist_ok=True)
+
+    plotly_js = f"plotly-{get_plotlyjs_version()}.min.js"
+    if not (assets / plotly_js).is_file():
+        shutil.copyfile(Path(plotly.__file__).parent / "package_data" / "plotly.min.js", assets / plotly_js)
+
+    # スタイルシートを1つにまとめる。相対 URL（フォントファイル）は元の置き場ごと同梱する
+    parts = []
+    for name in dashboard.STYLESHEETS:
+        path = dashboard.STATIC_DIR / name
+        if not path.is_file():
+            continue
+        folder = Path(name).parent
+        for _, ref in CSS_URL.findall(path.read_text(encoding="utf-8")):
+            target = assets / folder / ref
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(path.parent / ref, target)
+        css = CSS_URL.sub(lambda m: f"url({m[1]}{(folder / m[2]).as_posix()}{m[1]})", path.read_text(encoding="utf-8"))
+        parts.append(f"/* {name} */\n{css}")
+    parts.append(EXPORT_CSS.strip())
+    css = "\n\n".join(parts).encode("utf-8") + b"\n"
+    css_name = _hashed_name("seseragism", css, ".css")
+    (assets / css_name).write_bytes(css)
+
+    js = CHARTS_JS.strip().encode("utf-8") + b"\n"
+    js_name = _hashed_name("charts", js, ".js")
+    (assets / js_name).write_bytes(js)
+    return {"plotly": f"{ASSETS}/{plotly_js}", "css": f"{ASSETS}/{css_name}", "charts": f"{ASSETS}/{js_name}"}
+
+
+def _script(name: str) -> None:
+    """AppTest で実行するスクリプト（dashboard の関数を1つ呼ぶ）。"""
+    import dashboard
+
+    getattr(dashboard, name)()
+
+
+def run_elements(name: str):
+    """dashboard の関数 name を実行し、描画された要素ツリー（AppTest）を返す。"""
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_function(_script, args=(name,))
+    at.run(timeout=120)
+    if at.exception:
+        raise RuntimeError(f"{name}: {at.exception[0].message}")
+    return at
+
+
+class HtmlWriter:
+    """AppTest の要素ツリーを HTML に置き換える（図の id はページ内で通し番号）。"""
+
+    def __init__(self) -> None:
+        from markdown_it import MarkdownIt
+
+        # Streamlit と同じく CommonMark + 表・打ち消し線、HTML はそのまま通す
+        self._md = MarkdownIt("commonmark", {"html": True}).enable(["table", "strikethrough"])
+        self.figures = 0
+        self.skipped: list[str] = []
+
+    def block(self, node) -> str:
+        return "\n".join(self.element(child) for child in node.children.values())
+
+    def element(self, node) -> str:
+        kind = node.type
+        if kind == "markdown":
+            return f'<div data-testid="stMarkdownContainer">{self._md.render(node.value)}</div>'
+        if kind == "plotly_chart":
+            self.figures += 1
+            figure_id = f"fig-{self.figures}"
+            # spec は plotly の to_json 済み（<, >, / はエスケープ済み）なのでそのまま埋め込める
+            return (
+                f'<div class="stPlotlyChart" data-figure="{figure_id}"></div>\n'
+                f'<script type="application/json" id="{figure_id}">{node.proto.spec}</script>'
+            )
+        if kind == "expander":
+            is_open = " open" if node.proto.expanded else ""
+            return (
+                f'<details class="expander"{is_open}><summary>{html.escape(node.label)}</summary>\n'
+                f"{self.block(node)}\n</details>"
+            )
+        if kind == "slider":
+            value = node.value
+            shown = " 〜 ".join(map(str, value)) if isinstance(value, tuple) else str(value)
+            return f'<p class="static-control">{html.escape(node.label)}：{html.escape(shown)}（公開版では固定）</p>'
+        if hasattr(node, "children"):
+            return self.block(node)
+        self.skipped.append(kind)
+        return ""
+
+
+def page_file(index: int, func) -> str:
+    """ページの出力ファイル名（先頭のページは index.html）。"""
+    return "index.html" if index == 0 else f"{func.__name__.removeprefix('page_')}.html"
+
+
+def render_document(title: str, sidebar: str, nav: str, body: str, assets: dict[str, str], figures: int) -> str:
+    """1ページ分の HTML 文書を組み立てる（図の無いページは plotly.js を読み込まない）。"""
+    import dashboard
+
+    scripts = "".join(
+        f'<script src="{assets[key]}" defer></script>\n' for key in ("plotly", "charts")
+    ) if figures else ""
+    return f"""<!DOCTYPE html>
+<html lang="ja">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{html.escape(title)} | {html.escape(dashboard.APP_TITLE)}</title>
+<link rel="stylesheet" href="{assets['css']}">
+{scripts}</head>
+<body>
+<div class="app">
+<section data-testid="stSidebar">
+{sidebar}
+{nav}
+</section>
+<div class="main"><div class="block-container">
+{body}
+</div></div>
+</div>
+</body>
+</html>
+"""
+
+
+def _nav(current: int) -> str:
+    import dashboard
+
+    items = []
+    for i, (func, title, icon) in enumerate(dashboard.PAGES):
+        current_attr = ' aria-current="page"' if i == current else ""
+        items.append(f'<li><a href="{page_file(i, func)}"{current_attr}>{icon} {html.escape(title)}</a></li>')
+    return '<ul class="page-nav">\n' + "\n".join(items) + "\n</ul>"
+
+
+def export(out_dir: Path) -> list[tuple[str, float, int, int]]:
+    """全ページを out_dir に書き出す。ページごとの (ファイル名, 秒, 図の数, バイト数) を返す。"""
+    import dashboard
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    assets = write_assets(out_dir)
+    writer = HtmlWriter()
+    sidebar = writer.block(run_elements("render_sidebar_decoration").sidebar)
+    results = []
+    for i, (func, title, _) in enumerate(dashboard.PAGES):
+        started = time.perf_counter()
+        writer.figures = 0
+        body = writer.block(run_elements(func.__name__).main)
+        document = render_document(title, sidebar, _nav(i), body, assets, writer.figures).encode("utf-8")
+        name = page_file(i, func)
+        (out_dir / name).write_bytes(document)
+        results.append((name, time.perf_counter() - started, writer.figures, len(document)))
+    for kind in sorted(set(writer.skipped)):
+        print(f"書き出せない要素を省略しました: {kind}", file=sys.stderr)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--out", type=Path, default=DEFAULT_OUT, help="出力先（既定は site/）")
+    args = parser.parse_args()
+
+    # AppTest を素のプロセスで使うときの警告（ScriptRunContext が無いなど）は出さない
+    logging.getLogger("streamlit").setLevel(logging.ERROR)
+    started = time.perf_counter()
+    results = export(args.out)
+    print(f"{'file':<28} {'seconds':>8} {'figures':>8} {'bytes':>10}")
+    for name, seconds, figures, size in results:
+        print(f"{name:<28} {seconds:>8.2f} {figures:>8} {size:>10,}")
+    print(f"wrote {args.out} ({time.perf_counter() - started:.1f} s)")
+
+
+if __name__ == "__main__":
+    main()
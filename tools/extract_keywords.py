@@ -0,0 +1,50 @@
+"""
+ワークショップ議事録のキーワード抽出レポート
+
+seseragism.keywords で議事録ディレクトリを集計し、頻度表・抽出キーワード数と、
+辞書（KEYWORD_VARIANTS）にない頻出語の候補を表示する。辞書の見直しに使う。
+
+使い方:
+    python tools/extract_keywords.py                 # data/workshop/
+    python tools/extract_keywords.py path/to/notes --candidates 50
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from seseragism import keywords  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("directory", type=Path, nargs="?", help="議事録のディレクトリ（既定 data/workshop/）")
+    parser.add_argument("--candidates", type=int, default=20, help="表示する候補語の数")
+    args = parser.parse_args()
+
+    files = keywords.transcript_files(args.directory)
+    if not files:
+        raise SystemExit("議事録ファイル（.txt / .md）が見つかりません")
+    size = sum(f.stat().st_size for f in files)
+
+    started = time.perf_counter()
+    summary = keywords.extract(files)
+    elapsed = time.perf_counter() - started
+
+    print(f"{summary.files} ファイル, {size / 1e6:.1f} MB, {elapsed:.2f} 秒")
+    print(f"抽出キーワード数: {summary.extracted:,}")
+    print()
+    for row in summary.frequencies.itertuples(index=False):
+        print(f"  {row.キーワード:<12} {row.出現回数:>10,}")
+    print()
+    print("辞書にない頻出語:")
+    for gram, count in summary.candidates[: args.candidates]:
+        print(f"  {gram:<12} {count:>10,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""
+チャート構築の経路の比較（辞書 + テンプレート と graph_objects）
+
+dashboard.py の build_*_figure（キャッシュを通さずに呼ぶ）で作った図と、同じ内容を
+graph_objects で検証つきで組み立てた図（以前の経路。共通の指定は図ごとに layout に書き、
+テンプレートは Streamlit の既定）について、図ごとに
+  ・構築時間（中央値）
+  ・シリアライズ時間（to_dict + JSON。st.plotly_chart が送信時に行う処理）
+  ・再実行ごとの送信前の処理（graph_objects 側は st.plotly_chart と同じく毎回シリアライズ、
+    辞書側は dashboard.plotly_chart と同じく charts.spec() のシリアライズ済みの JSON を使う）
+  ・送信する JSON のバイト数
+を並べる。graph_objects 側の構築時間には、データの numpy 配列などへの変換は含まない。
+
+使い方:
+    python tools/figure_benchmark.py
+    python tools/figure_benchmark.py --repeat 50 --json figures.json
+"""
+
+import argparse
+import copy
+import inspect
+import json
+import statistics
+import sys
+import time
+import warnings
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+
+def _cases() -> dict:
+    """計測する図（名前 → (build_* 関数, 引数を用意する関数)）。"""
+    import numpy as np
+    import pandas as pd
+
+    import dashboard
+    from seseragism import cohort, cooccurrence, data, projection, survey, timeseries
+
+    def population(sigma: float):
+        actual, paths = data.population_actual(), projection.population_paths(0.0)
+        bands = projection.population_fan(0.0, sigma) if sigma > 0 else None
+        by_age = cohort.cohort_projection(years=int(paths["年"].iloc[-1]) - cohort.base_year())
+        age_paths = by_age.totals().merge(by_age.age_groups(), on="年")
+        return (actual["年"].tolist(), actual["人口"].tolist(), paths["年"].tolist(), paths["人口"].tolist(),
+                bands, age_paths)
+
+    def series():
+        # 間引き後の長い系列と同じ点数（データストアに日別の表が無くても測れるよう合成する）
+        points = timeseries.PIXEL_BUDGET
+        rng = np.random.default_rng(0)
+        frame = pd.DataFrame({
+            "日付": pd.date_range("2015-01-01", periods=points, freq="D"),
+            "観光客数": 8000 + rng.normal(0, 800, points).round(),
+        })
+        return frame, "観光客数（人）", "#1a6b8a"
+
+    scores = survey.survey_scores()
+    values = data.workshop_values()
+    return {
+        "keyword": (dashboard.build_keyword_figure, lambda: (data.workshop_keywords(),)),
+        "radar": (dashboard.build_radar_figure, lambda: (values["カテゴリ"].tolist(), values["重要度"].tolist())),
+        "cooccurrence": (dashboard.build_cooccurrence_figure, lambda: (cooccurrence.team_cooccurrence(),)),
+        "score": (
+            dashboard.build_score_figure,
+            lambda: ([f"{s}点" for s in scores["点数"]], scores["回答数"].tolist()),
+        ),
+        "youth": (
+            dashboard.build_youth_figure,
+            lambda: (cohort.youth_outflow_paths(), ("現状", "半減", "なし")),
+        ),
+        "population": (dashboard.build_population_figure, lambda: population(0.0)),
+        "population(fan)": (dashboard.build_population_figure, lambda: population(0.3)),
+        "tourism": (dashboard.build_tourism_figure, lambda: (data.tourism(),)),
+        "business": (dashboard.build_business_figure, lambda: (data.businesses(),)),
+        "series": (dashboard.build_series_figure, series),
+    }
+
+
+def _merge(base: dict, override: dict) -> dict:
+    merged = copy.deepcopy(base)
+    for key, value in override.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _merge(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def legacy_spec(fig) -> dict:
+    """同じ図を以前の形にする（テンプレートの指定を layout に展開し、テンプレートは外す）。"""
+    spec = {"data": [trace.to_plotly_json() for trace in fig.data], "layout": fig.layout.to_plotly_json()}
+    template = spec["layout"].pop("template")
+    spec["layout"] = _merge(template["layout"], spec["layout"])
+    return spec
+
+
+def _median_ms(func, repeat: int) -> tuple[float, object]:
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        times.append((time.perf_counter() - started) * 1000)
+    return statistics.median(times), result
+
+
+def measure(repeat: int) -> dict[str, dict]:
+    """図ごとに両方の経路を計測する。"""
+    import plotly.graph_objects as go
+    import plotly.io as pio
+
+    from seseragism import charts
+
+    def serialize(fig) -> str:
+        # st.plotly_chart と同じ処理（図を to_dict して検証なしで JSON にする）
+        return pio.to_json(fig.to_dict(), validate=False, engine=charts.JSON_ENGINE)
+
+    results = {}
+    for name, (builder, prepare) in _cases().items():
+        build = inspect.unwrap(builder)
+        args = prepare()
+        dict_ms, fig = _median_ms(lambda: build(*args), repeat)
+        spec = legacy_spec(fig)
+        go_ms, legacy = _median_ms(lambda: go.Figure(spec), repeat)
+        dict_json_ms, payload = _median_ms(lambda: serialize(fig), repeat)
+        go_json_ms, legacy_payload = _median_ms(lambda: serialize(legacy), repeat)
+        charts.spec(fig)
+        rerun_ms, _ = _median_ms(lambda: charts.spec(fig), repeat)
+        results[name] = {
+            "graph_objects": {"build_ms": round(go_ms, 3), "json_ms": round(go_json_ms, 3),
+                              "rerun_ms": round(go_json_ms, 3), "bytes": len(legacy_payload.encode())},
+            "dict": {"build_ms": round(dict_ms, 3), "json_ms": round(dict_json_ms, 3),
+                     "rerun_ms": round(rerun_ms, 3), "bytes": len(payload.encode())},
+        }
+    return results
+
+
+def _print_report(results: dict[str, dict]) -> None:
+    from seseragism import charts
+
+    print(f"JSON エンジン: {charts.JSON_ENGINE}（左: graph_objects → 右: 辞書 + テンプレート）")
+    keys = ("build_ms", "json_ms", "rerun_ms", "bytes")
+    print(f"{'figure':<18} {'build ms':>18} {'json ms':>18} {'rerun ms':>18} {'bytes':>20}")
+    totals = {"graph_objects": [0.0, 0.0, 0.0, 0], "dict": [0.0, 0.0, 0.0, 0]}
+    for name, r in results.items():
+        for path in totals:
+            for i, key in enumerate(keys):
+                totals[path][i] += r[path][key]
+        _print_row(name, [r["graph_objects"][key] for key in keys], [r["dict"][key] for key in keys])
+    _print_row("合計", totals["graph_objects"], totals["dict"])
+
+
+def _print_row(name: str, before: list, after: list) -> None:
+    cells = [f"{b:.2f} -> {a:.2f}" for b, a in zip(before[:3], after[:3])] + [f"{before[3]:,} -> {after[3]:,}"]
+    print(f"{name:<18} {cells[0]:>18} {cells[1]:>18} {cells[2]:>18} {cells[3]:>20}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20, help="図ごとの計測回数（中央値を採用）")
+    parser.add_argument("--json", type=Path, help="結果を JSON で保存する")
+    args = parser.parse_args()
+
+    warnings.filterwarnings("ignore")
+    results = measure(args.repeat)
+    _print_report(results)
+    if args.json:
+        args.json.write_text(json.dumps(results, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,300 @@
+"""
+同時閲覧の負荷試験（多数のヘッドレスセッションでページを巡回する）
+
+ローカルに `streamlit run app.py` のサーバーを起動し（--port なら起動済みのサーバー）、
+ウォームアップが終わって /ready が 200 になってから
+tools/st_client.py のクライアントで N セッションを同時につなぐ。各セッションは
+--ramp 秒の間にばらけて接続し、--duration 秒の間、考える時間（平均 --think 秒の指数分布）
+をはさみながら次の操作を繰り返す。
+  ・navigate … ページの閲覧比率（--mix。PAGES の順）で選んだページに移る
+  ・interact … 今のページのスライダーを1つ、範囲内の別の値にして再実行する
+              （スライダーの無いページでは、そのまま再実行する）
+操作は確率 --interact で interact、それ以外は navigate。
+
+同時セッション数ごとに
+  ・スループット（ramp 後の1秒あたりの実行完了数）
+  ・応答時間（操作を送ってから script_finished まで）の p50 / p90 / p95 / p99 / 最大
+  ・失敗（--timeout 秒以内に終わらなかった・切断された・ページに例外が出た）数
+  ・サーバープロセスの CPU（1コア = 100%）の平均と最大、RSS の開始時・最大と
+    1セッションあたりの増分
+を表にする。応答時間の p95 が考える時間に近づく・CPU が 100% に張り付くあたりが、
+1プロセスで捌ける同時閲覧数の目安。数百セッションではクライアント側の処理も重くなるので、
+--client-procs でクライアントを複数プロセスに分ける（クライアントの CPU も表示する）。
+サーバーの CPU・RSS は /proc から読むので Linux 専用。
+依存: pip install websockets
+
+使い方:
+    python tools/load_test.py --sessions 10 50 100 --duration 60
+    python tools/load_test.py --sessions 200 400 --client-procs 4 --json load.json
+    python tools/load_test.py --script dashboard.py --sessions 100   # ウォームアップなしの起動直後
+    python tools/load_test.py --port 8501 --pid 12345 --sessions 100   # 起動済みのサーバー
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from st_client import StreamlitClient, serve_app  # noqa: E402
+
+# ページの閲覧比率（dashboard.PAGES の順。トップと統計データが多め）
+DEFAULT_MIX = (30, 15, 10, 15, 10, 20)
+PERCENTILES = (50, 90, 95, 99)
+SAMPLE_INTERVAL = 0.5
+CLOCK_TICKS = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+
+
+# ============================================================
+# サーバープロセスの CPU・RSS（/proc）
+# ============================================================
+def _cpu_seconds(pid: int) -> float:
+    fields = Path(f"/proc/{pid}/stat").read_text().rsplit(")", 1)[1].split()
+    return (int(fields[11]) + int(fields[12])) / CLOCK_TICKS  # utime + stime
+
+
+def _rss_bytes(pid: int) -> int:
+    for line in Path(f"/proc/{pid}/status").read_text().splitlines():
+        if line.startswith("VmRSS:"):
+            return int(line.split()[1]) * 1024
+    return 0
+
+
+class ProcessSampler:
+    """SAMPLE_INTERVAL 秒ごとにプロセスの CPU 使用率と RSS を記録する（別スレッド）。"""
+
+    def __init__(self, pid: int) -> None:
+        self.pid = pid
+        self.rss_start = 0
+        self.cpu_pct: list[float] = []
+        self.rss: list[int] = []
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def __enter__(self) -> "ProcessSampler":
+        self.rss_start = _rss_bytes(self.pid)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        last_cpu, last_at = _cpu_seconds(self.pid), time.monotonic()
+        while not self._stop.wait(SAMPLE_INTERVAL):
+            try:
+                cpu, rss = _cpu_seconds(self.pid), _rss_bytes(self.pid)
+            except FileNotFoundError:  # サーバーが落ちた
+                return
+            now = time.monotonic()
+            self.cpu_pct.append((cpu - last_cpu) / (now - last_at) * 100)
+            self.rss.append(rss)
+            last_cpu, last_at = cpu, now
+
+
+# ============================================================
+# セッション（クライアント側）
+# ============================================================
+def _slider_state(slider, rng: random.Random):
+    """スライダーを範囲内の別の値（範囲のスライダーは別の区間）にした WidgetState。"""
+    from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+    steps = max(int(round((slider.max - slider.min) / slider.step)), 1) if slider.step else 100
+    grid = [slider.min + (slider.max - slider.min) * i / steps for i in range(steps + 1)]
+    size = len(slider.value or slider.default) or 1
+    state = WidgetState(id=slider.id)
+    state.double_array_value.data.extend(sorted(rng.sample(grid, min(size, len(grid)))))
+    return state
+
+
+async def _session(port: int, params: dict, index: int, started: float, samples: list[dict]) -> None:
+    """1セッション分の操作を繰り返し、操作ごとの (種類, ページ, 開始時刻, 秒, バイト, 失敗) を残す。"""
+    rng = random.Random(params["seed"] * 100_003 + index)
+    await asyncio.sleep(rng.uniform(0, params["ramp"]))
+    deadline = started + params["ramp"] + params["duration"]
+
+    async def act(client: StreamlitClient, kind: str, page: str, states=()) -> bool:
+        at = time.monotonic()
+        try:
+            run = await asyncio.wait_for(client.run_page(page, widget_states=states), params["timeout"])
+        except Exception as exc:  # タイムアウト・切断。このセッションはここで終える
+            samples.append({"kind": kind, "page": page, "at": at - started, "error": type(exc).__name__})
+            return False
+        if run.exceptions:  # スクリプトが例外で止まった。応答時間には入れず、セッションは続ける
+            samples.append({"kind": kind, "page": page or "(default)", "at": at - started,
+                            "error": run.exceptions[0]})
+            return True
+        samples.append({"kind": kind, "page": page or "(default)", "at": at - started,
+                        "seconds": run.seconds, "bytes": run.bytes})
+        return True
+
+    try:
+        async with StreamlitClient(port) as client:
+            if not await act(client, "open", ""):
+                return
+            pages = list(client.pages)
+            weights = [params["mix"][i] if i < len(params["mix"]) else 1 for i in range(len(pages))]
+            current = pages[0] if pages else ""
+            while time.monotonic() < deadline:
+                await asyncio.sleep(min(rng.expovariate(1 / params["think"]), max(deadline - time.monotonic(), 0)))
+                if time.monotonic() >= deadline:
+                    break
+                if pages and rng.random() >= params["interact"]:
+                    current = rng.choices(pages, weights)[0]
+                    ok = await act(client, "navigate", current)
+                else:
+                    sliders = list(client.sliders.values())
+                    states = [_slider_state(rng.choice(sliders), rng)] if sliders else []
+                    ok = await act(client, "interact", current, states)
+                if not ok:
+                    return
+    except OSError as exc:  # 接続できなかった
+        samples.append({"kind": "open", "page": "", "at": time.monotonic() - started, "error": type(exc).__name__})
+
+
+async def _run_sessions(port: int, params: dict, indices: range, started: float) -> list[dict]:
+    samples: list[dict] = []
+    await asyncio.gather(*(_session(port, params, i, started, samples) for i in indices))
+    return samples
+
+
+def run_client(port: int, params: dict, indices: range, started_wall: float) -> tuple[list[dict], float]:
+    """indices のセッションをこのプロセスで動かす（--client-procs の各プロセスの本体）。
+
+    戻り値は操作の記録と、このプロセスが使った CPU 秒。
+    """
+    # プロセス間で monotonic の基準は共有できないので、開始時刻は壁時計で受け取って直す
+    started = time.monotonic() - (time.time() - started_wall)
+    cpu = time.process_time()
+    samples = asyncio.run(_run_sessions(port, params, indices, started))
+    return samples, time.process_time() - cpu
+
+
+# ============================================================
+# 集計
+# ============================================================
+def _percentiles(values: list[float]) -> dict[str, float]:
+    if len(values) < 2:
+        return {f"p{p}": round(values[0] * 1000, 1) if values else 0.0 for p in PERCENTILES}
+    cuts = statistics.quantiles(values, n=100, method="inclusive")
+    return {f"p{p}": round(cuts[p - 1] * 1000, 1) for p in PERCENTILES}
+
+
+def summarize(samples: list[dict], sessions: int, params: dict, sampler: ProcessSampler | None,
+              client_cpu: float) -> dict:
+    """1段階（同時セッション数1つ分）の結果をまとめる。応答時間などは ramp 後の操作だけで数える。"""
+    steady = [s for s in samples if s["at"] >= params["ramp"]]
+    done = [s["seconds"] for s in steady if "seconds" in s]
+    by_page: dict[str, list[float]] = {}
+    for s in steady:
+        if "seconds" in s:
+            by_page.setdefault(s["page"], []).append(s["seconds"])
+    result = {
+        "sessions": sessions,
+        "runs": len(done),
+        "errors": sum(1 for s in samples if "error" in s),
+        "throughput_rps": round(len(done) / params["duration"], 2),
+        "latency_ms": {**_percentiles(done), "max": round(max(done, default=0) * 1000, 1)},
+        "pages_ms": {page: _percentiles(values) for page, values in sorted(by_page.items())},
+        "client_cpu_pct": round(client_cpu / (params["ramp"] + params["duration"]) * 100, 1),
+    }
+    if sampler is not None and sampler.rss:
+        baseline = sampler.rss_start
+        peak = max(sampler.rss)
+        result["server"] = {
+            "cpu_pct_mean": round(statistics.fmean(sampler.cpu_pct), 1),
+            "cpu_pct_max": round(max(sampler.cpu_pct), 1),
+            "rss_start_mib": round(baseline / 2**20, 1),
+            "rss_peak_mib": round(peak / 2**20, 1),
+            "rss_per_session_kib": round((peak - baseline) / sessions / 1024, 1),
+        }
+    return result
+
+
+def run_level(port: int, pid: int | None, sessions: int, params: dict, client_procs: int) -> dict:
+    """同時セッション数 sessions の1段階を実行する。"""
+    procs = max(min(client_procs, sessions), 1)
+    chunks = [range(i, sessions, procs) for i in range(procs)]
+    sampler = ProcessSampler(pid) if pid else None
+    samples: list[dict] = []
+    client_cpu = 0.0
+    with sampler or nullcontext():
+        started_wall = time.time()
+        if procs == 1:
+            samples, client_cpu = run_client(port, params, chunks[0], started_wall)
+        else:
+            with ProcessPoolExecutor(procs) as pool:
+                futures = [pool.submit(run_client, port, params, chunk, started_wall) for chunk in chunks]
+                for future in futures:
+                    part, cpu = future.result()
+                    samples += part
+                    client_cpu += cpu
+    return summarize(samples, sessions, params, sampler, client_cpu)
+
+
+def _print_report(results: list[dict]) -> None:
+    print(f"{'sessions':>8} {'runs/s':>7} {'p50':>7} {'p90':>7} {'p95':>7} {'p99':>7} {'max':>7} {'err':>4} "
+          f"{'cpu%':>6} {'cpu%max':>7} {'rss MiB':>8} {'KiB/ses':>8} {'client%':>7}")
+    for r in results:
+        lat = r["latency_ms"]
+        server = r.get("server", {})
+        print(
+            f"{r['sessions']:>8} {r['throughput_rps']:>7.1f} {lat['p50']:>7.0f} {lat['p90']:>7.0f} "
+            f"{lat['p95']:>7.0f} {lat['p99']:>7.0f} {lat['max']:>7.0f} {r['errors']:>4} "
+            f"{server.get('cpu_pct_mean', float('nan')):>6.0f} {server.get('cpu_pct_max', float('nan')):>7.0f} "
+            f"{server.get('rss_peak_mib', float('nan')):>8.0f} {server.get('rss_per_session_kib', float('nan')):>8.0f} "
+            f"{r['client_cpu_pct']:>7.0f}"
+        )
+    print("（応答時間は ms。cpu% はサーバープロセスの 1コア = 100%、client% はクライアント側）")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sessions", type=int, nargs="+", default=[10, 50, 100], help="同時セッション数（複数可）")
+    parser.add_argument("--duration", type=float, default=30, help="1段階の計測時間（秒、ramp の後）")
+    parser.add_argument("--ramp", type=float, default=5, help="セッションの接続をばらけさせる時間（秒）")
+    parser.add_argument("--think", type=float, default=3, help="操作の間の考える時間の平均（秒）")
+    parser.add_argument("--interact", type=float, default=0.3, help="操作のうちスライダー操作の割合")
+    parser.add_argument("--mix", type=float, nargs="+", default=list(DEFAULT_MIX), help="ページの閲覧比率（PAGES の順）")
+    parser.add_argument("--timeout", type=float, default=60, help="1回の実行の制限時間（秒）")
+    parser.add_argument("--client-procs", type=int, default=1, help="クライアントのプロセス数")
+    parser.add_argument("--script", default="app.py", help="起動するスクリプト（dashboard.py ならウォームアップなし）")
+    parser.add_argument("--port", type=int, help="起動済みのサーバーのポート（サーバーを起動しない）")
+    parser.add_argument("--pid", type=int, help="起動済みのサーバーのプロセス ID（CPU・RSS を測る）")
+    parser.add_argument("--seed", type=int, default=0, help="乱数の種")
+    parser.add_argument("--json", type=Path, help="結果を JSON で保存する")
+    args = parser.parse_args()
+
+    params = {
+        "duration": args.duration, "ramp": args.ramp, "think": args.think, "interact": args.interact,
+        "mix": args.mix, "timeout": args.timeout, "seed": args.seed,
+    }
+    results = []
+    for sessions in args.sessions:
+        if args.port:
+            results.append(run_level(args.port, args.pid, sessions, params, args.client_procs))
+        else:
+            # 段階ごとに新しいサーバー（RSS の増分を前の段階と混ぜない）
+            with serve_app(args.script) as (port, proc):
+                results.append(run_level(port, proc.pid, sessions, params, args.client_procs))
+        print(f"{sessions} sessions: {results[-1]['throughput_rps']} runs/s, "
+              f"p95 {results[-1]['latency_ms']['p95']} ms", file=sys.stderr)
+    _print_report(results)
+    if args.json:
+        args.json.write_text(json.dumps(results, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+ページごとの送信ペイロード量レポート
+
+Streamlit の AppTest で各ページをヘッドレスに1回描画し、ブラウザへ送られる
+要素（デルタ）の数とバイト数を集計する。--save で結果をJSONに保存しておき、
+変更後に --baseline で読み込むと、変更前後の比較表を出力する。
+
+使い方:
+    python tools/payload_report.py --save before.json
+    （変更を加える）
+    python tools/payload_report.py --baseline before.json
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+
+def _render_page(page_name: str) -> None:
+    """AppTest 内で実行されるスクリプト本体（main() と同じ共通部品 + 1ページ）。"""
+    import dashboard
+
+    dashboard.inject_custom_css()
+    dashboard.render_sidebar_decoration()
+    getattr(dashboard, page_name)()
+
+
+def _walk(node) -> tuple[int, int, int]:
+    """要素ツリーをたどり (要素数, 全バイト数, markdownバイト数) を返す。"""
+    count = total = markdown = 0
+    proto = getattr(node, "proto", None)
+    if proto is not None:
+        size = len(proto.SerializeToString())
+        count, total = 1, size
+        if type(node).__name__ == "Markdown":
+            markdown = size
+    for child in getattr(node, "children", {}).values():
+        c, t, m = _walk(child)
+        count += c
+        total += t
+        markdown += m
+    return count, total, markdown
+
+
+def measure_page(page_name: str) -> dict:
+    """1ページを描画し、要素数とバイト数を返す。"""
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_function(_render_page, args=(page_name,))
+    at.run(timeout=60)
+    if at.exception:
+        raise RuntimeError(f"{page_name}: {at.exception[0].message}")
+    count, total, markdown = _walk(at._tree)
+    return {"elements": count, "bytes": total, "markdown_bytes": markdown}
+
+
+def measure_all() -> dict[str, dict]:
+    """全ページを計測する。"""
+    import dashboard
+
+    return {page.__name__: measure_page(page.__name__) for page, _, _ in dashboard.PAGES}
+
+
+def _print_report(results: dict[str, dict], baseline: dict[str, dict] | None) -> None:
+    if baseline is None:
+        print(f"{'page':<26} {'elements':>9} {'bytes':>9} {'markdown':>9}")
+        for name, r in results.items():
+            print(f"{name:<26} {r['elements']:>9} {r['bytes']:>9,} {r['markdown_bytes']:>9,}")
+        return
+
+    print(f"{'page':<26} {'elements':>15} {'bytes before':>13} {'bytes after':>12} {'diff':>8}")
+    sum_before = sum_after = 0
+    for name, r in results.items():
+        b = baseline.get(name)
+        if b is None:
+            print(f"{name:<26} {r['elements']:>15} {'-':>13} {r['bytes']:>12,} {'-':>8}")
+            continue
+        sum_before += b["bytes"]
+        sum_after += r["bytes"]
+        diff = (r["bytes"] - b["bytes"]) / b["bytes"] * 100
+        elements = f"{b['elements']} -> {r['elements']}"
+        print(f"{name:<26} {elements:>15} {b['bytes']:>13,} {r['bytes']:>12,} {diff:>7.1f}%")
+    if sum_before:
+        diff = (sum_after - sum_before) / sum_before * 100
+        print(f"{'合計':<24} {'':>15} {sum_before:>13,} {sum_after:>12,} {diff:>7.1f}%")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--save", type=Path, help="計測結果をJSONで保存する")
+    parser.add_argument("--baseline", type=Path, help="比較対象のJSON（--save の出力）")
+    args = parser.parse_args()
+
+    results = measure_all()
+    baseline = json.loads(args.baseline.read_text()) if args.baseline else None
+    _print_report(results, baseline)
+    if args.save:
+        args.save.write_text(json.dumps(results, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
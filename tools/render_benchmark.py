@@ -0,0 +1,81 @@
+"""
+ページ描画のメッセージ数・描画完了時間ベンチマーク
+
+ダッシュボードをローカルで起動し（app.py。起動時のウォームアップが終わってから測る）、
+帯域と遅延を絞ったプロキシ越しにヘッドレスクライアントから各ページを描画して、
+ForwardMsg の件数・バイト数と script_finished までの時間（描画完了時間）を計測する。
+--save / --baseline で変更前後を比較できる（tools/payload_report.py と同じ形式）。
+
+使い方:
+    python tools/render_benchmark.py --kbps 1000 --latency-ms 50 --save before.json
+    python tools/render_benchmark.py --kbps 1000 --latency-ms 50 --baseline before.json
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from st_client import StreamlitClient, ThrottledProxy, serve_app  # noqa: E402
+
+
+async def _measure(port: int, kbps: float, latency_ms: float, repeat: int) -> dict[str, dict]:
+    proxy = ThrottledProxy(port, kbps, latency_ms)
+    proxy_port = await proxy.start()
+    results: dict[str, dict] = {}
+    try:
+        async with StreamlitClient(proxy_port) as client:
+            await client.run_page()  # ナビゲーション情報の取得とキャッシュのウォームアップ
+            for url_pathname in list(client.pages):
+                runs = []
+                for _ in range(repeat):
+                    # 別ページを挟んでから遷移し、毎回ページ全体を描画させる
+                    other = next(p for p in client.pages if p != url_pathname)
+                    await client.run_page(other)
+                    runs.append(await client.run_page(url_pathname))
+                results[url_pathname or "(default)"] = {
+                    "messages": runs[0].messages,
+                    "bytes": runs[0].bytes,
+                    "seconds": statistics.median(r.seconds for r in runs),
+                }
+    finally:
+        await proxy.close()
+    return results
+
+
+def _print_report(results: dict[str, dict], baseline: dict[str, dict] | None) -> None:
+    print(f"{'page':<26} {'messages':>12} {'bytes':>18} {'seconds':>16}")
+    for name, r in results.items():
+        b = (baseline or {}).get(name)
+        if b is None:
+            print(f"{name:<26} {r['messages']:>12} {r['bytes']:>18,} {r['seconds']:>16.3f}")
+        else:
+            messages = f"{b['messages']} -> {r['messages']}"
+            size = f"{b['bytes']:,} -> {r['bytes']:,}"
+            seconds = f"{b['seconds']:.3f} -> {r['seconds']:.3f}"
+            print(f"{name:<26} {messages:>12} {size:>18} {seconds:>16}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--kbps", type=float, default=1000, help="帯域（kbps、既定 1000）")
+    parser.add_argument("--latency-ms", type=float, default=50, help="片道遅延（ms、既定 50）")
+    parser.add_argument("--repeat", type=int, default=5, help="ページごとの計測回数（中央値を採用）")
+    parser.add_argument("--save", type=Path, help="計測結果をJSONで保存する")
+    parser.add_argument("--baseline", type=Path, help="比較対象のJSON（--save の出力）")
+    args = parser.parse_args()
+
+    with serve_app() as (port, _):
+        results = asyncio.run(_measure(port, args.kbps, args.latency_ms, args.repeat))
+    baseline = json.loads(args.baseline.read_text()) if args.baseline else None
+    _print_report(results, baseline)
+    if args.save:
+        args.save.write_text(json.dumps(results, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
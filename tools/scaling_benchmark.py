@@ -0,0 +1,215 @@
+"""
+データ規模に対する集計・チャート構築のスケーリング計測
+
+tools/synth_data.py の合成データを行数ごとに用意し（無ければ生成する）、
+行数ごとに新しいプロセスで、集計関数とチャート構築関数の
+  ・処理時間（キャッシュを通さずに呼んだときの中央値）
+  ・ピークメモリ（tracemalloc で測った、呼び出し中に増えた分の最大値）
+  ・チャートの JSON のバイト数
+を計測する。結果は表で出力し、--plot で行数に対する時間・メモリの両対数グラフ（HTML）を、
+--json で数値を保存する。どの処理が先に限界になるかを、実データが来る前に見るためのもの。
+
+使い方:
+    python tools/scaling_benchmark.py --rows 100 10000 1000000 --plot scaling.html
+    python tools/scaling_benchmark.py --data-root /tmp/seseragism-synth --repeat 5 --json scaling.json
+"""
+
+import argparse
+import inspect
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import warnings
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+
+def _cases() -> dict:
+    """計測する処理（名前 → (入力を準備する関数, 計測する関数)）。
+
+    入力の準備（データの読み込みなど）は計測に含めない。キャッシュつきの関数は
+    __wrapped__ をたどって中身を直接呼ぶ。
+    """
+    import dashboard
+    from seseragism import cooccurrence, data, keywords, metrics, projection, store, survey, timeseries
+
+    def teams():
+        return (data.workshop_teams.__wrapped__(),)
+
+    def lines():
+        files = keywords.transcript_files()
+        text = files[0].read_text(encoding="utf-8").splitlines() if files else []
+        return text, tuple((t, tuple(f)) for t, f in keywords.KEYWORD_VARIANTS.items())
+
+    def daily():
+        table = store.read_table("tourism_daily")
+        return table.column("日付").to_numpy(), table.column("観光客数").to_numpy().astype(float)
+
+    def fig(builder):
+        return inspect.unwrap(builder)
+
+    responses = lambda: (survey.load_responses(),)  # noqa: E731
+    return {
+        "survey.summarize": (responses, survey.summarize),
+        "survey.score_histogram": (responses, survey.score_histogram),
+        "data.workshop_teams": (lambda: (), data.workshop_teams.__wrapped__),
+        "cooccurrence.incidence": (teams, cooccurrence.incidence),
+        "cooccurrence.cooccurrence": (
+            lambda: (cooccurrence.incidence(data.workshop_teams()),), cooccurrence.cooccurrence
+        ),
+        "keywords.count_lines": (lines, keywords.count_lines),
+        "metrics.business_summary": (lambda: (), metrics.business_summary.__wrapped__),
+        "timeseries.downsample(lttb)": (daily, lambda x, y: timeseries.downsample(x, y, method="lttb")),
+        "timeseries.downsample(minmax)": (daily, lambda x, y: timeseries.downsample(x, y, method="minmax")),
+        "build_keyword_figure": (
+            lambda: (data.workshop_keywords(),), fig(dashboard.build_keyword_figure)
+        ),
+        "build_cooccurrence_figure": (
+            lambda: (cooccurrence.team_cooccurrence(),), fig(dashboard.build_cooccurrence_figure)
+        ),
+        "build_score_figure": (
+            lambda: ([f"{s}点" for s in survey.survey_scores()["点数"]], survey.survey_scores()["回答数"].tolist()),
+            fig(dashboard.build_score_figure),
+        ),
+        "build_population_figure": (
+            lambda: (
+                data.population_actual()["年"].tolist(), data.population_actual()["人口"].tolist(),
+                projection.population_paths()["年"].tolist(), projection.population_paths()["人口"].tolist(),
+            ),
+            fig(dashboard.build_population_figure),
+        ),
+        "build_tourism_figure": (lambda: (data.tourism(),), fig(dashboard.build_tourism_figure)),
+        "build_business_figure": (lambda: (data.businesses(),), fig(dashboard.build_business_figure)),
+        "build_series_figure": (
+            lambda: (timeseries.series_view("tourism_daily").frame, "観光客数（人）", "#1a6b8a"),
+            fig(dashboard.build_series_figure),
+        ),
+    }
+
+
+def _measure_case(prepare, func, repeat: int) -> dict:
+    args = prepare()
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func(*args)
+        times.append((time.perf_counter() - started) * 1000)
+    # tracemalloc は処理を遅くするので、時間とは別の1回で測る
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline = tracemalloc.get_traced_memory()[0]
+    result = func(*args)
+    peak = tracemalloc.get_traced_memory()[1] - baseline
+    tracemalloc.stop()
+    measured = {"ms": round(statistics.median(times), 3), "peak_bytes": peak}
+    if hasattr(result, "to_plotly_json"):
+        measured["json_bytes"] = len(result.to_json())
+    return measured
+
+
+def _child(repeat: int) -> None:
+    """SESERAGISM_DATA_DIR のデータで全処理を計測し、結果を JSON で stdout に出す。"""
+    warnings.filterwarnings("ignore")
+    results = {}
+    for name, (prepare, func) in _cases().items():
+        try:
+            results[name] = _measure_case(prepare, func, repeat)
+        except Exception as exc:  # 規模によっては失敗する処理もあるので記録して続ける
+            results[name] = {"error": f"{type(exc).__name__}: {exc}"}
+    print(json.dumps(results, ensure_ascii=False))
+
+
+def measure(data_dir: Path, repeat: int, timeout: float) -> dict:
+    """行数1つ分を新しいプロセスで計測する。"""
+    env = {
+        **os.environ,
+        "SESERAGISM_DATA_DIR": str(data_dir),
+        "SESERAGISM_WORKSHOP_DIR": str(data_dir / "workshop"),
+    }
+    proc = subprocess.run(
+        [sys.executable, __file__, "--child", "--repeat", str(repeat)],
+        cwd=ROOT, env=env, capture_output=True, text=True, timeout=timeout, check=True,
+    )
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def _print_report(results: dict[int, dict]) -> None:
+    sizes = sorted(results)
+    names = list(results[sizes[0]])
+    print(f"{'処理':<32}" + "".join(f"{f'{n:,} 行':>24}" for n in sizes))
+    for name in names:
+        cells = []
+        for n in sizes:
+            r = results[n][name]
+            cells.append("error" if "error" in r else f"{r['ms']:.1f} ms / {r['peak_bytes'] / 2**20:.1f} MiB")
+        print(f"{name:<32}" + "".join(f"{c:>24}" for c in cells))
+
+
+def plot(results: dict[int, dict], path: Path) -> None:
+    """行数に対する時間とピークメモリの両対数グラフを HTML に書き出す。"""
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+
+    sizes = sorted(results)
+    fig = make_subplots(rows=1, cols=2, subplot_titles=("処理時間（ms）", "ピークメモリ（MiB）"))
+    for name in results[sizes[0]]:
+        ok = [n for n in sizes if "error" not in results[n][name]]
+        for col, key, scale in ((1, "ms", 1), (2, "peak_bytes", 2**20)):
+            fig.add_trace(
+                go.Scatter(
+                    x=ok, y=[max(results[n][name][key] / scale, 1e-3) for n in ok],
+                    mode="lines+markers", name=name, legendgroup=name, showlegend=col == 1,
+                ),
+                row=1, col=col,
+            )
+    fig.update_xaxes(type="log", title="行数")
+    fig.update_yaxes(type="log")
+    fig.update_layout(height=600, title="データ規模に対するスケーリング")
+    fig.write_html(path, include_plotlyjs="cdn")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[100, 10_000, 1_000_000], help="行数（複数可）")
+    parser.add_argument("--data-root", type=Path, help="合成データの置き場（既定は一時ディレクトリ）")
+    parser.add_argument("--repeat", type=int, default=3, help="処理ごとの計測回数（中央値を採用）")
+    parser.add_argument("--timeout", type=float, default=1800, help="行数1つ分の制限時間（秒）")
+    parser.add_argument("--plot", type=Path, help="グラフを HTML で保存する")
+    parser.add_argument("--json", type=Path, help="結果を JSON で保存する")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        _child(args.repeat)
+        return
+
+    import synth_data
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_root = args.data_root or Path(tmp)
+        results: dict[int, dict] = {}
+        for rows in args.rows:
+            data_dir = data_root / str(rows)
+            if not (data_dir / "manifest.json").is_file():
+                synth_data.write(data_dir, rows)
+            print(f"計測中: {rows:,} 行", file=sys.stderr)
+            results[rows] = measure(data_dir, args.repeat, args.timeout)
+
+    _print_report(results)
+    if args.plot:
+        plot(results, args.plot)
+        print(f"wrote {args.plot}")
+    if args.json:
+        args.json.write_text(json.dumps(results, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
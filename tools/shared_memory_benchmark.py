@@ -0,0 +1,122 @@
+"""
+ワーカープロセス間の共有の置き場（seseragism/shared.py）のメモリ計測
+
+ワーカー N 個を同時に起動し、それぞれがダッシュボードと同じデータ（データストアの
+全表の DataFrame・アンケートの回答・長い時系列の配列）を読み込んだところで、
+/proc/<pid>/smaps_rollup から
+  ・PSS（共有しているページはプロセス数で割った、実際の負担分）
+  ・USS（そのプロセスだけが持つページ）
+を読み、読み込み前との差を合計する。共有あり（/dev/shm の一時ディレクトリを
+SESERAGISM_SHARED_DIR に指定。計測後に消す）・なしで並べて、メモリがデータ量 × ワーカー数で
+増えていないかを見る。Linux 専用。
+
+tools/synth_data.py の合成データで規模を変えて測る:
+    python tools/synth_data.py --rows 1000000 --out /tmp/seseragism-synth
+
+使い方:
+    python tools/shared_memory_benchmark.py --workers 4
+    SESERAGISM_DATA_DIR=/tmp/seseragism-synth/1000000 python tools/shared_memory_benchmark.py --workers 1 2 4 8
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+SMAPS = Path("/proc/self/smaps_rollup")
+
+
+def _memory() -> dict[str, int]:
+    """このプロセスの PSS・USS（バイト）。"""
+    fields = {}
+    for line in SMAPS.read_text().splitlines()[1:]:
+        key, value = line.split(":", 1)
+        fields[key] = int(value.split()[0]) * 1024
+    return {"pss": fields["Pss"], "uss": fields["Private_Clean"] + fields["Private_Dirty"]}
+
+
+def _load_all() -> None:
+    """ダッシュボードが読むデータをすべて読み込む。"""
+    from seseragism import store, survey, timeseries
+
+    for name in store.TABLES:
+        if store.has_table(name):
+            store.read_frame(name)
+    survey.survey_summary()
+    for name in timeseries.LONG_SERIES:
+        timeseries.series_view(name)
+
+
+def _child() -> None:
+    """読み込み前後のメモリを測る（全ワーカーが読み終わるまで stdin で待つ）。"""
+    import numpy  # noqa: F401  ライブラリの読み込み分は差に含めない
+    import pandas  # noqa: F401
+    import pyarrow  # noqa: F401
+
+    before = _memory()
+    _load_all()
+    print("loaded", flush=True)
+    sys.stdin.readline()
+    after = _memory()
+    print(json.dumps({key: after[key] - before[key] for key in after}), flush=True)
+
+
+def measure(workers: int, shared_dir: str) -> dict[str, int]:
+    """ワーカーを workers 個同時に動かし、読み込みで増えた PSS・USS の合計を返す。"""
+    env = {**os.environ, "SESERAGISM_SHARED_DIR": shared_dir, "SESERAGISM_CACHE_DIR": ""}
+    procs = [
+        subprocess.Popen([sys.executable, __file__, "--child"], cwd=ROOT, env=env, text=True,
+                         stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+        for _ in range(workers)
+    ]
+    try:
+        for proc in procs:
+            if proc.stdout.readline().strip() != "loaded":
+                raise RuntimeError("ワーカーが読み込みに失敗しました")
+        # 全員が読み込んだ状態（共有しているページが揃った状態）で測る
+        for proc in procs:
+            proc.stdin.write("\n")
+            proc.stdin.flush()
+        results = [json.loads(proc.stdout.readline()) for proc in procs]
+    finally:
+        for proc in procs:
+            proc.kill()
+            proc.wait()
+    return {key: sum(r[key] for r in results) for key in ("pss", "uss")}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4], help="同時に動かすワーカーの数（複数可）")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        _child()
+        return
+    if not SMAPS.is_file():
+        sys.exit("/proc/self/smaps_rollup が読めません（Linux 専用）")
+    from seseragism import shared
+
+    root = shared.SHM_ROOT if shared.SHM_ROOT.is_dir() else None
+    print(f"{'workers':>7} {'PSS 共有なし':>14} {'PSS 共有あり':>14} {'USS 共有なし':>14} {'USS 共有あり':>14}  (MiB)")
+    for workers in args.workers:
+        directory = tempfile.mkdtemp(prefix="seseragism-bench-", dir=root)
+        try:
+            private = measure(workers, "")
+            common = measure(workers, directory)
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+        cells = [private["pss"], common["pss"], private["uss"], common["uss"]]
+        print(f"{workers:>7} " + " ".join(f"{value / 2**20:>14.1f}" for value in cells))
+
+
+if __name__ == "__main__":
+    main()
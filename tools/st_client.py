@@ -0,0 +1,216 @@
+"""
+計測用の Streamlit ヘッドレスクライアント
+
+ブラウザの代わりに WebSocket（/_stcore/stream）へ直接つなぎ、BackMsg で
+ページの再実行を要求して、script_finished までに届いた ForwardMsg の件数・
+バイト数・所要時間を記録する。帯域と遅延を絞ったローカルのTCPプロキシを
+挟めるので、会場Wi-Fiのような遅い回線での描画完了時間も測れる。
+
+計測スクリプト（tools/ 以下）から共通で使う部品で、単体では実行しない。
+"""
+
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+# 起動時のウォームアップ（app.py）を待つ上限（秒）
+WARMUP_TIMEOUT = 300
+
+
+@dataclass
+class RunStats:
+    """1回のスクリプト実行（ページ描画）の計測結果。"""
+
+    messages: int
+    bytes: int
+    seconds: float
+    exceptions: list[str] = field(default_factory=list)  # ページに出た例外の型名（スクリプトのエラー）
+
+
+def free_port() -> int:
+    """空いているローカルTCPポートを返す。"""
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _status(url: str) -> int | None:
+    """GET の HTTP ステータス（つながらなければ None）。"""
+    try:
+        with urllib.request.urlopen(url, timeout=1) as response:
+            return response.status
+    except urllib.error.HTTPError as exc:
+        return exc.code
+    except OSError:
+        return None
+
+
+@contextmanager
+def serve_app(script: str = "app.py", port: int | None = None, env: dict | None = None):
+    """`streamlit run` をサブプロセスで起動し、準備ができたらポートを返す。
+
+    env は os.environ に上書きする環境変数。値を None にした変数は渡さない。
+
+    既定の app.py（本番の起動スクリプト）は、起動時のウォームアップが終わって /ready が
+    200 になるまで待つ。dashboard.py（ウォームアップなし）はヘルスチェックが通った時点で返す。
+    """
+    port = port or free_port()
+    proc = subprocess.Popen(
+        [
+            sys.executable, "-m", "streamlit", "run", script,
+            "--server.headless", "true",
+            "--server.port", str(port),
+            "--browser.gatherUsageStats", "false",
+        ],
+        cwd=ROOT,
+        env={key: value for key, value in {**os.environ, **(env or {})}.items() if value is not None},
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        deadline = time.monotonic() + 60
+        while _status(f"http://127.0.0.1:{port}/_stcore/health") != 200:
+            if proc.poll() is not None or time.monotonic() > deadline:
+                raise RuntimeError("streamlit サーバーの起動に失敗しました")
+            time.sleep(0.2)
+        # /ready はウォームアップ中だけ 503（/ready の無い dashboard.py ではすぐ抜ける）
+        deadline = time.monotonic() + WARMUP_TIMEOUT
+        while _status(f"http://127.0.0.1:{port}/ready") == 503:
+            if proc.poll() is not None or time.monotonic() > deadline:
+                raise RuntimeError("streamlit サーバーのウォームアップが終わりませんでした")
+            time.sleep(0.2)
+        yield port, proc
+    finally:
+        proc.terminate()
+        try:
+            proc.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+
+
+class ThrottledProxy:
+    """帯域（kbps）と片道遅延（ms）を模擬するローカルTCPプロキシ。
+
+    方向ごとに「回線が空く時刻」を管理し、チャンクごとに
+    送出時間（バイト数 / 帯域）と遅延を加えた時刻に転送する。
+    """
+
+    def __init__(self, upstream_port: int, kbps: float, latency_ms: float) -> None:
+        self.upstream_port = upstream_port
+        self.bytes_per_sec = kbps * 1000 / 8
+        self.latency = latency_ms / 1000
+        self.port = 0
+        self._server: asyncio.AbstractServer | None = None
+
+    async def start(self) -> int:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self.port
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def _handle(self, client_reader, client_writer) -> None:
+        up_reader, up_writer = await asyncio.open_connection("127.0.0.1", self.upstream_port)
+        await asyncio.gather(
+            self._pipe(client_reader, up_writer),
+            self._pipe(up_reader, client_writer),
+            return_exceptions=True,
+        )
+
+    async def _pipe(self, reader, writer) -> None:
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+
+        async def deliver() -> None:
+            while (item := await queue.get()) is not None:
+                due, data = item
+                delay = due - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                writer.write(data)
+                await writer.drain()
+            writer.close()
+
+        sender = asyncio.create_task(deliver())
+        free_at = loop.time()
+        try:
+            while data := await reader.read(16384):
+                free_at = max(loop.time(), free_at) + len(data) / self.bytes_per_sec
+                queue.put_nowait((free_at + self.latency, data))
+        finally:
+            queue.put_nowait(None)
+            await sender
+
+
+class StreamlitClient:
+    """1セッション分のヘッドレスクライアント。"""
+
+    def __init__(self, port: int) -> None:
+        self.url = f"ws://127.0.0.1:{port}/_stcore/stream"
+        self.pages: dict[str, str] = {}  # url_pathname -> page_script_hash
+        self.sliders: dict = {}  # 直前の実行で描画されたスライダー（widget id -> Slider proto）
+        self._ws = None
+
+    async def __aenter__(self) -> "StreamlitClient":
+        import websockets
+
+        self._ws = await websockets.connect(
+            self.url,
+            subprotocols=["streamlit"],
+            max_size=None,
+            origin=self.url.replace("ws://", "http://").split("/_stcore")[0],
+        )
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self._ws.close()
+
+    async def run_page(self, url_pathname: str = "", query_string: str = "", widget_states=()) -> RunStats:
+        """ページを（再）実行し、script_finished までのメッセージを集計する。
+
+        widget_states（WidgetState proto の並び）を渡すと、ウィジェットを操作したときの再実行になる。
+        """
+        from streamlit.proto.BackMsg_pb2 import BackMsg
+        from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+        back = BackMsg()
+        back.rerun_script.query_string = query_string
+        back.rerun_script.page_script_hash = self.pages.get(url_pathname, "")
+        back.rerun_script.widget_states.widgets.extend(widget_states)
+        self.sliders = {}
+        exceptions: list[str] = []
+
+        started = time.perf_counter()
+        await self._ws.send(back.SerializeToString())
+        messages = size = 0
+        while True:
+            raw = await self._ws.recv()
+            msg = ForwardMsg()
+            msg.ParseFromString(raw)
+            messages += 1
+            size += len(raw)
+            kind = msg.WhichOneof("type")
+            element = msg.delta.new_element.WhichOneof("type") if kind == "delta" else None
+            if element == "slider":
+                slider = msg.delta.new_element.slider
+                self.sliders[slider.id] = slider
+            elif element == "exception" and not msg.delta.new_element.exception.is_warning:
+                exceptions.append(msg.delta.new_element.exception.type)
+            elif kind == "navigation":
+                self.pages = {
+                    p.url_pathname: p.page_script_hash for p in msg.navigation.app_pages
+                }
+            elif kind == "script_finished":
+                return RunStats(messages, size, time.perf_counter() - started, exceptions)
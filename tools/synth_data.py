@@ -0,0 +1,185 @@
+"""
+合成データの生成（規模を変えたデータストア）
+
+現在のデータストアと同じ表・列・型で、行数を指定した合成データを作り、
+データストアのバージョンと同じ形（Arrow IPC + manifest.json）のディレクトリに書き出す。
+乱数の種を固定するので、同じ引数なら同じデータになる。
+
+    survey_responses        … rows 人。評価・在住の分布は現在の回答から取る
+    workshop_teams          … rows 行（1班あたり約4語）。語彙は Zipf 分布で、規模とともに増える
+    workshop_keywords       … workshop_teams から数えた上位 10 語
+    population_actual ほか  … 年次の表は rows 年分（最終年は現在のデータと同じ）
+    tourism_daily           … rows 日分
+    business_registrations  … rows か月分（日付が表せる 3,600 か月まで）
+    年齢別人口・率・価値カテゴリ・推計の増減率 … 現在のデータをそのまま使う
+あわせて、ディレクトリ内の workshop/ に rows 行の合成議事録を書く。
+
+書き出したディレクトリは環境変数 SESERAGISM_DATA_DIR（議事録は SESERAGISM_WORKSHOP_DIR）
+で指定すると、ダッシュボードやほかの計測スクリプトからそのまま読める。
+
+使い方:
+    python tools/synth_data.py --rows 100 10000 1000000 --out /tmp/seseragism-synth
+    SESERAGISM_DATA_DIR=/tmp/seseragism-synth/10000 streamlit run app.py
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from build_data_store import manifest_entry, write_manifest, write_table  # noqa: E402
+from seseragism import keywords, store  # noqa: E402
+
+DEFAULT_SEED = 80
+KEYWORDS_PER_TEAM = 4
+MAX_MONTHS = 3600
+# 基準のデータから引き継ぐ（規模を変えない）表
+FIXED_TABLES = ("population_decline_rates", "population_by_age", "cohort_rates", "workshop_values")
+
+
+def _years(rows: int, last: int):
+    import numpy as np
+
+    return np.arange(last - rows + 1, last + 1, dtype=np.int64)
+
+
+def _walk(rng, rows: int, last: float, step_sd: float, low: float):
+    """最終値が last になるランダムウォーク（low 未満にならないよう切り上げる）。"""
+    import numpy as np
+
+    steps = rng.normal(0.0, step_sd, rows)
+    path = last - (steps.sum() - np.cumsum(steps))
+    return np.maximum(np.rint(path), low).astype(np.int64)
+
+
+def _schema(name: str):
+    """データストアの表の定義どおりの Arrow スキーマ。"""
+    import pyarrow as pa
+
+    return pa.schema([(column, pa.type_for_alias(alias)) for column, alias in store.TABLES[name].items()])
+
+
+def generate(rows: int, seed: int = DEFAULT_SEED) -> dict:
+    """表名 → Arrow Table の辞書を作る。"""
+    import numpy as np
+    import pyarrow as pa
+
+    rng = np.random.default_rng(seed)
+    base = {name: store.read_frame(name) for name in store.TABLES if store.has_table(name)}
+    # 文字列の列は pandas 3 では large_string になるので、表の定義の型に揃える
+    tables = {
+        name: pa.Table.from_pandas(base[name], schema=_schema(name), preserve_index=False)
+        for name in FIXED_TABLES
+    }
+
+    # アンケート: 評価の分布と在住率・在住年数は現在の回答から取る（評価は 3% を未回答に）
+    answers = base["survey_responses"]
+    scores = answers["評価"].dropna().to_numpy()
+    resident_share = answers["三島市在住"].mean()
+    years_pool = answers["在住年数"].dropna().to_numpy()
+    resident = rng.random(rows) < resident_share
+    tables["survey_responses"] = pa.table({
+        "回答ID": np.arange(1, rows + 1, dtype=np.int64),
+        "評価": pa.array(rng.choice(scores, rows).astype(np.int64), mask=rng.random(rows) < 0.03),
+        "三島市在住": resident,
+        "在住年数": pa.array(
+            np.clip(rng.choice(years_pool, rows) + rng.normal(0, 3, rows), 0, 90).round(),
+            mask=~resident,
+        ),
+    })
+
+    # ワークショップ: 現在の語彙に合成語を足し、Zipf 分布で各班に割り当てる
+    known = list(dict.fromkeys(base["workshop_teams"]["キーワード"]))
+    vocabulary = known + [f"合成語{i}" for i in range(max(0, int(rows ** 0.5) - len(known)))]
+    ranks = np.minimum(rng.zipf(1.3, rows), len(vocabulary)) - 1
+    teams = np.arange(rows) // KEYWORDS_PER_TEAM + 1
+    words = np.asarray(vocabulary, dtype=object)[ranks]
+    tables["workshop_teams"] = pa.table({
+        "班": pa.array([f"第{t}班" for t in teams], pa.string()),
+        "キーワード": pa.array(words, pa.string()),
+    })
+    top, counts = np.unique(words, return_counts=True)
+    order = np.argsort(-counts, kind="stable")[:10]
+    tables["workshop_keywords"] = pa.table({
+        "キーワード": pa.array(top[order], pa.string()),
+        "出現回数": counts[order].astype(np.int64),
+    })
+
+    # 統計: 年次の表は rows 年分、日別・月別の系列は rows 日・か月分
+    population = base["population_actual"]
+    tourism = base["tourism"]
+    businesses = base["businesses"]
+    tables["population_actual"] = pa.table({
+        "年": _years(rows, int(population["年"].iloc[-1])),
+        "人口": _walk(rng, rows, population["人口"].iloc[-1], 500, 1),
+    })
+    tables["tourism"] = pa.table({
+        "年": _years(rows, int(tourism["年"].iloc[-1])),
+        "観光客数（千人）": _walk(rng, rows, tourism["観光客数（千人）"].iloc[-1], 150, 0),
+    })
+    tables["businesses"] = pa.table({
+        "年": _years(rows, int(businesses["年"].iloc[-1])),
+        "事業所数": _walk(rng, rows, businesses["事業所数"].iloc[-1], 40, 1),
+    })
+    days = np.arange(rows)
+    tables["tourism_daily"] = pa.table({
+        "日付": pa.array(np.datetime64("1900-01-01") + days, pa.date32()),
+        "観光客数": np.maximum(
+            8000 + 3000 * np.sin(days * 2 * np.pi / 365.25) + rng.normal(0, 800, rows), 0
+        ).astype(np.int64),
+    })
+    months = min(rows, MAX_MONTHS)
+    tables["business_registrations"] = pa.table({
+        "年月": pa.array((np.datetime64("1800-01", "M") + np.arange(months)).astype("datetime64[D]"), pa.date32()),
+        "登録数": rng.poisson(30, months).astype(np.int64),
+    })
+    return tables
+
+
+def transcript_lines(rows: int, seed: int = DEFAULT_SEED) -> list[str]:
+    """合成議事録の行（辞書語の表記ゆれを定型句でつないだ文）。"""
+    import numpy as np
+
+    rng = np.random.default_rng(seed + 1)
+    forms = [form for variants in keywords.KEYWORD_VARIANTS.values() for form in variants]
+    fillers = ["について話しました", "が大切だと思う", "をもっと生かしたい", "の良さを伝える", "、そして"]
+    picks = rng.integers(0, len(forms), (rows, 3))
+    glue = rng.integers(0, len(fillers), (rows, 3))
+    return [
+        "".join(forms[p] + fillers[g] for p, g in zip(pick, joint)) + "。"
+        for pick, joint in zip(picks, glue)
+    ]
+
+
+def write(out_dir: Path, rows: int, seed: int = DEFAULT_SEED) -> Path:
+    """合成データのディレクトリ（データストアの1バージョンと同じ形）を書き出す。"""
+    out_dir.mkdir(parents=True, exist_ok=True)
+    entries = {}
+    for name, table in generate(rows, seed).items():
+        out_path = out_dir / f"{name}.arrow"
+        count = write_table(table.select(list(store.TABLES[name])), out_path)
+        entries[name] = manifest_entry(name, out_path, count, f"synthetic rows={rows} seed={seed}")
+    write_manifest(out_dir, f"synthetic-{rows}", {name: entries[name] for name in store.TABLES})
+    workshop = out_dir / "workshop"
+    workshop.mkdir(exist_ok=True)
+    (workshop / "synthetic.txt").write_text("\n".join(transcript_lines(rows, seed)) + "\n", encoding="utf-8")
+    return out_dir
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[100, 10_000, 1_000_000], help="行数（複数可）")
+    parser.add_argument("--out", type=Path, required=True, help="出力先（行数ごとのディレクトリを作る）")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="乱数の種")
+    args = parser.parse_args()
+
+    for rows in args.rows:
+        out_dir = write(args.out / str(rows), rows, args.seed)
+        print(f"wrote {out_dir}")
+
+
+if __name__ == "__main__":
+    main()